@@ -0,0 +1,88 @@
+"""
+Measure the per-request cost of resolving the settings, JWT manager, email sender, S3 client
+and payment service dependencies.
+
+``per-request`` rebuilds every object the way the dependency functions did before the service
+container (settings re-read from the environment, a new Jinja environment and aioboto3 session);
+``container`` resolves them through ``config.dependencies`` from the worker's service container.
+
+Usage (from ``src``)::
+
+    ENVIRONMENT=testing python -m benchmarks.dependency_overhead
+    ENVIRONMENT=testing python -m benchmarks.dependency_overhead --iterations 5000
+"""
+import argparse
+import time
+
+from config.container import load_settings
+from config.dependencies import (
+    get_settings,
+    get_jwt_auth_manager,
+    get_accounts_email_notificator,
+    get_s3_storage_client,
+    get_payment_service,
+)
+from notifications import EmailSender
+from security.token_manager import JWTAuthManager
+from services.payment_service import PaymentService
+from storages import S3StorageClient
+
+
+def resolve_per_request() -> None:
+    settings = load_settings()
+    JWTAuthManager(
+        secret_key_access=settings.SECRET_KEY_ACCESS,
+        secret_key_refresh=settings.SECRET_KEY_REFRESH,
+        algorithm=settings.JWT_SIGNING_ALGORITHM,
+    )
+    EmailSender(
+        hostname=settings.EMAIL_HOST,
+        port=settings.EMAIL_PORT,
+        email=settings.EMAIL_HOST_USER,
+        password=settings.EMAIL_HOST_PASSWORD,
+        use_tls=settings.EMAIL_USE_TLS,
+        template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
+        activation_email_template_name=settings.ACTIVATION_EMAIL_TEMPLATE_NAME,
+        activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+        password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
+        password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
+        payment_confirmation_template_name=settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME,
+    )
+    S3StorageClient(
+        endpoint_url=settings.S3_STORAGE_ENDPOINT,
+        access_key=settings.S3_STORAGE_ACCESS_KEY,
+        secret_key=settings.S3_STORAGE_SECRET_KEY,
+        bucket_name=settings.S3_BUCKET_NAME,
+    )
+    PaymentService(settings=settings)
+
+
+def resolve_from_container() -> None:
+    settings = get_settings()
+    get_jwt_auth_manager(settings)
+    get_accounts_email_notificator(settings)
+    get_s3_storage_client(settings)
+    get_payment_service(settings)
+
+
+def measure(resolve, iterations: int) -> float:
+    resolve()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        resolve()
+    return (time.perf_counter() - started) / iterations
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f"{'resolution':<14}{'us/request':>12}")
+    results = {}
+    for name, resolve in (("per-request", resolve_per_request), ("container", resolve_from_container)):
+        results[name] = measure(resolve, args.iterations)
+        print(f"{name:<14}{results[name] * 1_000_000:>12.2f}")
+    print(f"Speed-up: {results['per-request'] / results['container']:.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=1000)
+    main(parser.parse_args())
@@ -0,0 +1,66 @@
+"""
+Measure the cost of rendering an email with a new Jinja environment per email and with
+``EmailTemplateRegistry``.
+
+A new environment loads, parses and compiles the template for every email, as the senders
+did before the registry; the registry compiles every template once per worker.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.email_rendering
+    python -m benchmarks.email_rendering --emails 5000
+"""
+import argparse
+import time
+
+from jinja2 import Environment, FileSystemLoader
+
+from config import get_settings
+from notifications import EmailTemplateRegistry
+
+CONTEXT = {
+    "email": "user@example.com",
+    "order_id": 42,
+    "amount": "9.99",
+    "transaction_id": "pi_1042",
+    "date": "2026-01-01 12:00",
+}
+
+
+def render_uncached(template_dir: str, template_name: str) -> str:
+    env = Environment(loader=FileSystemLoader(template_dir))
+    return env.get_template(template_name).render(**CONTEXT)
+
+
+def measure(render, emails: int) -> float:
+    started = time.perf_counter()
+    for _ in range(emails):
+        render()
+    return (time.perf_counter() - started) / emails * 1_000_000
+
+
+def main(args: argparse.Namespace) -> None:
+    settings = get_settings()
+    template_dir = settings.PATH_TO_EMAIL_TEMPLATES_DIR
+    template_name = settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME
+
+    started = time.perf_counter()
+    registry = EmailTemplateRegistry(template_dir)
+    startup = (time.perf_counter() - started) * 1000
+
+    results = {
+        "per-email": measure(lambda: render_uncached(template_dir, template_name), args.emails),
+        "registry": measure(lambda: registry.render(template_name, **CONTEXT), args.emails),
+    }
+
+    print(f"Registry start-up (all templates): {startup:.1f} ms")
+    print(f"{'environment':<14}{'us/email':>12}")
+    for name, cost in results.items():
+        print(f"{name:<14}{cost:>12.1f}")
+    print(f"Speed-up: {results['per-email'] / results['registry']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=2000)
+    main(parser.parse_args())
@@ -0,0 +1,103 @@
+"""
+Measure the email throughput of a Celery worker process with a new event loop and sender per
+task and with the shared ``AsyncWorkerRuntime``.
+
+Each "task" is the body a Celery email task runs. Before the runtime a task called
+``asyncio.run`` and built its own ``EmailSender``, paying for a loop, the compiled templates and
+an SMTP handshake per email; with the runtime it runs on the worker's loop with the shared sender
+and its pooled sessions. A local aiosmtpd server accepting any login stands in for the SMTP
+server (``pip install aiosmtpd``).
+
+Usage (from ``src``)::
+
+    python -m benchmarks.email_tasks
+    python -m benchmarks.email_tasks --tasks 1000
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from config import get_settings
+from notifications import EmailSender
+from tasks.runtime import AsyncWorkerRuntime
+
+
+class SinkHandler:
+    async def handle_DATA(self, server, session, envelope) -> str:
+        return "250 Message accepted for delivery"
+
+
+def create_sender(port: int) -> EmailSender:
+    settings = get_settings()
+    return EmailSender(
+        hostname="127.0.0.1",
+        port=port,
+        email="noreply@example.com",
+        password="secret",
+        use_tls=False,
+        template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
+        activation_email_template_name=settings.ACTIVATION_EMAIL_TEMPLATE_NAME,
+        activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+        password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
+        password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
+        payment_confirmation_template_name=settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME,
+    )
+
+
+def measure(task, tasks: int) -> float:
+    started = time.perf_counter()
+    for index in range(tasks):
+        task(f"user{index}@example.com")
+    return tasks / (time.perf_counter() - started)
+
+
+def main(args: argparse.Namespace) -> None:
+    # aiosmtpd logs a deprecation warning for every login.
+    logging.getLogger("mail.log").setLevel(logging.ERROR)
+    controller = Controller(
+        SinkHandler(),
+        hostname="127.0.0.1",
+        port=args.port,
+        auth_require_tls=False,
+        authenticator=lambda *_: AuthResult(success=True),
+    )
+    controller.start()
+    runtime = AsyncWorkerRuntime()
+    try:
+        def task_per_loop(email: str) -> None:
+            async def send() -> None:
+                sender = create_sender(args.port)
+                await sender.send_activation_email(email, "http://localhost/activate")
+                await sender.close()
+
+            asyncio.run(send())
+
+        shared_sender = create_sender(args.port)
+
+        def task_on_runtime(email: str) -> None:
+            runtime.run(shared_sender.send_activation_email(email, "http://localhost/activate"))
+
+        results = {
+            "loop per task": measure(task_per_loop, args.tasks),
+            "runtime": measure(task_on_runtime, args.tasks),
+        }
+        runtime.run(shared_sender.close())
+    finally:
+        runtime.stop()
+        controller.stop()
+
+    print(f"{'worker':<16}{'tasks/s':>10}")
+    for name, rate in results.items():
+        print(f"{name:<16}{rate:>10.0f}")
+    print(f"Speed-up: {results['runtime'] / results['loop per task']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--port", type=int, default=8025)
+    main(parser.parse_args())
@@ -0,0 +1,73 @@
+"""
+Measure the CPU cost of a login (one password verification) for each hashing cost setting.
+
+Usage (from ``src``)::
+
+    ENVIRONMENT=testing python -m benchmarks.password_hashing
+    ENVIRONMENT=testing python -m benchmarks.password_hashing --bcrypt-rounds 10 12 14 \\
+        --argon2 2:19456:1 3:65536:4
+
+Every verification runs on a single thread, so ``logins/s/core`` is the throughput one core
+can sustain for the login endpoint at that setting. argon2 settings are given as
+``time_cost:memory_cost_kib:parallelism`` and are skipped unless ``argon2-cffi`` is installed.
+"""
+import argparse
+import statistics
+import time
+
+from passlib.exc import MissingBackendError
+
+from security.passwords import configure_password_context, hash_password, verify_password
+
+PASSWORD = "BenchmarkPassword123!"
+
+
+def measure(iterations: int) -> dict:
+    hashed = hash_password(PASSWORD)
+    timings = []
+    for _ in range(iterations):
+        started = time.process_time()
+        verify_password(PASSWORD, hashed)
+        timings.append(time.process_time() - started)
+
+    median = statistics.median(timings)
+    return {
+        "median_ms": median * 1000,
+        "logins_per_core": 1 / median if median else float("inf"),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    settings = [
+        (f"bcrypt rounds={rounds}", {"scheme": "bcrypt", "bcrypt_rounds": rounds})
+        for rounds in args.bcrypt_rounds
+    ]
+    for argon2 in args.argon2:
+        time_cost, memory_cost, parallelism = (int(value) for value in argon2.split(":"))
+        settings.append((
+            f"argon2id t={time_cost} m={memory_cost} p={parallelism}",
+            {
+                "scheme": "argon2",
+                "argon2_time_cost": time_cost,
+                "argon2_memory_cost": memory_cost,
+                "argon2_parallelism": parallelism,
+            },
+        ))
+
+    print(f"{'setting':<36}{'median ms':>12}{'logins/s/core':>16}")
+    for name, policy in settings:
+        configure_password_context(**policy)
+        try:
+            result = measure(args.iterations)
+        except MissingBackendError:
+            print(f"{name:<36}{'skipped: argon2-cffi is not installed':>28}")
+            continue
+        print(f"{name:<36}{result['median_ms']:>12.2f}{result['logins_per_core']:>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bcrypt-rounds", type=int, nargs="*", default=[10, 11, 12, 13, 14])
+    parser.add_argument("--argon2", nargs="*", default=["2:19456:1", "3:65536:4"])
+    parser.add_argument("--iterations", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,97 @@
+"""
+Measure S3 upload throughput with a new client per upload and with the long-lived client of
+``S3StorageClient``.
+
+A new client sets up botocore, a new HTTP connection pool and, against HTTPS storage, a TLS
+handshake for every upload. By default a local aiohttp server accepting ``PutObject`` requests
+stands in for the storage; pass ``--endpoint`` with credentials and an existing bucket to measure
+against MinIO instead.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.s3_uploads
+    python -m benchmarks.s3_uploads --uploads 1000 --concurrency 8
+    python -m benchmarks.s3_uploads --endpoint http://localhost:9000 --access-key minioadmin \\
+        --secret-key some_password --bucket theater-storage
+"""
+import argparse
+import asyncio
+import time
+
+import aioboto3
+from aiohttp import web
+
+from storages import S3StorageClient
+
+PAYLOAD = b"\xff\xd8" + b"0" * 16 * 1024
+
+
+async def put_object(request: web.Request) -> web.Response:
+    await request.read()
+    return web.Response(headers={"ETag": '"sink"'})
+
+
+async def start_sink(port: int) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_put("/{bucket}/{key:.+}", put_object)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+async def run(upload, uploads: int, concurrency: int) -> float:
+    queue = iter(range(uploads))
+
+    async def worker() -> None:
+        for index in queue:
+            await upload(f"benchmark/{index}.jpg")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return uploads / (time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> None:
+    runner = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        runner = await start_sink(args.port)
+        endpoint = f"http://127.0.0.1:{args.port}"
+
+    session = aioboto3.Session(aws_access_key_id=args.access_key, aws_secret_access_key=args.secret_key)
+
+    async def upload_per_client(key: str) -> None:
+        async with session.client("s3", endpoint_url=endpoint) as client:
+            await client.put_object(Bucket=args.bucket, Key=key, Body=PAYLOAD, ContentType="image/jpeg")
+
+    storage = S3StorageClient(
+        endpoint, args.access_key, args.secret_key, args.bucket, max_pool_connections=args.concurrency
+    )
+    try:
+        await storage.connect()
+        results = {
+            "per-upload": await run(upload_per_client, args.uploads, args.concurrency),
+            "long-lived": await run(lambda key: storage.upload_file(key, PAYLOAD), args.uploads, args.concurrency),
+        }
+    finally:
+        await storage.close()
+        if runner is not None:
+            await runner.cleanup()
+
+    print(f"{'client':<14}{'uploads/s':>12}")
+    for name, rate in results.items():
+        print(f"{name:<14}{rate:>12.0f}")
+    print(f"Speed-up: {results['long-lived'] / results['per-upload']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uploads", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8026)
+    parser.add_argument("--endpoint")
+    parser.add_argument("--access-key", default="access")
+    parser.add_argument("--secret-key", default="secret")
+    parser.add_argument("--bucket", default="theater-storage")
+    asyncio.run(main(parser.parse_args()))
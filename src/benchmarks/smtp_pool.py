@@ -0,0 +1,89 @@
+"""
+Measure email throughput with a new SMTP session per message and with ``SMTPConnectionPool``.
+
+A local aiosmtpd server accepting any login stands in for the SMTP server (``pip install
+aiosmtpd``). Over loopback the gain is the cost of connecting, EHLO and AUTH; against a real
+server the saved STARTTLS handshakes and round trips weigh much more.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.smtp_pool
+    python -m benchmarks.smtp_pool --messages 2000 --concurrency 8
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from notifications.smtp_pool import SMTPConnectionPool
+
+SENDER = "noreply@example.com"
+MESSAGE = f"From: {SENDER}\r\nTo: user@example.com\r\nSubject: Benchmark\r\n\r\nHello\r\n"
+
+
+class SinkHandler:
+    async def handle_DATA(self, server, session, envelope) -> str:
+        return "250 Message accepted for delivery"
+
+
+async def send_unpooled(hostname: str, port: int) -> None:
+    smtp = aiosmtplib.SMTP(hostname=hostname, port=port, username=SENDER, password="secret", start_tls=False)
+    await smtp.connect()
+    await smtp.sendmail(SENDER, ["user@example.com"], MESSAGE)
+    await smtp.quit()
+
+
+async def run(send, messages: int, concurrency: int) -> float:
+    queue = iter(range(messages))
+
+    async def worker() -> None:
+        for _ in queue:
+            await send()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return messages / (time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> None:
+    # aiosmtpd logs a deprecation warning for every login.
+    logging.getLogger("mail.log").setLevel(logging.ERROR)
+    controller = Controller(
+        SinkHandler(),
+        hostname="127.0.0.1",
+        port=args.port,
+        auth_require_tls=False,
+        authenticator=lambda *_: AuthResult(success=True),
+    )
+    controller.start()
+    try:
+        pool = SMTPConnectionPool("127.0.0.1", args.port, SENDER, "secret", use_tls=False, max_size=args.concurrency)
+
+        async def send_pooled() -> None:
+            async with pool.connection() as smtp:
+                await smtp.sendmail(SENDER, ["user@example.com"], MESSAGE)
+
+        results = {
+            "per-message": await run(lambda: send_unpooled("127.0.0.1", args.port), args.messages, args.concurrency),
+            "pooled": await run(send_pooled, args.messages, args.concurrency),
+        }
+        await pool.close()
+    finally:
+        controller.stop()
+
+    print(f"{'session':<14}{'messages/s':>12}")
+    for name, rate in results.items():
+        print(f"{name:<14}{rate:>12.0f}")
+    print(f"Speed-up: {results['pooled'] / results['per-message']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8025)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,5 @@
+from caches.interfaces import CacheBackendInterface
+from caches.memory import LRUCache, InMemoryCacheBackend, clear_all_caches
+from caches.redis_cache import RedisCacheBackend
+from caches.response import ResponseCache
+from caches.principals import UserPrincipal, UserPrincipalCache
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheBackendInterface(ABC):
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the value stored under a key.
+
+        :param key: The cache key.
+        :return: The stored bytes, or None if the key is missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Store a value under a key.
+
+        :param key: The cache key.
+        :param value: The bytes to store.
+        :param ttl: Seconds until the entry expires; None keeps it until evicted.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Remove a key if it is present.
+
+        :param key: The cache key.
+        """
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """
+        Atomically increment an integer counter, starting from 0.
+
+        :param key: The counter key.
+        :return: The counter value after the increment.
+        """
+        pass
+
+    @abstractmethod
+    async def get_counter(self, key: str) -> int:
+        """
+        Return the current value of a counter maintained with :meth:`incr`.
+
+        :param key: The counter key.
+        :return: The counter value, 0 if it was never incremented.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release connections held by the backend; a no-op for backends without any.
+        """
+        pass
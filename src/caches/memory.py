@@ -0,0 +1,117 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from caches.interfaces import CacheBackendInterface
+
+_MISSING = object()
+
+_registry: "weakref.WeakSet[LRUCache]" = weakref.WeakSet()
+
+
+class LRUCache:
+    """
+    A bounded, thread-safe in-process cache with least-recently-used eviction and optional TTL.
+
+    Entries expire ``ttl`` seconds after they were stored (``None`` keeps them until evicted);
+    ``set`` accepts a per-entry ``ttl`` override. Every instance is tracked so that
+    :func:`clear_all_caches` can drop all in-process state at once, e.g. between tests.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer.")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        _registry.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for ``key`` or ``default`` if it is missing or expired.
+        """
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store ``value`` under ``key``, evicting the least recently used entry when full.
+        """
+        ttl = self._ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove ``key`` from the cache if present.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def clear_all_caches() -> None:
+    """
+    Clear every live :class:`LRUCache` instance in the process.
+    """
+    for cache in list(_registry):
+        cache.clear()
+
+
+class InMemoryCacheBackend(CacheBackendInterface):
+    """
+    Cache backend storing values in a process-local :class:`LRUCache`.
+
+    Counters live in a separate cache so that value evictions never reset them.
+    """
+
+    def __init__(self, max_entries: int = 10_000, max_counters: int = 1024):
+        self._values = LRUCache(max_size=max_entries)
+        self._counters = LRUCache(max_size=max_counters)
+        self._counter_lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._values.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._values.delete(key)
+
+    async def incr(self, key: str) -> int:
+        with self._counter_lock:
+            value = self._counters.get(key, 0) + 1
+            self._counters.set(key, value)
+        return value
+
+    async def get_counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
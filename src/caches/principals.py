@@ -0,0 +1,92 @@
+import json
+from dataclasses import dataclass, fields
+from typing import Any, Optional
+
+from caches.interfaces import CacheBackendInterface
+from caches.memory import LRUCache
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """
+    The identity of an authenticated user, as resolved by ``get_current_user``.
+
+    Only these attributes are available to routes; a route needing more of the user must
+    load the ``UserModel`` itself.
+    """
+
+    id: int
+    email: str
+    is_active: bool
+    group_id: int
+
+
+class UserPrincipalCache:
+    """
+    Cache the identity of authenticated users by id, so authenticated requests can skip
+    the user lookup.
+
+    A principal is a small dict of the ``UserPrincipal`` column values (see ``PRINCIPAL_FIELDS``);
+    secrets such as the password hash are never cached. Lookups hit a per-worker LRU cache first and then the
+    optional shared ``backend``. Invalidation removes the entry from both tiers, but copies held
+    by other workers' LRU caches live on until their TTL expires, so keep ``ttl`` short.
+    """
+
+    PRINCIPAL_FIELDS = tuple(field.name for field in fields(UserPrincipal))
+
+    def __init__(self, ttl: float, max_entries: int = 10_000, backend: Optional[CacheBackendInterface] = None):
+        self._local = LRUCache(max_size=max_entries, ttl=ttl)
+        self._backend = backend
+        self._ttl = ttl
+
+    async def get(self, user_id: int) -> Optional[dict[str, Any]]:
+        """
+        Return the cached principal of a user.
+
+        Args:
+            user_id (int): The user id.
+
+        Returns:
+            Optional[dict[str, Any]]: The principal, or None on a miss.
+        """
+        principal = self._local.get(user_id)
+        if principal is None and self._backend is not None:
+            raw = await self._backend.get(self._key(user_id))
+            if raw is not None:
+                principal = json.loads(raw)
+                self._local.set(user_id, principal)
+        return principal
+
+    async def set(self, user_id: int, principal: dict[str, Any]) -> None:
+        """
+        Store the principal of a user in both tiers.
+
+        Args:
+            user_id (int): The user id.
+            principal (dict[str, Any]): Values for ``PRINCIPAL_FIELDS``.
+        """
+        self._local.set(user_id, principal)
+        if self._backend is not None:
+            await self._backend.set(self._key(user_id), json.dumps(principal).encode(), ttl=self._ttl)
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Drop the cached principal of a user, e.g. after activation, a password change or logout.
+
+        Args:
+            user_id (int): The user id.
+        """
+        self._local.delete(user_id)
+        if self._backend is not None:
+            await self._backend.delete(self._key(user_id))
+
+    async def close(self) -> None:
+        """
+        Release the connections of the shared backend, if any.
+        """
+        if self._backend is not None:
+            await self._backend.close()
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"principal:{user_id}"
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from redis import asyncio as redis_asyncio
+
+from caches.interfaces import CacheBackendInterface
+
+
+class RedisCacheBackend(CacheBackendInterface):
+    """
+    Cache backend shared by all workers through Redis.
+
+    Every key is prefixed so several applications can share one Redis database.
+    """
+
+    def __init__(self, url: str, prefix: str = "theater:"):
+        self._client = redis_asyncio.Redis.from_url(url)
+        self._prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._key(key))
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        await self._client.set(self._key(key), value, px=int(ttl * 1000) if ttl is not None else None)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._key(key))
+
+    async def incr(self, key: str) -> int:
+        return await self._client.incr(self._key(key))
+
+    async def get_counter(self, key: str) -> int:
+        value = await self._client.get(self._key(key))
+        return int(value) if value is not None else 0
+
+    async def close(self) -> None:
+        await self._client.aclose()
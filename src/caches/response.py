@@ -0,0 +1,110 @@
+import hashlib
+import logging
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from caches.interfaces import CacheBackendInterface
+
+logger = logging.getLogger(__name__)
+
+_ETAG_SEPARATOR = b"\n"
+
+
+class ResponseCache:
+    """
+    Cache serialized JSON responses per namespace, with ETag support.
+
+    Entries are keyed on the request path and its sorted query string and stored
+    together with a strong ETag derived from the body. Invalidation is O(1): every
+    namespace has a generation counter that is part of the key, so bumping it makes all
+    earlier entries unreachable and they simply expire.
+    """
+
+    def __init__(self, backend: CacheBackendInterface, ttl: float):
+        self._backend = backend
+        self._ttl = ttl
+
+    async def respond(
+            self,
+            request: Request,
+            namespace: str,
+            build: Callable[[], Awaitable[BaseModel]],
+    ) -> Response:
+        """
+        Serve a JSON response from the cache, building and storing it on a miss.
+
+        A ``304 Not Modified`` is returned when ``If-None-Match`` matches the ETag.
+        Exceptions raised by ``build`` (e.g. 404s) propagate and are not cached. If the cache
+        backend is unavailable, the response is built and served without caching.
+
+        Args:
+            request (Request): The incoming request.
+            namespace (str): The namespace to cache under, e.g. ``"movies"``.
+            build (Callable[[], Awaitable[BaseModel]]): Produces the response payload on a miss.
+
+        Returns:
+            Response: The JSON response or a 304 response.
+        """
+        try:
+            key = await self._key(namespace, request)
+            cached = await self._backend.get(key)
+        except (RedisError, OSError):
+            logger.warning("Response cache unavailable, serving %s uncached", request.url.path, exc_info=True)
+            key, cached = None, None
+
+        if cached is not None:
+            etag, body = cached.split(_ETAG_SEPARATOR, 1)
+            etag = etag.decode()
+        else:
+            payload = await build()
+            body = payload.model_dump_json().encode()
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            if key is not None:
+                try:
+                    await self._backend.set(key, etag.encode() + _ETAG_SEPARATOR + body, ttl=self._ttl)
+                except (RedisError, OSError):
+                    logger.warning("Response cache unavailable, not caching %s", request.url.path, exc_info=True)
+
+        headers = {"ETag": etag}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    async def invalidate(self, namespace: str) -> None:
+        """
+        Make every cached response of a namespace stale.
+
+        Callers invalidate after committing a write, so an unavailable cache backend is logged
+        instead of failing the request; its entries then stay stale until they expire.
+
+        Args:
+            namespace (str): The namespace to invalidate.
+        """
+        try:
+            await self._backend.incr(f"generation:{namespace}")
+        except (RedisError, OSError):
+            logger.error("Response cache unavailable, could not invalidate %s", namespace, exc_info=True)
+
+    async def close(self) -> None:
+        """
+        Release the connections of the cache backend.
+        """
+        await self._backend.close()
+
+    async def _key(self, namespace: str, request: Request) -> str:
+        generation = await self._backend.get_counter(f"generation:{namespace}")
+        query = urlencode(sorted(request.query_params.multi_items()))
+        return f"response:{namespace}:{generation}:{request.url.path}?{query}"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
@@ -2,9 +2,18 @@ from config.settings import BaseAppSettings
 from config.dependencies import (
     get_settings,
     get_jwt_auth_manager,
+    get_email_template_registry,
     get_accounts_email_notificator,
     get_s3_storage_client,
     get_payment_service,
+    get_movie_count_provider,
+    get_movie_search_backend,
+    get_reference_data_cache,
+    get_response_cache,
+    get_password_service,
+    get_user_principal_cache,
+    get_auth_rate_limiter,
+    get_token_revocation_list,
 )
 from config.order_config import (
     create_order_service,
@@ -1,6 +1,10 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
+from config.container import close_container
 from config.dependencies import get_settings
+from tasks.runtime import worker_runtime
 
 
 settings = get_settings()
@@ -11,8 +15,31 @@ celery_app = Celery(
 celery_app.autodiscover_tasks(packages=["tasks"])
 
 celery_app.conf.beat_schedule = {
-    "cleanup_expired_tokens_every_24_hours": {
-        "task": "src.tasks.cleanup_task.cleanup_expired_tokens",
-        "schedule": crontab(minute=59, hour=23),
-    }
+    "deliver_email_outbox": {
+        "task": "tasks.deliver_email_outbox",
+        "schedule": settings.EMAIL_OUTBOX_POLL_SECONDS,
+    },
+    "cleanup_expired_tokens_every_hour": {
+        "task": "tasks.cleanup_expired_tokens",
+        "schedule": crontab(minute=15),
+    },
 }
+
+
+@worker_process_init.connect
+def start_worker_runtime(**kwargs) -> None:
+    """
+    Start the event loop shared by the tasks of a worker process.
+    """
+    worker_runtime.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_worker_runtime(**kwargs) -> None:
+    """
+    Close the services of a worker process, such as its SMTP sessions, and stop its event loop.
+    """
+    if worker_runtime.is_running:
+        worker_runtime.run(close_container())
+    worker_runtime.stop()
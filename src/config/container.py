@@ -0,0 +1,95 @@
+import inspect
+import logging
+import os
+from typing import Any, Callable, Optional, TypeVar
+
+from config.settings import TestingSettings, Settings, BaseAppSettings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def load_settings() -> BaseAppSettings:
+    """
+    Build the settings for the current ``ENVIRONMENT``.
+
+    Returns:
+        BaseAppSettings: ``TestingSettings`` when ``ENVIRONMENT`` is ``testing``, ``Settings`` otherwise.
+    """
+    environment = os.getenv("ENVIRONMENT", "developing")
+    if environment == "testing":
+        return TestingSettings()
+    return Settings()
+
+
+class ServiceContainer:
+    """
+    Hold the services of one worker process, built once on first use.
+
+    Services are created by the dependency functions in ``config.dependencies`` through
+    :meth:`get_or_create` and shut down by :meth:`close` in reverse order of creation: a
+    service's ``close()`` or ``shutdown()`` method is called, and awaited if it is a coroutine.
+    """
+
+    def __init__(self, settings: BaseAppSettings):
+        self.settings = settings
+        self._services: dict[str, Any] = {}
+
+    def get_or_create(self, name: str, factory: Callable[[], T]) -> T:
+        """
+        Return the service registered under ``name``, creating it with ``factory`` on first use.
+
+        Args:
+            name (str): The service name.
+            factory (Callable[[], T]): Builds the service.
+
+        Returns:
+            T: The shared service instance.
+        """
+        service = self._services.get(name)
+        if service is None:
+            service = self._services[name] = factory()
+        return service
+
+    async def close(self) -> None:
+        """
+        Shut down every created service; failures are logged and do not stop the others.
+        """
+        services, self._services = self._services, {}
+        for name, service in reversed(list(services.items())):
+            close = getattr(service, "close", None) or getattr(service, "shutdown", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.warning("Failed to close service %s", name, exc_info=True)
+
+
+_container: Optional[ServiceContainer] = None
+
+
+def get_container() -> ServiceContainer:
+    """
+    Return the service container of this worker process, creating it on first use.
+
+    Returns:
+        ServiceContainer: The process-wide service container.
+    """
+    global _container
+    if _container is None:
+        _container = ServiceContainer(load_settings())
+    return _container
+
+
+async def close_container() -> None:
+    """
+    Close the process-wide service container; the next :func:`get_container` call starts a new one.
+    """
+    global _container
+    container, _container = _container, None
+    if container is not None:
+        await container.close()
@@ -1,30 +1,38 @@
-import os
+from typing import TYPE_CHECKING
 
 from fastapi import Depends
 
-from config.settings import TestingSettings, Settings, BaseAppSettings
+from config.container import get_container
+from config.settings import Settings, BaseAppSettings
 
-from notifications import EmailSenderInterface, EmailSender
+from notifications import EmailSenderInterface, EmailSender, EmailTemplateRegistry
 from security.interfaces import JWTAuthManagerInterface
 from security.token_manager import JWTAuthManager
 from storages import S3StorageInterface, S3StorageClient
 
+if TYPE_CHECKING:
+    from caches import ResponseCache, UserPrincipalCache
+    from ratelimit import RateLimiterInterface
+    from revocation import TokenRevocationList
+    from search import MovieSearchInterface
+    from security.password_service import PasswordService
+    from services.movie_count import MovieCountProvider
+    from services.payment_service import PaymentService
+    from services.reference_data import ReferenceDataCache
+
 
 def get_settings() -> BaseAppSettings:
     """
     Retrieve the application settings based on the current environment.
 
-    This function reads the 'ENVIRONMENT' environment variable (defaulting to 'developing' if not set)
-    and returns a corresponding settings instance. If the environment is 'testing', it returns an instance
-    of TestingSettings; otherwise, it returns an instance of Settings.
+    The settings are read once per worker process, when the service container is created:
+    if the 'ENVIRONMENT' environment variable is 'testing' they are an instance of TestingSettings,
+    otherwise an instance of Settings.
 
     Returns:
         BaseAppSettings: The settings instance appropriate for the current environment.
     """
-    environment = os.getenv("ENVIRONMENT", "developing")
-    if environment == "testing":
-        return TestingSettings()
-    return Settings()
+    return get_container().settings
 
 
 def get_jwt_auth_manager(settings: BaseAppSettings = Depends(get_settings)) -> JWTAuthManagerInterface:
@@ -33,7 +41,9 @@ def get_jwt_auth_manager(settings: BaseAppSettings = Depends(get_settings)) -> J
 
     This function uses the provided application settings to instantiate a JWTAuthManager, which implements
     the JWTAuthManagerInterface. The manager is configured with secret keys for access and refresh tokens
-    as well as the JWT signing algorithm specified in the settings.
+    as well as the JWT signing algorithm specified in the settings. The manager is created once per process
+    so that its cache of decoded access tokens (``JWT_ACCESS_CACHE_MAX_ENTRIES`` entries) is shared between
+    requests.
 
     Args:
         settings (BaseAppSettings, optional): The application settings instance.
@@ -43,11 +53,32 @@ def get_jwt_auth_manager(settings: BaseAppSettings = Depends(get_settings)) -> J
         JWTAuthManagerInterface: An instance of JWTAuthManager configured with
         the appropriate secret keys and algorithm.
     """
-    return JWTAuthManager(
+    return get_container().get_or_create("jwt_auth_manager", lambda: JWTAuthManager(
         secret_key_access=settings.SECRET_KEY_ACCESS,
         secret_key_refresh=settings.SECRET_KEY_REFRESH,
-        algorithm=settings.JWT_SIGNING_ALGORITHM
-    )
+        algorithm=settings.JWT_SIGNING_ALGORITHM,
+        access_cache_max_entries=settings.JWT_ACCESS_CACHE_MAX_ENTRIES,
+    ))
+
+
+def get_email_template_registry(settings: BaseAppSettings = Depends(get_settings)) -> EmailTemplateRegistry:
+    """
+    Retrieve the compiled email templates shared by the email senders of this worker process.
+
+    Every template in PATH_TO_EMAIL_TEMPLATES_DIR is compiled once, when the registry is created;
+    with EMAIL_TEMPLATES_BYTECODE_CACHE_DIR set, the compiled code is cached on disk as well.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        EmailTemplateRegistry: The process-wide template registry.
+    """
+    return get_container().get_or_create("email_template_registry", lambda: EmailTemplateRegistry(
+        template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
+        bytecode_cache_dir=settings.EMAIL_TEMPLATES_BYTECODE_CACHE_DIR,
+    ))
 
 
 def get_accounts_email_notificator(
@@ -58,7 +89,9 @@ def get_accounts_email_notificator(
 
     This function creates an EmailSender using the provided settings, which include details such as the email host,
     port, credentials, TLS usage, and the directory and filenames for email templates. This allows the application
-    to send various email notifications (e.g., activation, password reset) as required.
+    to send various email notifications (e.g., activation, password reset) as required. The sender and its
+    pool of SMTP sessions (EMAIL_POOL_SIZE, EMAIL_POOL_IDLE_TIMEOUT_SECONDS) are created once per worker process,
+    and it renders from the shared `get_email_template_registry`.
 
     Args:
         settings (BaseAppSettings, optional): The application settings,
@@ -67,7 +100,7 @@ def get_accounts_email_notificator(
     Returns:
         EmailSenderInterface: An instance of EmailSender configured with the appropriate email settings.
     """
-    return EmailSender(
+    return get_container().get_or_create("email_sender", lambda: EmailSender(
         hostname=settings.EMAIL_HOST,
         port=settings.EMAIL_PORT,
         email=settings.EMAIL_HOST_USER,
@@ -78,9 +111,11 @@ def get_accounts_email_notificator(
         activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
         password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
         password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
-        payment_confirmation_template_name=settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME
-
-    )
+        payment_confirmation_template_name=settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME,
+        pool_size=settings.EMAIL_POOL_SIZE,
+        pool_idle_timeout=settings.EMAIL_POOL_IDLE_TIMEOUT_SECONDS,
+        template_registry=get_email_template_registry(settings),
+    ))
 
 
 def get_s3_storage_client(
@@ -91,7 +126,9 @@ def get_s3_storage_client(
 
     This function instantiates an S3StorageClient using the provided settings, which include the S3 endpoint URL,
     access credentials, and the bucket name. The returned client can be used to interact with an S3-compatible
-    storage service for file uploads and URL generation.
+    storage service for file uploads and URL generation. The client is created once per worker process and
+    keeps one botocore client, with a pool of S3_STORAGE_MAX_POOL_CONNECTIONS connections, open until the
+    container is closed.
 
     Args:
         settings (BaseAppSettings, optional): The application settings,
@@ -100,21 +137,252 @@ def get_s3_storage_client(
     Returns:
         S3StorageInterface: An instance of S3StorageClient configured with the appropriate S3 storage settings.
     """
-    return S3StorageClient(
+    return get_container().get_or_create("s3_storage_client", lambda: S3StorageClient(
         endpoint_url=settings.S3_STORAGE_ENDPOINT,
         access_key=settings.S3_STORAGE_ACCESS_KEY,
         secret_key=settings.S3_STORAGE_SECRET_KEY,
-        bucket_name=settings.S3_BUCKET_NAME
-    )
+        bucket_name=settings.S3_BUCKET_NAME,
+        max_pool_connections=settings.S3_STORAGE_MAX_POOL_CONNECTIONS,
+        retry_mode=settings.S3_STORAGE_RETRY_MODE,
+        max_attempts=settings.S3_STORAGE_MAX_ATTEMPTS,
+    ))
 
 
 def get_payment_service(
     settings: Settings = Depends(get_settings),
 ) -> "PaymentService":
     """
-    Dependency factory for PaymentService
+    Dependency factory for PaymentService, shared by the requests of a worker process
     """
     from services.payment_service import PaymentService
-    return PaymentService(
+    return get_container().get_or_create("payment_service", lambda: PaymentService(
         settings=settings,
+    ))
+
+
+def get_movie_count_provider(
+        settings: BaseAppSettings = Depends(get_settings),
+) -> "MovieCountProvider":
+    """
+    Return the process-wide movie count provider.
+
+    The provider owns an in-process TTL cache of catalog totals, so it is created once on
+    first use and shared by every request handled by this worker.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        MovieCountProvider: The shared movie count provider.
+    """
+    from services.movie_count import MovieCountProvider
+
+    return get_container().get_or_create("movie_count_provider", lambda: MovieCountProvider(
+        ttl=settings.MOVIES_COUNT_CACHE_TTL_SECONDS,
+        mode=settings.MOVIES_COUNT_MODE,
+        estimate_min_rows=settings.MOVIES_COUNT_ESTIMATE_MIN_ROWS,
+    ))
+
+
+def get_movie_search_backend(
+        settings: BaseAppSettings = Depends(get_settings),
+) -> "MovieSearchInterface":
+    """
+    Return the process-wide movie search backend.
+
+    ``MOVIE_SEARCH_BACKEND=postgres`` searches the indexed ``search_vector`` column; the SQLite
+    testing configuration has no full-text support, so it uses ``inverted_index``, an in-process
+    inverted index, instead.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        MovieSearchInterface: The shared movie search backend.
+    """
+    from search import InvertedIndexMovieSearch, PostgresMovieSearch
+
+    def create() -> "MovieSearchInterface":
+        if settings.MOVIE_SEARCH_BACKEND == "inverted_index":
+            return InvertedIndexMovieSearch()
+        return PostgresMovieSearch()
+
+    return get_container().get_or_create("movie_search_backend", create)
+
+
+def get_reference_data_cache(
+        settings: BaseAppSettings = Depends(get_settings),
+) -> "ReferenceDataCache":
+    """
+    Return the process-wide cache of genre, actor, language and country ids.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        ReferenceDataCache: The shared reference data cache.
+    """
+    from services.reference_data import ReferenceDataCache
+
+    return get_container().get_or_create(
+        "reference_data_cache",
+        lambda: ReferenceDataCache(max_entries=settings.REFERENCE_DATA_CACHE_MAX_ENTRIES),
     )
+
+
+def get_response_cache(
+        settings: BaseAppSettings = Depends(get_settings),
+) -> "ResponseCache":
+    """
+    Return the process-wide response cache.
+
+    The backend is chosen by ``RESPONSE_CACHE_BACKEND``: ``memory`` keeps responses in a
+    per-worker LRU cache, ``redis`` shares them between workers through ``REDIS_URL``.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        ResponseCache: The shared response cache.
+    """
+    from caches import ResponseCache, InMemoryCacheBackend, RedisCacheBackend
+
+    def create() -> "ResponseCache":
+        if settings.RESPONSE_CACHE_BACKEND == "redis":
+            backend = RedisCacheBackend(settings.REDIS_URL)
+        else:
+            backend = InMemoryCacheBackend(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES)
+        return ResponseCache(backend, ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+
+    return get_container().get_or_create("response_cache", create)
+
+
+def get_password_service(
+        settings: BaseAppSettings = Depends(get_settings),
+) -> "PasswordService":
+    """
+    Return the process-wide password hashing service.
+
+    The password hashing cost policy from the settings is applied when the service is
+    created; hashes made under a different policy are upgraded on the next login.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        PasswordService: The shared password service with its bounded worker pool.
+    """
+    from security.password_service import PasswordService
+    from security.passwords import configure_password_context
+
+    def create() -> "PasswordService":
+        configure_password_context(
+            scheme=settings.PASSWORD_HASH_SCHEME,
+            bcrypt_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+            argon2_time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+            argon2_memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+            argon2_parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+        )
+        return PasswordService(
+            max_workers=settings.PASSWORD_HASHING_MAX_WORKERS,
+            max_pending=settings.PASSWORD_HASHING_MAX_PENDING,
+        )
+
+    return get_container().get_or_create("password_service", create)
+
+
+def get_user_principal_cache(
+        settings: BaseAppSettings = Depends(get_settings),
+) -> "UserPrincipalCache":
+    """
+    Return the process-wide cache of authenticated user principals.
+
+    Principals are always kept in a per-worker LRU cache; with
+    ``USER_PRINCIPAL_CACHE_BACKEND=redis`` they are also shared between workers through ``REDIS_URL``.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        UserPrincipalCache: The shared user principal cache.
+    """
+    from caches import UserPrincipalCache, RedisCacheBackend
+
+    def create() -> "UserPrincipalCache":
+        backend = None
+        if settings.USER_PRINCIPAL_CACHE_BACKEND == "redis":
+            backend = RedisCacheBackend(settings.REDIS_URL)
+        return UserPrincipalCache(
+            ttl=settings.USER_PRINCIPAL_CACHE_TTL_SECONDS,
+            max_entries=settings.USER_PRINCIPAL_CACHE_MAX_ENTRIES,
+            backend=backend,
+        )
+
+    return get_container().get_or_create("user_principal_cache", create)
+
+
+def get_auth_rate_limiter(
+        settings: BaseAppSettings = Depends(get_settings),
+) -> "RateLimiterInterface":
+    """
+    Return the process-wide rate limiter guarding the login, registration and password reset routes.
+
+    ``AUTH_RATE_LIMIT_BACKEND=memory`` keeps the token buckets per worker, ``redis`` shares them
+    between workers through ``REDIS_URL``.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        RateLimiterInterface: The shared rate limiter.
+    """
+    from ratelimit import InMemoryRateLimiter, RedisRateLimiter
+
+    def create() -> "RateLimiterInterface":
+        if settings.AUTH_RATE_LIMIT_BACKEND == "redis":
+            return RedisRateLimiter(settings.REDIS_URL)
+        return InMemoryRateLimiter()
+
+    return get_container().get_or_create("auth_rate_limiter", create)
+
+
+def get_token_revocation_list(
+        settings: BaseAppSettings = Depends(get_settings),
+) -> "TokenRevocationList":
+    """
+    Return the process-wide access-token revocation list.
+
+    ``TOKEN_REVOCATION_BACKEND=memory`` keeps revocations per worker, ``redis`` shares them
+    between workers through ``REDIS_URL``. Either way every worker answers lookups from its own
+    Bloom filter, rebuilt from the store every ``TOKEN_REVOCATION_SYNC_SECONDS``.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        TokenRevocationList: The shared revocation list.
+    """
+    from revocation import InMemoryRevocationStore, RedisRevocationStore, TokenRevocationList
+
+    def create() -> "TokenRevocationList":
+        if settings.TOKEN_REVOCATION_BACKEND == "redis":
+            store = RedisRevocationStore(settings.REDIS_URL)
+        else:
+            store = InMemoryRevocationStore()
+        return TokenRevocationList(
+            store,
+            user_revocation_ttl_seconds=settings.TOKEN_REVOCATION_USER_TTL_SECONDS,
+            expected_entries=settings.TOKEN_REVOCATION_EXPECTED_ENTRIES,
+            false_positive_rate=settings.TOKEN_REVOCATION_FALSE_POSITIVE_RATE,
+            sync_interval_seconds=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+        )
+
+    return get_container().get_or_create("token_revocation_list", create)
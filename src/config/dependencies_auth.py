@@ -1,42 +1,139 @@
-from fastapi import Depends, HTTPException, status
+import logging
+import math
+from typing import Awaitable, Callable
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from config import get_jwt_auth_manager
+from caches import UserPrincipal, UserPrincipalCache
+from config import (
+    get_jwt_auth_manager,
+    get_user_principal_cache,
+    get_auth_rate_limiter,
+    get_settings,
+    get_token_revocation_list,
+)
+from config.settings import BaseAppSettings
 from database import UserModel, get_db
+from ratelimit import RateLimiterInterface, parse_trusted_proxies, resolve_client_ip
+from revocation import TokenRevocationList
 from security.interfaces import JWTAuthManagerInterface
 
+logger = logging.getLogger(__name__)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
 
 async def get_current_user(
         token: str = Depends(oauth2_scheme),
         jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
         session: AsyncSession = Depends(get_db),
-) -> UserModel:
+        principal_cache: UserPrincipalCache = Depends(get_user_principal_cache),
+        revocation_list: TokenRevocationList = Depends(get_token_revocation_list),
+) -> UserPrincipal:
+    """
+    Resolve the user of the bearer access token.
+
+    The user is looked up by the token's user id (or by its ``sub`` email for tokens without
+    one). Found users are cached as principals by id, so repeated requests with the same token
+    need no query. Both paths return a detached ``UserPrincipal`` rather than the ``UserModel``,
+    so routes see the same attributes whether or not the cache was hit. Revoked tokens are
+    rejected before the lookup.
+    """
     try:
         payload = jwt_manager.decode_access_token(token)
-        print(f"=== AUTH DEBUG ===")
-        print(f"Payload: {payload}")
-        user_email: str = payload.get("sub")
-        user_id: int = payload.get("user_id")
-        print(f"Looking for user - Email: {user_email}, ID: {user_id}")
-
-    except Exception as e:
-        print(f"Token decode error: {e}")
+    except Exception as error:
+        logger.debug("Access token rejected: %s", error)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                             detail="Invalid or expired token")
 
-    result = await session.execute(
-        select(UserModel).options(selectinload(UserModel.cart)).where(UserModel.email == user_email)
-    )
+    user_id: int | None = payload.get("user_id", payload.get("id"))
+    user_email: str | None = payload.get("sub")
+
+    if await revocation_list.is_revoked(payload.get("jti"), user_id, payload.get("iat")):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
+                            detail="Token has been revoked")
+
+    if user_id is not None:
+        principal = await principal_cache.get(user_id)
+        if principal is not None:
+            logger.debug("User principal cache hit for user id=%s", user_id)
+            return UserPrincipal(**principal)
+
+    logger.debug("Loading user id=%s email=%s", user_id, user_email)
+    stmt = select(UserModel)
+    if user_id is not None:
+        stmt = stmt.where(UserModel.id == user_id)
+    else:
+        stmt = stmt.where(UserModel.email == user_email)
+    result = await session.execute(stmt)
     user = result.scalar_one_or_none()
-    print(f"User found: {user is not None}")
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    return user
+
+    principal = {field: getattr(user, field) for field in UserPrincipalCache.PRINCIPAL_FIELDS}
+    await principal_cache.set(user.id, principal)
+    return UserPrincipal(**principal)
+
+
+async def _consume_or_reject(limiter: RateLimiterInterface, key: str, capacity: int, per_minute: float) -> None:
+    retry_after = await limiter.consume(key, capacity, per_minute / 60)
+    if retry_after > 0:
+        logger.info("Rate limit exceeded for %s", key)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+def auth_rate_limit(scope: str) -> Callable[..., Awaitable[Callable[[str], Awaitable[None]]]]:
+    """
+    Build a dependency rate limiting an authentication route by client IP and by email.
+
+    The IP bucket is checked when the dependency is resolved, before the route runs. Behind the
+    reverse proxies listed in ``TRUSTED_PROXIES`` the client IP is taken from ``X-Forwarded-For``;
+    otherwise every client would share the proxy's bucket. The dependency returns a coroutine
+    function that the route awaits with the submitted email before doing any password hashing.
+    Both raise a 429 with a ``Retry-After`` header once the bucket is empty.
+
+    Args:
+        scope (str): The bucket namespace, e.g. ``"login"``; routes sharing a scope share budgets.
+
+    Returns:
+        Callable: The FastAPI dependency.
+    """
+    async def dependency(
+            request: Request,
+            limiter: RateLimiterInterface = Depends(get_auth_rate_limiter),
+            settings: BaseAppSettings = Depends(get_settings),
+    ) -> Callable[[str], Awaitable[None]]:
+        client_ip = resolve_client_ip(
+            request.client.host if request.client else "unknown",
+            request.headers.get("x-forwarded-for"),
+            parse_trusted_proxies(settings.TRUSTED_PROXIES),
+        )
+        await _consume_or_reject(
+            limiter,
+            f"{scope}:ip:{client_ip}",
+            settings.AUTH_RATE_LIMIT_IP_CAPACITY,
+            settings.AUTH_RATE_LIMIT_IP_PER_MINUTE,
+        )
+
+        async def limit_email(email: str) -> None:
+            await _consume_or_reject(
+                limiter,
+                f"{scope}:email:{email.lower()}",
+                settings.AUTH_RATE_LIMIT_EMAIL_CAPACITY,
+                settings.AUTH_RATE_LIMIT_EMAIL_PER_MINUTE,
+            )
+
+        return limit_email
+
+    return dependency
@@ -0,0 +1,24 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_db
+from notifications import EmailSenderInterface
+from notifications.outbox import OutboxEmailSender
+
+
+def get_email_outbox(db: AsyncSession = Depends(get_db)) -> EmailSenderInterface:
+    """
+    Return an email sender writing to the outbox in the request's database session.
+
+    Emails are stored by the route's next commit, together with the change they report, and
+    delivered by the ``tasks.deliver_email_outbox`` Celery task, so the request never waits
+    for SMTP.
+
+    Args:
+        db (AsyncSession, optional): The request's database session,
+        provided via dependency injection from `get_db`.
+
+    Returns:
+        EmailSenderInterface: The outbox email sender.
+    """
+    return OutboxEmailSender(db)
@@ -5,10 +5,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from database import Cart, UserModel, Order, OrderItem, OrderStatusEnum
+from caches import UserPrincipal
+from database import Cart, Order, OrderItem, OrderStatusEnum
 
 
-async def create_order_service(db: AsyncSession, cart: Cart, user: UserModel) -> Order:
+async def create_order_service(db: AsyncSession, cart: Cart, user: UserPrincipal) -> Order:
     total_amount = Decimal("0")
     for cart_item in cart.items:
         price = cart_item.movie.current_price or Decimal("0")
@@ -62,7 +63,7 @@ async def get_purchased_movie_ids(db: AsyncSession, user_id: int) -> set[int]:
     return set(result.scalars().all())
 
 
-async def get_order_by_id_and_user(order_id: int, db: AsyncSession, user: UserModel) -> Order | None:
+async def get_order_by_id_and_user(order_id: int, db: AsyncSession, user: UserPrincipal) -> Order | None:
     result = await db.execute(select(Order)
     .where(
         Order.user_id == user.id,
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -11,6 +11,8 @@ class BaseAppSettings(BaseSettings):
     PATH_TO_MOVIES_CSV: str = str(BASE_DIR / "database" / "seed_data" / "imdb_movies.csv")
 
     PATH_TO_EMAIL_TEMPLATES_DIR: str = str(BASE_DIR / "notifications" / "templates")
+    # Compiled templates are cached here when set, e.g. to share them between workers.
+    EMAIL_TEMPLATES_BYTECODE_CACHE_DIR: Optional[str] = os.getenv("EMAIL_TEMPLATES_BYTECODE_CACHE_DIR") or None
     ACTIVATION_EMAIL_TEMPLATE_NAME: str = "activation_request.html"
     ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME: str = "activation_complete.html"
     PAYMENT_CONFIRMATION_TEMPLATE_NAME: str = "payment_confirmation.html"
@@ -18,14 +20,50 @@ class BaseAppSettings(BaseSettings):
     PASSWORD_RESET_COMPLETE_TEMPLATE_NAME: str = "password_reset_complete.html"
 
     LOGIN_TIME_DAYS: int = 7
+    REFRESH_TOKENS_MAX_PER_USER: int = int(os.getenv("REFRESH_TOKENS_MAX_PER_USER", 10))
+    TOKEN_CLEANUP_BATCH_SIZE: int = int(os.getenv("TOKEN_CLEANUP_BATCH_SIZE", 5000))
+    TOKEN_CLEANUP_PAUSE_SECONDS: float = float(os.getenv("TOKEN_CLEANUP_PAUSE_SECONDS", 0.1))
+    JWT_ACCESS_CACHE_MAX_ENTRIES: int = int(os.getenv("JWT_ACCESS_CACHE_MAX_ENTRIES", 10_000))
+
+    PASSWORD_HASHING_MAX_WORKERS: int = int(os.getenv("PASSWORD_HASHING_MAX_WORKERS", 2))
+    PASSWORD_HASHING_MAX_PENDING: int = int(os.getenv("PASSWORD_HASHING_MAX_PENDING", 16))
+    PASSWORD_HASH_SCHEME: str = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+    PASSWORD_BCRYPT_ROUNDS: int = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 14))
+    PASSWORD_ARGON2_TIME_COST: int = int(os.getenv("PASSWORD_ARGON2_TIME_COST", 3))
+    PASSWORD_ARGON2_MEMORY_COST: int = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", 65536))
+    PASSWORD_ARGON2_PARALLELISM: int = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", 4))
+
+    # "memory" keeps separate buckets in every worker process, multiplying the limits by the
+    # number of workers; deployments with several workers use "redis".
+    AUTH_RATE_LIMIT_BACKEND: str = os.getenv("AUTH_RATE_LIMIT_BACKEND", "memory")
+    AUTH_RATE_LIMIT_IP_CAPACITY: int = int(os.getenv("AUTH_RATE_LIMIT_IP_CAPACITY", 20))
+    AUTH_RATE_LIMIT_IP_PER_MINUTE: float = float(os.getenv("AUTH_RATE_LIMIT_IP_PER_MINUTE", 10))
+    AUTH_RATE_LIMIT_EMAIL_CAPACITY: int = int(os.getenv("AUTH_RATE_LIMIT_EMAIL_CAPACITY", 5))
+    AUTH_RATE_LIMIT_EMAIL_PER_MINUTE: float = float(os.getenv("AUTH_RATE_LIMIT_EMAIL_PER_MINUTE", 2))
+    # Comma-separated IPs/CIDRs of the reverse proxies whose X-Forwarded-For header is trusted.
+    TRUSTED_PROXIES: str = os.getenv("TRUSTED_PROXIES", "")
+
+    TOKEN_REVOCATION_BACKEND: str = os.getenv("TOKEN_REVOCATION_BACKEND", "memory")
+    TOKEN_REVOCATION_SYNC_SECONDS: float = float(os.getenv("TOKEN_REVOCATION_SYNC_SECONDS", 5))
+    TOKEN_REVOCATION_EXPECTED_ENTRIES: int = int(os.getenv("TOKEN_REVOCATION_EXPECTED_ENTRIES", 100_000))
+    TOKEN_REVOCATION_FALSE_POSITIVE_RATE: float = float(os.getenv("TOKEN_REVOCATION_FALSE_POSITIVE_RATE", 0.01))
+    # Must cover the access token lifetime (60 minutes).
+    TOKEN_REVOCATION_USER_TTL_SECONDS: int = int(os.getenv("TOKEN_REVOCATION_USER_TTL_SECONDS", 3600))
 
     EMAIL_HOST: str = os.getenv("EMAIL_HOST", "host")
     EMAIL_PORT: int = int(os.getenv("EMAIL_PORT", 25))
     EMAIL_HOST_USER: str = os.getenv("EMAIL_HOST_USER", "testuser")
     EMAIL_HOST_PASSWORD: str = os.getenv("EMAIL_HOST_PASSWORD", "test_password")
     EMAIL_USE_TLS: bool = os.getenv("EMAIL_USE_TLS", "False").lower() == "true"
+    EMAIL_POOL_SIZE: int = int(os.getenv("EMAIL_POOL_SIZE", 4))
+    EMAIL_POOL_IDLE_TIMEOUT_SECONDS: float = float(os.getenv("EMAIL_POOL_IDLE_TIMEOUT_SECONDS", 60))
     MAILHOG_API_PORT: int = os.getenv("MAILHOG_API_PORT", 8025)
 
+    EMAIL_OUTBOX_POLL_SECONDS: float = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", 5))
+    EMAIL_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 50))
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", 8))
+    EMAIL_OUTBOX_RETRY_DELAY_SECONDS: float = float(os.getenv("EMAIL_OUTBOX_RETRY_DELAY_SECONDS", 30))
+
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", 6379))
     REDIS_DB: int = int(os.getenv("REDIS_DB", 0))
@@ -35,6 +73,10 @@ class BaseAppSettings(BaseSettings):
     S3_STORAGE_ACCESS_KEY: str = os.getenv("MINIO_ROOT_USER", "minioadmin")
     S3_STORAGE_SECRET_KEY: str = os.getenv("MINIO_ROOT_PASSWORD", "some_password")
     S3_BUCKET_NAME: str = os.getenv("MINIO_STORAGE", "theater-storage")
+    # The S3 client is kept open per worker; its HTTP connection pool and retry policy.
+    S3_STORAGE_MAX_POOL_CONNECTIONS: int = int(os.getenv("S3_STORAGE_MAX_POOL_CONNECTIONS", 10))
+    S3_STORAGE_RETRY_MODE: str = os.getenv("S3_STORAGE_RETRY_MODE", "standard")
+    S3_STORAGE_MAX_ATTEMPTS: int = int(os.getenv("S3_STORAGE_MAX_ATTEMPTS", 3))
 
     FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://127.0.0.0.800")
 
@@ -47,6 +89,25 @@ class BaseAppSettings(BaseSettings):
 
     MOCK_PAYMENTS: bool = os.getenv("MOCK_PAYMENTS", "True").lower() == "true"
 
+    # "postgres" searches the indexed search_vector column, "inverted_index" an in-process index.
+    MOVIE_SEARCH_BACKEND: str = os.getenv("MOVIE_SEARCH_BACKEND", "postgres")
+
+    MOVIES_COUNT_CACHE_TTL_SECONDS: int = int(os.getenv("MOVIES_COUNT_CACHE_TTL_SECONDS", 60))
+    MOVIES_COUNT_MODE: str = os.getenv("MOVIES_COUNT_MODE", "exact")
+    MOVIES_COUNT_ESTIMATE_MIN_ROWS: int = int(os.getenv("MOVIES_COUNT_ESTIMATE_MIN_ROWS", 1_000_000))
+
+    REFERENCE_DATA_CACHE_MAX_ENTRIES: int = int(os.getenv("REFERENCE_DATA_CACHE_MAX_ENTRIES", 10_000))
+    MOVIES_BULK_IMPORT_CHUNK_SIZE: int = int(os.getenv("MOVIES_BULK_IMPORT_CHUNK_SIZE", 500))
+    MOVIES_EXPORT_BATCH_SIZE: int = int(os.getenv("MOVIES_EXPORT_BATCH_SIZE", 1000))
+
+    RESPONSE_CACHE_BACKEND: str = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_TTL_SECONDS: int = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 300))
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 10_000))
+
+    USER_PRINCIPAL_CACHE_BACKEND: str = os.getenv("USER_PRINCIPAL_CACHE_BACKEND", "memory")
+    USER_PRINCIPAL_CACHE_TTL_SECONDS: int = int(os.getenv("USER_PRINCIPAL_CACHE_TTL_SECONDS", 30))
+    USER_PRINCIPAL_CACHE_MAX_ENTRIES: int = int(os.getenv("USER_PRINCIPAL_CACHE_MAX_ENTRIES", 10_000))
+
     @property
     def S3_STORAGE_ENDPOINT(self) -> str:
         return f"http://{self.S3_STORAGE_HOST}:{self.S3_STORAGE_PORT}"
@@ -83,6 +144,9 @@ class Settings(BaseAppSettings):
     SECRET_KEY_REFRESH: str = os.getenv("SECRET_KEY_REFRESH", os.urandom(32))
     JWT_SIGNING_ALGORITHM: str = os.getenv("JWT_SIGNING_ALGORITHM", "HS256")
 
+    # Shared between the gunicorn workers, so the configured limits apply to the whole app.
+    AUTH_RATE_LIMIT_BACKEND: str = os.getenv("AUTH_RATE_LIMIT_BACKEND", "redis")
+
 
 class TestingSettings(BaseAppSettings):
     SECRET_KEY_ACCESS: str = "SECRET_KEY_ACCESS"
@@ -92,6 +156,8 @@ class TestingSettings(BaseAppSettings):
     STRIPE_PUBLISHABLE_KEY: str = "pk_test_mock_key"
     STRIPE_WEBHOOK_SECRET: str = "whsec_mock_secret"
     MOCK_PAYMENTS: bool = True
+    PASSWORD_BCRYPT_ROUNDS: int = 4
+    MOVIE_SEARCH_BACKEND: str = "inverted_index"
 
     def model_post_init(self, __context: dict[str, Any] | None = None) -> None:
         object.__setattr__(self, 'PATH_TO_DB', ":memory:")
@@ -34,6 +34,10 @@ from database.models.payments import (
     PaymentItem,
     Payment
 )
+from database.models.notifications import (
+    EmailOutboxModel,
+    EmailOutboxStatusEnum
+)
 from database.session_sqlite import reset_sqlite_database as reset_database
 from database.validators import accounts as accounts_validators
 
@@ -22,6 +22,20 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Full-text search objects are managed by migrations only: the generated tsvector
+# column and its GIN/trigram indexes have no SQLite equivalent, so they are not
+# declared on the models and must not be dropped by autogenerate.
+DATABASE_ONLY_OBJECTS = {
+    ("column", "search_vector"),
+    ("index", "ix_movies_search_vector"),
+    ("index", "ix_movies_name_trgm"),
+}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return (type_, name) not in DATABASE_ONLY_OBJECTS
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -47,7 +61,8 @@ def run_migrations_offline() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
-            compare_server_default=True
+            compare_server_default=True,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -68,7 +83,8 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
-            compare_server_default=True
+            compare_server_default=True,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,53 @@
+"""Add movie full-text search vector and trigram index
+
+Revision ID: 4b8e2d6f1a93
+Revises: c3f1a9d5e7b2
+Create Date: 2026-10-17 11:03:47.118392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8e2d6f1a93'
+down_revision: Union[str, None] = 'c3f1a9d5e7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.add_column(
+        'movies',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(overview, '')), 'B')",
+                persisted=True
+            ),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'ix_movies_search_vector', 'movies', ['search_vector'], unique=False, postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_movies_name_trgm',
+        'movies',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_name_trgm', table_name='movies')
+    op.drop_index('ix_movies_search_vector', table_name='movies')
+    op.drop_column('movies', 'search_vector')
@@ -0,0 +1,42 @@
+"""Store refresh tokens as SHA-256 digests and index them for pruning
+
+Revision ID: 7d2c5e9a4b18
+Revises: 4b8e2d6f1a93
+Create Date: 2026-10-17 14:26:09.531744
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2c5e9a4b18'
+down_revision: Union[str, None] = '4b8e2d6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM refresh_tokens WHERE expires_at < now()")
+    op.execute("UPDATE refresh_tokens SET token = encode(sha256(convert_to(token, 'UTF8')), 'hex')")
+    op.alter_column('refresh_tokens', 'token',
+               existing_type=sa.String(length=512),
+               type_=sa.String(length=64),
+               existing_nullable=False)
+    op.create_index(
+        'ix_refresh_tokens_user_id_expires_at', 'refresh_tokens', ['user_id', 'expires_at'], unique=False
+    )
+    op.create_index('ix_refresh_tokens_expires_at', 'refresh_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_refresh_tokens_expires_at', table_name='refresh_tokens')
+    op.drop_index('ix_refresh_tokens_user_id_expires_at', table_name='refresh_tokens')
+    # Digests cannot be turned back into tokens, so every session has to log in again.
+    op.execute("DELETE FROM refresh_tokens")
+    op.alter_column('refresh_tokens', 'token',
+               existing_type=sa.String(length=64),
+               type_=sa.String(length=512),
+               existing_nullable=False)
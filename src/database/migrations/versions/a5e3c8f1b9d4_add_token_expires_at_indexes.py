@@ -0,0 +1,42 @@
+"""Index activation and password reset tokens by expiry
+
+Revision ID: a5e3c8f1b9d4
+Revises: 7d2c5e9a4b18
+Create Date: 2026-10-17 16:02:47.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5e3c8f1b9d4'
+down_revision: Union[str, None] = '7d2c5e9a4b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently, outside the migration transaction, so the token tables stay writable.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_activation_tokens_expires_at', 'activation_tokens', ['expires_at'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_password_reset_tokens_expires_at', 'password_reset_tokens', ['expires_at'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_password_reset_tokens_expires_at', table_name='password_reset_tokens',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_activation_tokens_expires_at', table_name='activation_tokens',
+            postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,51 @@
+"""Add movie catalog filter and sort indexes
+
+Revision ID: c3f1a9d5e7b2
+Revises: e9a47c0be35b
+Create Date: 2026-10-17 10:12:31.504218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1a9d5e7b2'
+down_revision: Union[str, None] = 'e9a47c0be35b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_movies_score_id', 'movies', ['score', 'id'], unique=False)
+    op.create_index('ix_movies_date_id', 'movies', ['date', 'id'], unique=False)
+    op.create_index('ix_movies_revenue_id', 'movies', ['revenue', 'id'], unique=False)
+    op.create_index(
+        'ix_movies_price_id',
+        'movies',
+        [sa.text('coalesce(current_price, 0)'), 'id'],
+        unique=False
+    )
+    op.create_index('ix_movies_country_id', 'movies', ['country_id'], unique=False)
+    op.create_index(
+        'ix_movies_genres_genre_id_movie_id', 'movies_genres', ['genre_id', 'movie_id'], unique=False
+    )
+    op.create_index(
+        'ix_actors_movies_actor_id_movie_id', 'actors_movies', ['actor_id', 'movie_id'], unique=False
+    )
+    op.create_index(
+        'ix_movies_languages_language_id_movie_id', 'movies_languages', ['language_id', 'movie_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_languages_language_id_movie_id', table_name='movies_languages')
+    op.drop_index('ix_actors_movies_actor_id_movie_id', table_name='actors_movies')
+    op.drop_index('ix_movies_genres_genre_id_movie_id', table_name='movies_genres')
+    op.drop_index('ix_movies_country_id', table_name='movies')
+    op.drop_index('ix_movies_price_id', table_name='movies')
+    op.drop_index('ix_movies_revenue_id', table_name='movies')
+    op.drop_index('ix_movies_date_id', table_name='movies')
+    op.drop_index('ix_movies_score_id', table_name='movies')
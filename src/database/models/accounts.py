@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime, date, timedelta, timezone
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 
 from sqlalchemy import (
     ForeignKey,
@@ -12,7 +12,8 @@ from sqlalchemy import (
     func,
     Text,
     Date,
-    UniqueConstraint
+    UniqueConstraint,
+    Index
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -24,7 +25,10 @@ from sqlalchemy.orm import (
 from database import Base
 from database.validators import accounts as validators
 from security.passwords import hash_password, verify_password
-from security.utils import generate_secure_token
+from security.utils import generate_secure_token, hash_token
+
+if TYPE_CHECKING:
+    from security.password_service import PasswordService
 
 
 class UserGroupEnum(str, enum.Enum):
@@ -129,6 +133,48 @@ class UserModel(Base):
         """
         return verify_password(raw_password, self._hashed_password)
 
+    @classmethod
+    async def create_async(
+            cls,
+            email: str,
+            raw_password: str,
+            group_id: int | Mapped[int],
+            password_service: "PasswordService",
+    ) -> "UserModel":
+        """
+        Like :meth:`create`, but hashes the password in the password service's worker pool.
+        """
+        user = cls(email=email, group_id=group_id)
+        await user.set_password_async(raw_password, password_service)
+        return user
+
+    async def set_password_async(self, raw_password: str, password_service: "PasswordService") -> None:
+        """
+        Validate and set the user's password without blocking the event loop.
+        """
+        validators.validate_password_strength(raw_password)
+        self._hashed_password = await password_service.hash(raw_password)
+
+    async def verify_password_async(self, raw_password: str, password_service: "PasswordService") -> bool:
+        """
+        Verify the provided password without blocking the event loop.
+        """
+        return await password_service.verify(raw_password, self._hashed_password)
+
+    async def verify_and_upgrade_password_async(
+            self,
+            raw_password: str,
+            password_service: "PasswordService",
+    ) -> bool:
+        """
+        Verify the provided password and, if it is correct but hashed under an outdated cost
+        policy, replace the stored hash. The new hash is persisted with the session's next commit.
+        """
+        is_valid, new_hash = await password_service.verify_and_update(raw_password, self._hashed_password)
+        if is_valid and new_hash is not None:
+            self._hashed_password = new_hash
+        return is_valid
+
     @validates("email")
     def validate_email(self, key, value):
         return validators.validate_email(value.lower())
@@ -184,7 +230,10 @@ class ActivationTokenModel(TokenBaseModel):
 
     user: Mapped[UserModel] = relationship("UserModel", back_populates="activation_token")
 
-    __table_args__ = (UniqueConstraint("user_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id"),
+        Index("ix_activation_tokens_expires_at", "expires_at"),
+    )
 
     def __repr__(self):
         return f"<ActivationTokenModel(id={self.id}, token={self.token}, expires_at={self.expires_at})>"
@@ -195,21 +244,29 @@ class PasswordResetTokenModel(TokenBaseModel):
 
     user: Mapped[UserModel] = relationship("UserModel", back_populates="password_reset_token")
 
-    __table_args__ = (UniqueConstraint("user_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id"),
+        Index("ix_password_reset_tokens_expires_at", "expires_at"),
+    )
 
     def __repr__(self):
         return f"<PasswordResetTokenModel(id={self.id}, token={self.token}, expires_at={self.expires_at})>"
 
 
 class RefreshTokenModel(TokenBaseModel):
+    """
+    A refresh token issued to a user.
+
+    Only the SHA-256 digest of the JWT is stored in ``token``; look tokens up with
+    ``RefreshTokenModel.token == hash_token(raw_token)``.
+    """
     __tablename__ = "refresh_tokens"
 
     user: Mapped[UserModel] = relationship("UserModel", back_populates="refresh_tokens")
-    token: Mapped[str] = mapped_column(
-        String(512),
-        unique=True,
-        nullable=False,
-        default=generate_secure_token
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_id_expires_at", "user_id", "expires_at"),
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
     )
 
     @classmethod
@@ -218,11 +275,11 @@ class RefreshTokenModel(TokenBaseModel):
         Factory method to create a new RefreshTokenModel instance.
 
         This method simplifies the creation of a new refresh token by calculating
-        the expiration date based on the provided number of valid days and setting
-        the required attributes.
+        the expiration date based on the provided number of valid days and storing
+        the digest of the given raw token.
         """
         expires_at = datetime.now(timezone.utc) + timedelta(days=days_valid)
-        return cls(user_id=user_id, expires_at=expires_at, token=token)
+        return cls(user_id=user_id, expires_at=expires_at, token=hash_token(token))
 
     def __repr__(self):
         return f"<RefreshTokenModel(id={self.id}, token={self.token}, expires_at={self.expires_at})>"
@@ -3,8 +3,11 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import String, Float, Text, DECIMAL, UniqueConstraint, Date, ForeignKey, Table, Column, Boolean
-from sqlalchemy.orm import mapped_column, Mapped, relationship
+from sqlalchemy import (
+    String, Float, Text, DECIMAL, UniqueConstraint, Date, ForeignKey, Table, Column, Boolean, Index, func,
+    literal_column
+)
+from sqlalchemy.orm import mapped_column, Mapped, relationship, joinedload, selectinload
 from sqlalchemy import Enum as SQLAlchemyEnum
 
 from database.models.base import Base
@@ -25,6 +28,7 @@ MoviesGenresModel = Table(
     Column(
         "genre_id",
         ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True, nullable=False),
+    Index("ix_movies_genres_genre_id_movie_id", "genre_id", "movie_id"),
 )
 
 ActorsMoviesModel = Table(
@@ -36,6 +40,7 @@ ActorsMoviesModel = Table(
     Column(
         "actor_id",
         ForeignKey("actors.id", ondelete="CASCADE"), primary_key=True, nullable=False),
+    Index("ix_actors_movies_actor_id_movie_id", "actor_id", "movie_id"),
 )
 
 MoviesLanguagesModel = Table(
@@ -43,6 +48,7 @@ MoviesLanguagesModel = Table(
     Base.metadata,
     Column("movie_id", ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True),
     Column("language_id", ForeignKey("languages.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_movies_languages_language_id_movie_id", "language_id", "movie_id"),
 )
 
 
@@ -149,11 +155,41 @@ class MovieModel(Base):
 
     __table_args__ = (
         UniqueConstraint("name", "date", name="unique_movie_constraint"),
+        Index("ix_movies_score_id", "score", "id"),
+        Index("ix_movies_date_id", "date", "id"),
+        Index("ix_movies_revenue_id", "revenue", "id"),
+        Index("ix_movies_country_id", "country_id"),
     )
 
     @classmethod
     def default_order_by(cls):
         return [cls.id.desc()]
 
+    @classmethod
+    def detail_load_options(cls):
+        """
+        Loader options for a fully populated movie.
+
+        The country is joined (one row per movie), while each collection is fetched by its
+        own batched ``SELECT ... WHERE movie_id IN (...)`` so the rows returned grow with
+        genres + actors + languages instead of their product.
+        """
+        return [
+            joinedload(cls.country),
+            selectinload(cls.genres),
+            selectinload(cls.actors),
+            selectinload(cls.languages),
+        ]
+
+    @classmethod
+    def price_sort_key(cls):
+        """
+        Non-null price expression used for sorting; matches the ``ix_movies_price_id`` index.
+        """
+        return func.coalesce(cls.current_price, literal_column("0"))
+
     def __repr__(self):
         return f"<Movie(name='{self.name}', release_date='{self.date}', score={self.score})>"
+
+
+Index("ix_movies_price_id", MovieModel.price_sort_key(), MovieModel.id)
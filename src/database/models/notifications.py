@@ -0,0 +1,46 @@
+import enum
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import Integer, DateTime, Enum, String, Text, JSON, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class EmailOutboxStatusEnum(str, enum.Enum):
+    PENDING = "pending"
+    DEAD = "dead"
+
+
+class EmailOutboxModel(Base):
+    """
+    An email waiting to be delivered.
+
+    Rows are written in the same transaction as the change the email reports, so an email is
+    stored if and only if that change is committed. ``kind`` names the ``EmailSenderInterface``
+    method that delivers it and ``payload`` holds that method's keyword arguments. Delivered
+    rows are deleted; rows that failed ``EMAIL_OUTBOX_MAX_ATTEMPTS`` times are kept as ``DEAD``.
+    """
+    __tablename__ = "email_outbox"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(64), nullable=False)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    status: Mapped[EmailOutboxStatusEnum] = mapped_column(
+        Enum(EmailOutboxStatusEnum), nullable=False, default=EmailOutboxStatusEnum.PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self):
+        return f"<EmailOutboxModel(id={self.id}, kind={self.kind}, status={self.status}, attempts={self.attempts})>"
@@ -1,9 +1,11 @@
 from exceptions.security import (
     BaseSecurityError,
     InvalidTokenError,
-    TokenExpiredError
+    TokenExpiredError,
+    PasswordServiceBusyError,
+    TokenRevocationUnavailableError
 )
-from exceptions.email import BaseEmailError
+from exceptions.email import BaseEmailError, EmailTemplateError
 from exceptions.storage import (
     BaseS3Error,
     S3ConnectionError,
@@ -12,3 +14,4 @@ from exceptions.storage import (
     S3FileNotFoundError,
     S3PermissionError
 )
+from exceptions.pagination import InvalidCursorError
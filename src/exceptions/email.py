@@ -1,3 +1,8 @@
 class BaseEmailError(Exception):
     """Base class for all exceptions raised by email notification module."""
     pass
+
+
+class EmailTemplateError(BaseEmailError):
+    """Raised when an email template is missing or rendered without its required variables."""
+    pass
@@ -0,0 +1,5 @@
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the requested ordering."""
+
+    def __init__(self, message="Invalid pagination cursor."):
+        super().__init__(message)
@@ -19,3 +19,17 @@ class InvalidTokenError(BaseSecurityError):
 
     def __init__(self, message="Invalid token."):
         super().__init__(message)
+
+
+class PasswordServiceBusyError(BaseSecurityError):
+    """Raised when the password hashing pool cannot accept more work."""
+
+    def __init__(self, message="The server is busy, please try again later."):
+        super().__init__(message)
+
+
+class TokenRevocationUnavailableError(BaseSecurityError):
+    """Raised when a token revocation cannot be stored."""
+
+    def __init__(self, message="Could not end the session, please try again later."):
+        super().__init__(message)
@@ -1,5 +1,20 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from config import (
+    get_settings,
+    get_jwt_auth_manager,
+    get_accounts_email_notificator,
+    get_s3_storage_client,
+    get_payment_service,
+    get_password_service,
+    get_token_revocation_list,
+    get_reference_data_cache,
+)
+from config.container import close_container
+from database import get_db_contextmanager
 from routes import (
     movie_router,
     accounts_router,
@@ -9,9 +24,35 @@ from routes import (
     payment_router
 )
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    get_jwt_auth_manager(settings)
+    get_accounts_email_notificator(settings)
+    await get_s3_storage_client(settings).connect()
+    get_payment_service(settings)
+    get_password_service(settings)
+    get_token_revocation_list(settings).start()
+
+    reference_data_cache = get_reference_data_cache(settings)
+    try:
+        async with get_db_contextmanager() as db:
+            await reference_data_cache.warm(db)
+    except Exception:
+        logger.warning("Could not warm the reference data cache; it will fill on demand.", exc_info=True)
+
+    yield
+
+    await close_container()
+
+
 app = FastAPI(
     title="Movies homework",
-    description="Description of project"
+    description="Description of project",
+    lifespan=lifespan
 )
 
 api_version_prefix = "/api/v1"
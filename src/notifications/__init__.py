@@ -1,2 +1,4 @@
+from notifications.batch import BatchEmail, BatchSendResult
 from notifications.interfaces import EmailSenderInterface
+from notifications.template_registry import EmailTemplateRegistry
 from notifications.emails import EmailSender
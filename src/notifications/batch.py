@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+
+@dataclass(frozen=True)
+class BatchEmail:
+    """
+    One message of an email batch: its recipient and the template variables specific to it.
+    """
+
+    recipient: str
+    context: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchSendResult:
+    """
+    The outcome of an email batch: the recipients that were sent to and the error of every
+    recipient that was not.
+    """
+
+    sent: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
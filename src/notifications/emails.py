@@ -1,15 +1,19 @@
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime
 from decimal import Decimal
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, Iterable, Mapping
 
 import aiosmtplib
-from jinja2 import Environment, FileSystemLoader
 
 from exceptions import BaseEmailError
+from notifications.batch import BatchEmail, BatchSendResult
 from notifications.interfaces import EmailSenderInterface
+from notifications.smtp_pool import SMTPConnectionPool
+from notifications.template_registry import EmailTemplateRegistry
 
 
 class EmailSender(EmailSenderInterface):
@@ -26,8 +30,19 @@ class EmailSender(EmailSenderInterface):
         activation_complete_email_template_name: str,
         password_email_template_name: str,
         password_complete_email_template_name: str,
-        payment_confirmation_template_name: str
+        payment_confirmation_template_name: str,
+        pool_size: int = 4,
+        pool_idle_timeout: float = 60.0,
+        template_registry: Optional[EmailTemplateRegistry] = None,
     ):
+        """
+        Without ``template_registry`` the sender compiles the templates of ``template_dir``
+        itself; pass the worker's shared registry to reuse its compiled templates. The
+        configured templates are checked to need only the variables their emails provide.
+
+        Raises:
+            EmailTemplateError: If a configured template is missing or needs other variables.
+        """
         self._hostname = hostname
         self._port = port
         self._email = email
@@ -39,12 +54,40 @@ class EmailSender(EmailSenderInterface):
         self._password_complete_email_template_name = password_complete_email_template_name
         self._payment_confirmation_email_template_name = payment_confirmation_template_name
 
-        self._env = Environment(loader=FileSystemLoader(template_dir))
+        self._templates = template_registry or EmailTemplateRegistry(template_dir)
+        self._templates.validate(activation_email_template_name, ("email", "activation_link"))
+        self._templates.validate(activation_complete_email_template_name, ("email", "login_link"))
+        self._templates.validate(password_email_template_name, ("email", "reset_link"))
+        self._templates.validate(password_complete_email_template_name, ("email", "login_link"))
+        self._templates.validate(
+            payment_confirmation_template_name, ("email", "order_id", "amount", "transaction_id", "date")
+        )
+        self._pool_size = pool_size
+        self._pool = SMTPConnectionPool(
+            hostname=hostname,
+            port=port,
+            username=email,
+            password=password,
+            use_tls=use_tls,
+            max_size=pool_size,
+            idle_timeout=pool_idle_timeout,
+        )
+
+    def _build_message(self, recipient: str, subject: str, html_content: str) -> MIMEMultipart:
+        message = MIMEMultipart()
+        message["From"] = self._email
+        message["To"] = recipient
+        message["Subject"] = subject
+        message.attach(MIMEText(html_content, "html"))
+        return message
 
     async def _send_email(self, recipient: str, subject: str, html_content: str) -> None:
         """
         Asynchronously send an email with the given subject and HTML content.
 
+        The message is sent over a pooled SMTP session. If a reused session turns out to be
+        disconnected, the message is sent once more over a new one.
+
         Args:
             recipient (str): The recipient's email address.
             subject (str): The subject of the email.
@@ -53,20 +96,15 @@ class EmailSender(EmailSenderInterface):
         Raises:
             BaseEmailError: If sending the email fails.
         """
-        message = MIMEMultipart()
-        message["From"] = self._email
-        message["To"] = recipient
-        message["Subject"] = subject
-        message.attach(MIMEText(html_content, "html"))
+        message = self._build_message(recipient, subject, html_content)
 
         try:
-            smtp = aiosmtplib.SMTP(hostname=self._hostname, port=self._port, start_tls=self._use_tls)
-            await smtp.connect()
-            if self._use_tls:
-                await smtp.starttls()
-            await smtp.login(self._email, self._password)
-            await smtp.sendmail(self._email, [recipient], message.as_string())
-            await smtp.quit()
+            try:
+                async with self._pool.connection() as smtp:
+                    await smtp.sendmail(self._email, [recipient], message.as_string())
+            except aiosmtplib.SMTPServerDisconnected:
+                async with self._pool.connection() as smtp:
+                    await smtp.sendmail(self._email, [recipient], message.as_string())
         except aiosmtplib.SMTPException as error:
             logging.error(f"Failed to send email to {recipient}: {error}")
             raise BaseEmailError(f"Failed to send email to {recipient}: {error}")
@@ -79,8 +117,11 @@ class EmailSender(EmailSenderInterface):
             email (str): The recipient's email address.
             activation_link (str): The activation link to be included in the email.
         """
-        template = self._env.get_template(self._activation_email_template_name)
-        html_content = template.render(email=email, activation_link=activation_link)
+        html_content = self._templates.render(
+            self._activation_email_template_name,
+            email=email,
+            activation_link=activation_link,
+        )
         subject = "Account Activation"
         await self._send_email(email, subject, html_content)
 
@@ -92,8 +133,11 @@ class EmailSender(EmailSenderInterface):
             email (str): The recipient's email address.
             login_link (str): The login link to be included in the email.
         """
-        template = self._env.get_template(self._activation_complete_email_template_name)
-        html_content = template.render(email=email, login_link=login_link)
+        html_content = self._templates.render(
+            self._activation_complete_email_template_name,
+            email=email,
+            login_link=login_link,
+        )
         subject = "Account Activated Successfully"
         await self._send_email(email, subject, html_content)
 
@@ -105,8 +149,11 @@ class EmailSender(EmailSenderInterface):
             email (str): The recipient's email address.
             reset_link (str): The reset link to be included in the email.
         """
-        template = self._env.get_template(self._password_email_template_name)
-        html_content = template.render(email=email, reset_link=reset_link)
+        html_content = self._templates.render(
+            self._password_email_template_name,
+            email=email,
+            reset_link=reset_link,
+        )
         subject = "Password Reset Request"
         await self._send_email(email, subject, html_content)
 
@@ -118,8 +165,11 @@ class EmailSender(EmailSenderInterface):
             email (str): The recipient's email address.
             login_link (str): The login link to be included in the email.
         """
-        template = self._env.get_template(self._password_complete_email_template_name)
-        html_content = template.render(email=email, login_link=login_link)
+        html_content = self._templates.render(
+            self._password_complete_email_template_name,
+            email=email,
+            login_link=login_link,
+        )
         subject = "Your Password Has Been Successfully Reset"
         await self._send_email(email, subject, html_content)
 
@@ -127,7 +177,7 @@ class EmailSender(EmailSenderInterface):
                                               email: str,
                                               order_id: int,
                                               amount: Decimal,
-                                              transaction_id: int,
+                                              transaction_id: str,
                                              ) -> None:
         """
         Send payment confirmation email
@@ -143,12 +193,14 @@ class EmailSender(EmailSenderInterface):
         """
         try:
 
-            template= self._env.get_template(self._payment_confirmation_email_template_name)
-            html_content = template.render(email=email,
-                                           order_id=order_id,
-                                           amount=amount,
-                                           transaction_id=transaction_id,
-                                           date = datetime.now.strftime("%Y-%m-%d %H:%M"))
+            html_content = self._templates.render(
+                self._payment_confirmation_email_template_name,
+                email=email,
+                order_id=order_id,
+                amount=amount,
+                transaction_id=transaction_id,
+                date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            )
             subject = f"Payment Confirmation - Order #{order_id}"
             await self._send_email(email, subject, html_content)
             logging.info(f"Payment confirmation email sent to {email} for order #{order_id}")
@@ -156,3 +208,94 @@ class EmailSender(EmailSenderInterface):
         except Exception as error:
             logging.error(f"Failed to send payment confirmation email to {email}: {error}")
             raise BaseEmailError(f"Failed to send payment confirmation email: {error}")
+
+    async def send_batch(
+            self,
+            template_name: str,
+            subject: str,
+            emails: Iterable[BatchEmail],
+            shared_context: Optional[Mapping[str, Any]] = None,
+    ) -> BatchSendResult:
+        """
+        Send one template to many recipients over the pooled SMTP sessions.
+
+        Every message renders the same compiled template from the registry. Rendering is also
+        shared: messages whose merged contexts are equal (compared by value) reuse one
+        rendering, so a batch whose messages differ only by recipient is rendered a single
+        time, while a batch with per-recipient variables is rendered once per recipient. Up
+        to ``pool_size`` sessions send concurrently, each delivering message after message
+        without reconnecting.
+        A refused message is recorded and its session reused; a message whose session was
+        disconnected is retried once over a new session. If no session can be opened, the
+        remaining messages fail with the connection error.
+
+        Args:
+            template_name (str): The template file to render.
+            subject (str): The subject of every message.
+            emails (Iterable[BatchEmail]): The recipients and their template variables.
+            shared_context (Optional[Mapping[str, Any]]): Template variables common to all messages.
+
+        Returns:
+            BatchSendResult: The recipients sent to and the errors of those that failed.
+
+        Raises:
+            EmailTemplateError: If the template does not exist or a message lacks a required variable.
+        """
+        self._templates.required_variables(template_name)
+        rendered: Dict[tuple, str] = {}
+        pending: deque = deque()
+        for email in emails:
+            context = {**(shared_context or {}), **email.context}
+            try:
+                key = tuple(sorted(context.items()))
+                html_content = rendered.get(key)
+            except TypeError:
+                key, html_content = None, None
+            if html_content is None:
+                html_content = self._templates.render(template_name, **context)
+                if key is not None:
+                    rendered[key] = html_content
+            pending.append((email.recipient, html_content, 0))
+
+        result = BatchSendResult()
+        await asyncio.gather(*(self._send_pending(pending, subject, result) for _ in range(self._pool_size)))
+        logging.info(
+            f"Sent {len(result.sent)} '{template_name}' emails, {len(result.failed)} failed "
+            f"({len(rendered)} distinct renderings)"
+        )
+        return result
+
+    async def _send_pending(self, pending: deque, subject: str, result: BatchSendResult) -> None:
+        """
+        Send queued batch messages over one pooled session at a time until the queue is empty.
+        """
+        while pending:
+            try:
+                async with self._pool.connection() as smtp:
+                    while pending:
+                        recipient, html_content, attempts = pending.popleft()
+                        message = self._build_message(recipient, subject, html_content)
+                        try:
+                            await smtp.sendmail(self._email, [recipient], message.as_string())
+                        except aiosmtplib.SMTPServerDisconnected as error:
+                            if attempts:
+                                result.failed[recipient] = str(error)
+                            else:
+                                pending.appendleft((recipient, html_content, attempts + 1))
+                            raise
+                        except aiosmtplib.SMTPException as error:
+                            result.failed[recipient] = str(error)
+                        else:
+                            result.sent.append(recipient)
+            except aiosmtplib.SMTPServerDisconnected:
+                continue
+            except aiosmtplib.SMTPException as error:
+                logging.error(f"Failed to open an SMTP session for a batch: {error}")
+                while pending:
+                    result.failed[pending.popleft()[0]] = str(error)
+
+    async def close(self) -> None:
+        """
+        Close the pooled SMTP sessions.
+        """
+        await self._pool.close()
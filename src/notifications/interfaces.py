@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from typing import Any, Iterable, Mapping, Optional
+
+from notifications.batch import BatchEmail, BatchSendResult
 
 
 class EmailSenderInterface(ABC):
@@ -69,3 +72,35 @@ class EmailSenderInterface(ABC):
             BaseEmailError: If sending the email fails.
         """
         pass
+
+    @abstractmethod
+    async def send_batch(
+            self,
+            template_name: str,
+            subject: str,
+            emails: Iterable[BatchEmail],
+            shared_context: Optional[Mapping[str, Any]] = None,
+    ) -> BatchSendResult:
+        """
+        Asynchronously send one template to many recipients, e.g. for notification campaigns.
+
+        Every message is rendered with ``shared_context`` updated by its own context. Failed
+        recipients are reported in the result instead of aborting the batch; senders that only
+        queue the messages report every queued recipient as sent.
+
+        Args:
+            template_name (str): The template file to render.
+            subject (str): The subject of every message.
+            emails (Iterable[BatchEmail]): The recipients and their template variables.
+            shared_context (Optional[Mapping[str, Any]]): Template variables common to all messages.
+
+        Returns:
+            BatchSendResult: The recipients sent to and the errors of those that failed.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release connections held by the sender; a no-op for senders without any.
+        """
+        pass
@@ -0,0 +1,78 @@
+from decimal import Decimal
+from typing import Any, Iterable, Mapping, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import EmailOutboxModel
+from notifications.batch import BatchEmail, BatchSendResult
+from notifications.interfaces import EmailSenderInterface
+
+
+class OutboxEmailSender(EmailSenderInterface):
+    """
+    Email sender writing emails to the ``email_outbox`` table instead of sending them.
+
+    Every email is added to the given session, so it is stored by the caller's next commit
+    together with the change it reports, and discarded with it on rollback. The
+    ``tasks.deliver_email_outbox`` Celery task delivers the stored emails.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    def _enqueue(self, kind: str, email: str, **payload) -> None:
+        self._db.add(EmailOutboxModel(kind=kind, recipient=email, payload={"email": email, **payload}))
+
+    async def send_activation_email(self, email: str, activation_link: str) -> None:
+        self._enqueue("send_activation_email", email, activation_link=activation_link)
+
+    async def send_activation_complete_email(self, email: str, login_link: str) -> None:
+        self._enqueue("send_activation_complete_email", email, login_link=login_link)
+
+    async def send_password_reset_email(self, email: str, reset_link: str) -> None:
+        self._enqueue("send_password_reset_email", email, reset_link=reset_link)
+
+    async def send_password_reset_complete_email(self, email: str, login_link: str) -> None:
+        self._enqueue("send_password_reset_complete_email", email, login_link=login_link)
+
+    async def send_payment_confirmation_email(
+            self,
+            email: str,
+            order_id: int,
+            amount: Decimal,
+            transaction_id: str,
+    ) -> None:
+        self._enqueue(
+            "send_payment_confirmation_email",
+            email,
+            order_id=order_id,
+            amount=str(amount),
+            transaction_id=transaction_id,
+        )
+
+    async def send_batch(
+            self,
+            template_name: str,
+            subject: str,
+            emails: Iterable[BatchEmail],
+            shared_context: Optional[Mapping[str, Any]] = None,
+    ) -> BatchSendResult:
+        """
+        Queue one outbox row per recipient; every queued recipient is reported as sent.
+
+        Each row carries the template, the subject and the recipient's merged context, which
+        must be JSON serializable, so recipients are delivered and retried independently.
+        """
+        result = BatchSendResult()
+        for email in emails:
+            self._db.add(EmailOutboxModel(
+                kind="send_batch",
+                recipient=email.recipient,
+                payload={
+                    "template_name": template_name,
+                    "subject": subject,
+                    "context": {**(shared_context or {}), **email.context},
+                },
+            ))
+            result.sent.append(email.recipient)
+        return result
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionPool:
+    """
+    A pool of connected, authenticated SMTP sessions.
+
+    At most ``max_size`` connections are open at a time; callers beyond that wait for a free one.
+    A released connection is kept for reuse until it has been idle for ``idle_timeout`` seconds,
+    and one idle for more than ``health_check_after`` seconds is checked with ``NOOP`` before
+    reuse. Connections that fail the check, or fail while in use, are dropped, so the next
+    caller reconnects.
+
+    Connections belong to the event loop that opened them. When the pool is used from another
+    loop, as by a caller running each send with ``asyncio.run``, the idle connections of the old
+    loop are discarded. Celery tasks avoid this by running on ``tasks.runtime.worker_runtime``.
+    """
+
+    def __init__(
+            self,
+            hostname: str,
+            port: int,
+            username: Optional[str],
+            password: Optional[str],
+            use_tls: bool,
+            max_size: int = 4,
+            idle_timeout: float = 60.0,
+            health_check_after: float = 5.0,
+    ):
+        self._hostname = hostname
+        self._port = port
+        self._username = username
+        self._password = password
+        self._use_tls = use_tls
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._health_check_after = health_check_after
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _bind_to_running_loop(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            for smtp, _ in self._idle:
+                smtp.close()
+            self._idle.clear()
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self._max_size)
+        return self._slots
+
+    async def _open(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self._hostname,
+            port=self._port,
+            username=self._username,
+            password=self._password,
+            start_tls=self._use_tls,
+        )
+        await smtp.connect()
+        return smtp
+
+    async def _take_idle(self) -> Optional[aiosmtplib.SMTP]:
+        while self._idle:
+            smtp, released_at = self._idle.pop()
+            idle_for = time.monotonic() - released_at
+            if idle_for > self._idle_timeout or not smtp.is_connected:
+                smtp.close()
+                continue
+            if idle_for > self._health_check_after:
+                try:
+                    await smtp.noop()
+                except (aiosmtplib.SMTPException, OSError):
+                    smtp.close()
+                    continue
+            return smtp
+        return None
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """
+        Borrow a connected SMTP session, opening one if no healthy idle session is left.
+
+        The session returns to the pool when the block exits normally and is closed when the
+        block raises.
+
+        Raises:
+            aiosmtplib.SMTPException: If connecting or logging in fails.
+        """
+        slots = self._bind_to_running_loop()
+        async with slots:
+            smtp = await self._take_idle() or await self._open()
+            try:
+                yield smtp
+            except BaseException:
+                smtp.close()
+                raise
+            self._idle.append((smtp, time.monotonic()))
+
+    async def close(self) -> None:
+        """
+        Quit every idle session.
+        """
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            try:
+                await smtp.quit()
+            except (aiosmtplib.SMTPException, OSError, RuntimeError):
+                smtp.close()
@@ -0,0 +1,80 @@
+import os
+from typing import Any, Iterable, Optional
+
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template, meta
+
+from exceptions import EmailTemplateError
+
+
+class EmailTemplateRegistry:
+    """
+    The compiled email templates of a directory, shared by every sender of a worker process.
+
+    All templates are compiled when the registry is created, so a broken template fails at
+    startup instead of at the first email, and rendering never touches the file system. With
+    ``bytecode_cache_dir`` the compiled code is also cached on disk, which spares the other
+    workers and later restarts the compilation.
+
+    The variables a template reads from its context are its required variables; rendering
+    without one of them raises :class:`EmailTemplateError` instead of leaving a blank.
+    """
+
+    def __init__(self, template_dir: str, bytecode_cache_dir: Optional[str] = None):
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+        self._env = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+        )
+        self._templates: dict[str, Template] = {}
+        self._required_variables: dict[str, frozenset[str]] = {}
+        for name in self._env.list_templates():
+            source, _, _ = self._env.loader.get_source(self._env, name)
+            self._required_variables[name] = frozenset(meta.find_undeclared_variables(self._env.parse(source)))
+            self._templates[name] = self._env.get_template(name)
+
+    def _template(self, name: str) -> Template:
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise EmailTemplateError(f"Email template '{name}' does not exist.") from None
+
+    def required_variables(self, name: str) -> frozenset[str]:
+        """
+        Return the variables a template reads from its context.
+
+        Raises:
+            EmailTemplateError: If the template does not exist.
+        """
+        self._template(name)
+        return self._required_variables[name]
+
+    def validate(self, name: str, variables: Iterable[str]) -> None:
+        """
+        Check that a template exists and needs no variables beyond the given ones.
+
+        Senders call this on startup for every template they render with a fixed set of
+        variables.
+
+        Raises:
+            EmailTemplateError: If the template does not exist or needs other variables.
+        """
+        missing = self.required_variables(name) - set(variables)
+        if missing:
+            raise EmailTemplateError(f"Email template '{name}' requires the variables {sorted(missing)}.")
+
+    def render(self, name: str, **context: Any) -> str:
+        """
+        Render a compiled template.
+
+        Raises:
+            EmailTemplateError: If the template does not exist or a required variable is missing.
+        """
+        template = self._template(name)
+        missing = self._required_variables[name] - context.keys()
+        if missing:
+            raise EmailTemplateError(f"Email template '{name}' requires the variables {sorted(missing)}.")
+        return template.render(**context)
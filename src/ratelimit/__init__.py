@@ -0,0 +1,4 @@
+from ratelimit.interfaces import RateLimiterInterface
+from ratelimit.memory import InMemoryRateLimiter
+from ratelimit.redis_limiter import RedisRateLimiter
+from ratelimit.client_ip import parse_trusted_proxies, resolve_client_ip
@@ -0,0 +1,58 @@
+import ipaddress
+import logging
+from functools import lru_cache
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+@lru_cache(maxsize=8)
+def parse_trusted_proxies(value: str) -> tuple[IPNetwork, ...]:
+    """
+    Parse a comma-separated list of proxy IP addresses and CIDR networks.
+
+    Invalid entries are logged and skipped.
+    """
+    networks = []
+    for entry in filter(None, (entry.strip() for entry in value.split(","))):
+        try:
+            networks.append(ipaddress.ip_network(entry, strict=False))
+        except ValueError:
+            logger.warning("Ignoring invalid trusted proxy %r", entry)
+    return tuple(networks)
+
+
+def _is_trusted(address: str, trusted_proxies: tuple[IPNetwork, ...]) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted_proxies)
+
+
+def resolve_client_ip(peer: str, forwarded_for: Optional[str], trusted_proxies: tuple[IPNetwork, ...]) -> str:
+    """
+    Return the address of the client behind the trusted proxies.
+
+    ``X-Forwarded-For`` is only read when the peer is a trusted proxy. Its hops are walked from
+    the right, as each proxy appends the address it received the request from, and the first
+    hop that is not a trusted proxy is the client; hops further left are supplied by the client
+    and may be forged.
+
+    Args:
+        peer (str): The address of the connection.
+        forwarded_for (Optional[str]): The ``X-Forwarded-For`` header, if any.
+        trusted_proxies (tuple[IPNetwork, ...]): The networks of the proxies in front of the app.
+
+    Returns:
+        str: The client address.
+    """
+    if not _is_trusted(peer, trusted_proxies):
+        return peer
+    hops = [hop.strip() for hop in (forwarded_for or "").split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted_proxies):
+            return hop
+    return hops[0] if hops else peer
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+
+class RateLimiterInterface(ABC):
+
+    @abstractmethod
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        """
+        Take one token from the token bucket of a key.
+
+        Buckets start full with ``capacity`` tokens and refill continuously at
+        ``refill_per_second`` tokens per second, up to ``capacity``.
+
+        :param key: The bucket key, e.g. ``"login:ip:203.0.113.7"``.
+        :param capacity: The bucket size, i.e. the allowed burst.
+        :param refill_per_second: The sustained rate of allowed requests.
+        :return: 0 if a token was taken, otherwise the seconds until one is available.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release connections held by the limiter; a no-op for limiters without any.
+        """
+        pass
@@ -0,0 +1,30 @@
+import threading
+import time
+
+from caches import LRUCache
+from ratelimit.interfaces import RateLimiterInterface
+
+
+class InMemoryRateLimiter(RateLimiterInterface):
+    """
+    Token-bucket rate limiter keeping its buckets in a per-worker :class:`LRUCache`.
+
+    Every worker enforces the limits on its own, so the effective limit is multiplied by the
+    number of workers; use :class:`RedisRateLimiter` to share buckets. The least recently used
+    buckets are evicted beyond ``max_buckets``, which at worst grants an evicted key a full bucket.
+    """
+
+    def __init__(self, max_buckets: int = 100_000):
+        self._buckets = LRUCache(max_size=max_buckets)
+        self._lock = threading.Lock()
+
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+            if tokens >= 1:
+                self._buckets.set(key, (tokens - 1, now))
+                return 0.0
+            self._buckets.set(key, (tokens, now))
+        return (1 - tokens) / refill_per_second
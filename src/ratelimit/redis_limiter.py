@@ -0,0 +1,58 @@
+import logging
+
+from redis import asyncio as redis_asyncio
+from redis.exceptions import RedisError
+
+from ratelimit.interfaces import RateLimiterInterface
+
+logger = logging.getLogger(__name__)
+
+# Refills and takes a token atomically, using the Redis server clock so workers agree on time.
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_per_second = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * refill_per_second)
+
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / refill_per_second
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / refill_per_second * 1000))
+return tostring(retry_after)
+"""
+
+
+class RedisRateLimiter(RateLimiterInterface):
+    """
+    Token-bucket rate limiter shared by all workers through Redis.
+
+    Each bucket is a hash updated by one Lua script call and expires once it would be full
+    again. If Redis is unavailable the request is allowed and a warning is logged, so an outage
+    of the limiter does not lock users out.
+    """
+
+    def __init__(self, url: str, prefix: str = "theater:ratelimit:"):
+        self._client = redis_asyncio.Redis.from_url(url)
+        self._script = self._client.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._prefix = prefix
+
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        try:
+            retry_after = await self._script(keys=[f"{self._prefix}{key}"], args=[capacity, refill_per_second])
+        except RedisError:
+            logger.warning("Rate limiter unavailable, allowing request for %s", key, exc_info=True)
+            return 0.0
+        return float(retry_after)
+
+    async def close(self) -> None:
+        await self._client.aclose()
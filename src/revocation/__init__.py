@@ -0,0 +1,5 @@
+from revocation.interfaces import RevocationStoreInterface
+from revocation.memory import InMemoryRevocationStore
+from revocation.redis_store import RedisRevocationStore
+from revocation.bloom import BloomFilter
+from revocation.token_revocation import TokenRevocationList
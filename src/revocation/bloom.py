@@ -0,0 +1,43 @@
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter over strings.
+
+    Membership tests never give false negatives; false positives occur at about
+    ``false_positive_rate`` while at most ``expected_items`` items were added. The filter is
+    sized on creation and cannot remove items, so it is rebuilt to drop them.
+    """
+
+    def __init__(self, expected_items: int, false_positive_rate: float):
+        expected_items = max(1, expected_items)
+        self._size = max(8, math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._size / expected_items * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], expected_items: int, false_positive_rate: float) -> "BloomFilter":
+        """
+        Build a filter holding the given items.
+        """
+        bloom = cls(expected_items, false_positive_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: k positions from the two halves of one 128-bit digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + index * second) % self._size for index in range(self._hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
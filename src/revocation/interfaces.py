@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class RevocationStoreInterface(ABC):
+
+    @abstractmethod
+    async def add(self, key: str, revoked_at: float, ttl: float) -> None:
+        """
+        Record a revocation.
+
+        :param key: The revoked subject, e.g. ``"jti:<token id>"`` or ``"user:<user id>"``.
+        :param revoked_at: The UNIX time of the revocation.
+        :param ttl: Seconds until the entry may be forgotten, i.e. until every affected token expired.
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[float]:
+        """
+        Return the UNIX time a key was revoked at.
+
+        :param key: The revoked subject.
+        :return: The revocation time, or None if the key is not revoked.
+        """
+        pass
+
+    @abstractmethod
+    async def keys(self) -> list[str]:
+        """
+        Return every key with a live revocation.
+
+        :return: The revoked keys.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release connections held by the store; a no-op for stores without any.
+        """
+        pass
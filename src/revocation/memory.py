@@ -0,0 +1,31 @@
+import time
+from typing import Optional
+
+from revocation.interfaces import RevocationStoreInterface
+
+
+class InMemoryRevocationStore(RevocationStoreInterface):
+    """
+    Revocation store keeping its entries in a per-worker dictionary.
+
+    Entries are never evicted before they expire, since forgetting a revocation would make the
+    token valid again. Revocations are not shared between workers; use
+    :class:`RedisRevocationStore` when running more than one.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[float, float]] = {}
+
+    async def add(self, key: str, revoked_at: float, ttl: float) -> None:
+        self._entries[key] = (revoked_at, time.time() + ttl)
+
+    async def get(self, key: str) -> Optional[float]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    async def keys(self) -> list[str]:
+        now = time.time()
+        self._entries = {key: entry for key, entry in self._entries.items() if entry[1] > now}
+        return list(self._entries)
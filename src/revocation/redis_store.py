@@ -0,0 +1,34 @@
+from typing import Optional
+
+from redis import asyncio as redis_asyncio
+
+from revocation.interfaces import RevocationStoreInterface
+
+
+class RedisRevocationStore(RevocationStoreInterface):
+    """
+    Revocation store shared by all workers through Redis.
+
+    Every revocation is a key holding its revocation time that Redis expires on its own.
+    """
+
+    def __init__(self, url: str, prefix: str = "theater:revoked:"):
+        self._client = redis_asyncio.Redis.from_url(url)
+        self._prefix = prefix
+
+    async def add(self, key: str, revoked_at: float, ttl: float) -> None:
+        await self._client.set(f"{self._prefix}{key}", repr(revoked_at), px=max(1, int(ttl * 1000)))
+
+    async def get(self, key: str) -> Optional[float]:
+        value = await self._client.get(f"{self._prefix}{key}")
+        return float(value) if value is not None else None
+
+    async def keys(self) -> list[str]:
+        prefix_length = len(self._prefix)
+        return [
+            key.decode()[prefix_length:]
+            async for key in self._client.scan_iter(match=f"{self._prefix}*", count=1000)
+        ]
+
+    async def close(self) -> None:
+        await self._client.aclose()
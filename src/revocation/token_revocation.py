@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Optional
+
+from exceptions import TokenRevocationUnavailableError
+from revocation.bloom import BloomFilter
+from revocation.interfaces import RevocationStoreInterface
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationList:
+    """
+    Access-token revocation list with a per-worker Bloom filter in front of the store.
+
+    Two kinds of entries are kept: single tokens by their ``jti`` claim (logout) and all tokens
+    of a user issued before a point in time (password reset). Every lookup first asks the
+    in-memory Bloom filter, which answers "not revoked" for almost every token without any I/O;
+    only probable matches are confirmed against the store.
+
+    Revocations made by this worker enter its filter immediately. Revocations made by other
+    workers are picked up when the filter is rebuilt from the store, which :meth:`start` does
+    every ``sync_interval_seconds`` in a background task, so lookups never wait for a rebuild;
+    rebuilding also drops expired entries.
+    """
+
+    def __init__(
+            self,
+            store: RevocationStoreInterface,
+            user_revocation_ttl_seconds: float,
+            expected_entries: int = 100_000,
+            false_positive_rate: float = 0.01,
+            sync_interval_seconds: float = 5.0,
+    ):
+        """
+        Args:
+            store (RevocationStoreInterface): The store shared by all workers.
+            user_revocation_ttl_seconds (float): How long a user-wide revocation is kept; at
+                least the lifetime of an access token.
+            expected_entries (int): The number of live revocations the filter is sized for.
+            false_positive_rate (float): The share of valid tokens confirmed against the store.
+            sync_interval_seconds (float): Seconds between rebuilds of the filter from the store.
+        """
+        self._store = store
+        self._user_revocation_ttl = user_revocation_ttl_seconds
+        self._expected_entries = expected_entries
+        self._false_positive_rate = false_positive_rate
+        self._sync_interval = sync_interval_seconds
+        self._bloom = BloomFilter(expected_entries, false_positive_rate)
+        self._sync_task: Optional[asyncio.Task] = None
+        # Keys revoked by this worker while a sync reads the store, re-added to the new filter.
+        self._revoked_during_sync: Optional[set[str]] = None
+
+    def _remember(self, key: str) -> None:
+        self._bloom.add(key)
+        if self._revoked_during_sync is not None:
+            self._revoked_during_sync.add(key)
+
+    async def revoke_token(self, jti: str, expires_at: float) -> None:
+        """
+        Revoke a single access token until it expires.
+
+        Args:
+            jti (str): The token's ``jti`` claim.
+            expires_at (float): The token's ``exp`` claim.
+
+        Raises:
+            TokenRevocationUnavailableError: If the store is unavailable.
+        """
+        now = time.time()
+        if expires_at <= now:
+            return
+        await self._add(f"jti:{jti}", now, expires_at - now)
+
+    async def revoke_user_tokens(self, user_id: int) -> None:
+        """
+        Revoke every access token of a user issued until now.
+
+        Args:
+            user_id (int): The owner of the tokens.
+
+        Raises:
+            TokenRevocationUnavailableError: If the store is unavailable.
+        """
+        await self._add(f"user:{user_id}", time.time(), self._user_revocation_ttl)
+
+    async def _add(self, key: str, revoked_at: float, ttl: float) -> None:
+        try:
+            await self._store.add(key, revoked_at, ttl)
+        except Exception as error:
+            logger.error("Token revocation store unavailable, could not revoke %s", key, exc_info=True)
+            raise TokenRevocationUnavailableError() from error
+        self._remember(key)
+
+    async def is_revoked(self, jti: Optional[str], user_id: Optional[int], issued_at: Optional[float]) -> bool:
+        """
+        Check the claims of a decoded access token against the revocation list.
+
+        A probable match that cannot be confirmed because the store is unavailable counts as
+        revoked.
+
+        Args:
+            jti (Optional[str]): The token's ``jti`` claim.
+            user_id (Optional[int]): The id of the token's user.
+            issued_at (Optional[float]): The token's ``iat`` claim; tokens without one count as
+                issued before any user-wide revocation.
+
+        Returns:
+            bool: True if the token must be rejected.
+        """
+        try:
+            if jti is not None and f"jti:{jti}" in self._bloom:
+                if await self._store.get(f"jti:{jti}") is not None:
+                    return True
+            if user_id is not None and f"user:{user_id}" in self._bloom:
+                revoked_at = await self._store.get(f"user:{user_id}")
+                if revoked_at is not None and (issued_at is None or issued_at < revoked_at):
+                    return True
+        except Exception:
+            logger.warning("Token revocation store unavailable, rejecting token", exc_info=True)
+            return True
+        return False
+
+    async def sync(self) -> None:
+        """
+        Rebuild the Bloom filter from the store.
+
+        If the store is unavailable the current filter is kept until the next sync.
+        """
+        self._revoked_during_sync = set()
+        try:
+            keys = await self._store.keys()
+        except Exception:
+            logger.warning("Token revocation store unavailable, keeping the current filter", exc_info=True)
+            return
+        finally:
+            revoked_during_sync, self._revoked_during_sync = self._revoked_during_sync, None
+        self._bloom = BloomFilter.from_items(
+            [*keys, *revoked_during_sync], max(self._expected_entries, 2 * len(keys)), self._false_positive_rate
+        )
+
+    def start(self) -> None:
+        """
+        Start rebuilding the filter every ``sync_interval_seconds`` in a background task of the
+        running event loop, beginning now.
+        """
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_periodically())
+
+    async def _sync_periodically(self) -> None:
+        while True:
+            await self.sync()
+            await asyncio.sleep(self._sync_interval)
+
+    async def close(self) -> None:
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sync_task
+            self._sync_task = None
+        await self._store.close()
@@ -1,25 +1,34 @@
 from datetime import datetime, timezone
-from typing import cast
+from typing import Awaitable, Callable, cast
 
 from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy import select, delete
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
-from tasks.email_tasks import send_activation_email_task
 
-from config import get_jwt_auth_manager, get_settings, BaseAppSettings, get_accounts_email_notificator
+from caches import UserPrincipalCache
+from config import (
+    get_jwt_auth_manager,
+    get_settings,
+    BaseAppSettings,
+    get_password_service,
+    get_user_principal_cache,
+    get_token_revocation_list
+)
+from config.dependencies_auth import auth_rate_limit, optional_oauth2_scheme
+from config.dependencies_notifications import get_email_outbox
 from database import (
     get_db,
     UserModel,
     UserGroupModel,
     UserGroupEnum,
     ActivationTokenModel,
-    PasswordResetTokenModel,
-    RefreshTokenModel
+    PasswordResetTokenModel
 )
-from exceptions import BaseSecurityError
+from exceptions import BaseSecurityError, PasswordServiceBusyError, TokenRevocationUnavailableError
 from notifications import EmailSenderInterface
+from revocation import TokenRevocationList
 from schemas import (
     UserRegistrationRequestSchema,
     UserRegistrationResponseSchema,
@@ -33,10 +42,20 @@ from schemas import (
     TokenRefreshResponseSchema
 )
 from security.interfaces import JWTAuthManagerInterface
+from security.password_service import PasswordService
+from services.refresh_tokens import store_refresh_token, revoke_refresh_token, revoke_user_refresh_tokens
 
 router = APIRouter()
 
 
+def _password_service_unavailable(error: PasswordServiceBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post(
     "/register/",
     response_model=UserRegistrationResponseSchema,
@@ -54,6 +73,16 @@ router = APIRouter()
                 }
             },
         },
+        429: {
+            "description": "Too Many Requests - Too many attempts from this client or for this email.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests, please try again later."
+                    }
+                }
+            },
+        },
         500: {
             "description": "Internal Server Error - An error occurred during user creation.",
             "content": {
@@ -64,12 +93,24 @@ router = APIRouter()
                 }
             },
         },
+        503: {
+            "description": "Service Unavailable - Too many password operations are in progress.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "The server is busy, please try again later."
+                    }
+                }
+            },
+        },
     }
 )
 async def register_user(
         user_data: UserRegistrationRequestSchema,
         db: AsyncSession = Depends(get_db),
-        email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
+        email_sender: EmailSenderInterface = Depends(get_email_outbox),
+        password_service: PasswordService = Depends(get_password_service),
+        limit_email: Callable[[str], Awaitable[None]] = Depends(auth_rate_limit("register")),
 ) -> UserRegistrationResponseSchema:
     """
     Endpoint for user registration.
@@ -81,7 +122,9 @@ async def register_user(
     Args:
         user_data (UserRegistrationRequestSchema): The registration details including email and password.
         db (AsyncSession): The asynchronous database session.
-        email_sender (EmailSenderInterface): The asynchronous email sender.
+        email_sender (EmailSenderInterface): The email outbox, written with the request's commit.
+        password_service (PasswordService): The service hashing the password off the event loop.
+        limit_email (Callable[[str], Awaitable[None]]): Rate limits the request by email.
 
     Returns:
         UserRegistrationResponseSchema: The newly created user's details.
@@ -89,8 +132,12 @@ async def register_user(
     Raises:
         HTTPException:
             - 409 Conflict if a user with the same email exists.
+            - 429 Too Many Requests if the client or email exceeded the rate limit.
             - 500 Internal Server Error if an error occurs during user creation.
+            - 503 Service Unavailable if the password hashing pool is saturated.
     """
+    await limit_email(str(user_data.email))
+
     stmt = select(UserModel).where(UserModel.email == user_data.email)
     result = await db.execute(stmt)
     existing_user = result.scalars().first()
@@ -110,17 +157,28 @@ async def register_user(
         )
 
     try:
-        new_user = UserModel.create(
+        new_user = await UserModel.create_async(
             email=str(user_data.email),
             raw_password=user_data.password,
             group_id=user_group.id,
+            password_service=password_service,
         )
+    except PasswordServiceBusyError as error:
+        raise _password_service_unavailable(error) from error
+
+    try:
         db.add(new_user)
         await db.flush()
 
         activation_token = ActivationTokenModel(user_id=new_user.id)
         db.add(activation_token)
 
+        activation_link = "http://127.0.0.1/accounts/activate/"
+        await email_sender.send_activation_email(
+            new_user.email,
+            activation_link
+        )
+
         await db.commit()
         await db.refresh(new_user)
     except SQLAlchemyError as e:
@@ -130,13 +188,6 @@ async def register_user(
             detail="An error occurred during user creation."
         ) from e
     else:
-        activation_link = "http://127.0.0.1/accounts/activate/"
-
-        send_activation_email_task.delay(
-            new_user.email,
-            activation_link
-        )
-
         return UserRegistrationResponseSchema.model_validate(new_user)
 
 
@@ -174,7 +225,8 @@ async def register_user(
 async def activate_account(
         activation_data: UserActivationRequestSchema,
         db: AsyncSession = Depends(get_db),
-        email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
+        email_sender: EmailSenderInterface = Depends(get_email_outbox),
+        principal_cache: UserPrincipalCache = Depends(get_user_principal_cache),
 ) -> MessageResponseSchema:
     """
     Endpoint to activate a user's account.
@@ -187,7 +239,8 @@ async def activate_account(
     Args:
         activation_data (UserActivationRequestSchema): Contains the user's email and activation token.
         db (AsyncSession): The asynchronous database session.
-        email_sender (EmailSenderInterface): The asynchronous email sender.
+        email_sender (EmailSenderInterface): The email outbox, written with the request's commit.
+        principal_cache (UserPrincipalCache): The cache of authenticated users to invalidate.
 
     Returns:
         MessageResponseSchema: A response message confirming successful activation.
@@ -228,7 +281,6 @@ async def activate_account(
 
     user.is_active = True
     await db.delete(token_record)
-    await db.commit()
 
     login_link = "http://127.0.0.1/accounts/login/"
 
@@ -237,6 +289,9 @@ async def activate_account(
         login_link
     )
 
+    await db.commit()
+    await principal_cache.invalidate(user.id)
+
     return MessageResponseSchema(message="User account activated successfully.")
 
 
@@ -249,11 +304,24 @@ async def activate_account(
             "a new token will be generated and any existing tokens will be invalidated."
     ),
     status_code=status.HTTP_200_OK,
+    responses={
+        429: {
+            "description": "Too Many Requests - Too many attempts from this client or for this email.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests, please try again later."
+                    }
+                }
+            },
+        },
+    },
 )
 async def request_password_reset_token(
         data: PasswordResetRequestSchema,
         db: AsyncSession = Depends(get_db),
-        email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator)
+        email_sender: EmailSenderInterface = Depends(get_email_outbox),
+        limit_email: Callable[[str], Awaitable[None]] = Depends(auth_rate_limit("password_reset")),
 ) -> MessageResponseSchema:
     """
     Endpoint to request a password reset token.
@@ -264,11 +332,18 @@ async def request_password_reset_token(
     Args:
         data (PasswordResetRequestSchema): The request data containing the user's email.
         db (AsyncSession): The asynchronous database session.
-        email_sender (EmailSenderInterface): The asynchronous email sender.
+        email_sender (EmailSenderInterface): The email outbox, written with the request's commit.
+        limit_email (Callable[[str], Awaitable[None]]): Rate limits the request by email.
 
     Returns:
         MessageResponseSchema: A success message indicating that instructions will be sent.
+
+    Raises:
+        HTTPException:
+            - 429 Too Many Requests if the client or email exceeded the rate limit.
     """
+    await limit_email(str(data.email))
+
     stmt = select(UserModel).filter_by(email=data.email)
     result = await db.execute(stmt)
     user = result.scalars().first()
@@ -282,7 +357,6 @@ async def request_password_reset_token(
 
     reset_token = PasswordResetTokenModel(user_id=cast(int, user.id))
     db.add(reset_token)
-    await db.commit()
 
     password_reset_complete_link = "http://127.0.0.1/accounts/password-reset-complete/"
 
@@ -291,6 +365,8 @@ async def request_password_reset_token(
         password_reset_complete_link
     )
 
+    await db.commit()
+
     return MessageResponseSchema(
         message="If you are registered, you will receive an email with instructions."
     )
@@ -327,6 +403,16 @@ async def request_password_reset_token(
                 }
             },
         },
+        429: {
+            "description": "Too Many Requests - Too many attempts from this client or for this email.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests, please try again later."
+                    }
+                }
+            },
+        },
         500: {
             "description": "Internal Server Error - An error occurred while resetting the password.",
             "content": {
@@ -337,24 +423,57 @@ async def request_password_reset_token(
                 }
             },
         },
+        503: {
+            "description": (
+                "Service Unavailable - Too many password operations are in progress, or the "
+                "user's sessions could not be ended; the password is left unchanged."
+            ),
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "password_service_busy": {
+                            "summary": "Password Service Busy",
+                            "value": {
+                                "detail": "The server is busy, please try again later."
+                            }
+                        },
+                        "revocation_unavailable": {
+                            "summary": "Revocation Unavailable",
+                            "value": {
+                                "detail": "Could not end the session, please try again later."
+                            }
+                        }
+                    }
+                }
+            },
+        },
     },
 )
 async def reset_password(
         data: PasswordResetCompleteRequestSchema,
         db: AsyncSession = Depends(get_db),
-        email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator)
+        email_sender: EmailSenderInterface = Depends(get_email_outbox),
+        password_service: PasswordService = Depends(get_password_service),
+        principal_cache: UserPrincipalCache = Depends(get_user_principal_cache),
+        revocation_list: TokenRevocationList = Depends(get_token_revocation_list),
+        limit_email: Callable[[str], Awaitable[None]] = Depends(auth_rate_limit("password_reset")),
 ) -> MessageResponseSchema:
     """
     Endpoint for resetting a user's password.
 
     Validates the token and updates the user's password if the token is valid and not expired.
-    Deletes the token after a successful password reset.
+    Deletes the token after a successful password reset and ends every session of the user:
+    their refresh tokens are deleted and the access tokens issued so far are revoked.
 
     Args:
         data (PasswordResetCompleteRequestSchema): The request data containing the user's email,
          token, and new password.
         db (AsyncSession): The asynchronous database session.
-        email_sender (EmailSenderInterface): The asynchronous email sender.
+        email_sender (EmailSenderInterface): The email outbox, written with the request's commit.
+        password_service (PasswordService): The service hashing the password off the event loop.
+        principal_cache (UserPrincipalCache): The cache of authenticated users to invalidate.
+        revocation_list (TokenRevocationList): The list revoking the user's access tokens.
+        limit_email (Callable[[str], Awaitable[None]]): Rate limits the request by email.
 
     Returns:
         MessageResponseSchema: A response message indicating successful password reset.
@@ -362,8 +481,13 @@ async def reset_password(
     Raises:
         HTTPException:
             - 400 Bad Request if the email or token is invalid, or the token has expired.
+            - 429 Too Many Requests if the client or email exceeded the rate limit.
             - 500 Internal Server Error if an error occurs during the password reset process.
+            - 503 Service Unavailable if the password hashing pool is saturated, or if the
+              access tokens cannot be revoked; the password is then left unchanged.
     """
+    await limit_email(str(data.email))
+
     stmt = select(UserModel).filter_by(email=data.email)
     result = await db.execute(stmt)
     user = result.scalars().first()
@@ -396,22 +520,34 @@ async def reset_password(
         )
 
     try:
-        user.password = data.password
+        await user.set_password_async(data.password, password_service)
+    except PasswordServiceBusyError as error:
+        raise _password_service_unavailable(error) from error
+
+    login_link = "http://127.0.0.1/accounts/login/"
+
+    try:
         await db.run_sync(lambda s: s.delete(token_record))
+        await revoke_user_refresh_tokens(db, user.id)
+        await email_sender.send_password_reset_complete_email(
+            str(data.email),
+            login_link
+        )
+        await revocation_list.revoke_user_tokens(user.id)
         await db.commit()
+    except TokenRevocationUnavailableError as error:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(error)
+        ) from error
     except SQLAlchemyError:
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while resetting the password."
         )
-
-    login_link = "http://127.0.0.1/accounts/login/"
-
-    await email_sender.send_password_reset_complete_email(
-        str(data.email),
-        login_link
-    )
+    await principal_cache.invalidate(user.id)
 
     return MessageResponseSchema(message="Password reset successfully.")
 
@@ -443,6 +579,16 @@ async def reset_password(
                 }
             },
         },
+        429: {
+            "description": "Too Many Requests - Too many attempts from this client or for this email.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests, please try again later."
+                    }
+                }
+            },
+        },
         500: {
             "description": "Internal Server Error - An error occurred while processing the request.",
             "content": {
@@ -453,6 +599,16 @@ async def reset_password(
                 }
             },
         },
+        503: {
+            "description": "Service Unavailable - Too many password operations are in progress.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "The server is busy, please try again later."
+                    }
+                }
+            },
+        },
     },
 )
 async def login_user(
@@ -460,18 +616,24 @@ async def login_user(
         db: AsyncSession = Depends(get_db),
         settings: BaseAppSettings = Depends(get_settings),
         jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+        password_service: PasswordService = Depends(get_password_service),
+        limit_email: Callable[[str], Awaitable[None]] = Depends(auth_rate_limit("login")),
 ) -> UserLoginResponseSchema:
     """
     Endpoint for user login.
 
     Authenticates a user using their email and password.
     If authentication is successful, creates a new refresh token and returns both access and refresh tokens.
+    A correct password whose hash no longer matches the configured cost policy is re-hashed,
+    and the new hash is committed together with the refresh token.
 
     Args:
         login_data (UserLoginRequestSchema): The login credentials.
         db (AsyncSession): The asynchronous database session.
         settings (BaseAppSettings): The application settings.
         jwt_manager (JWTAuthManagerInterface): The JWT authentication manager.
+        password_service (PasswordService): The service verifying the password off the event loop.
+        limit_email (Callable[[str], Awaitable[None]]): Rate limits the request by email.
 
     Returns:
         UserLoginResponseSchema: A response containing the access and refresh tokens.
@@ -480,13 +642,24 @@ async def login_user(
         HTTPException:
             - 401 Unauthorized if the email or password is invalid.
             - 403 Forbidden if the user account is not activated.
+            - 429 Too Many Requests if the client or email exceeded the rate limit.
             - 500 Internal Server Error if an error occurs during token creation.
+            - 503 Service Unavailable if the password hashing pool is saturated.
     """
+    await limit_email(str(login_data.email))
+
     stmt = select(UserModel).filter_by(email=login_data.email)
     result = await db.execute(stmt)
     user = result.scalars().first()
 
-    if not user or not user.verify_password(login_data.password):
+    try:
+        password_valid = bool(user) and await user.verify_and_upgrade_password_async(
+            login_data.password, password_service
+        )
+    except PasswordServiceBusyError as error:
+        raise _password_service_unavailable(error) from error
+
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
@@ -501,13 +674,13 @@ async def login_user(
     jwt_refresh_token = jwt_manager.create_refresh_token({"user_id": user.id})
 
     try:
-        refresh_token = RefreshTokenModel.create(
+        await store_refresh_token(
+            db,
             user_id=user.id,
+            token=jwt_refresh_token,
             days_valid=settings.LOGIN_TIME_DAYS,
-            token=jwt_refresh_token
+            max_per_user=settings.REFRESH_TOKENS_MAX_PER_USER,
         )
-        db.add(refresh_token)
-        await db.flush()
         await db.commit()
     except SQLAlchemyError:
         await db.rollback()
@@ -565,27 +738,32 @@ async def login_user(
 async def refresh_access_token(
         token_data: TokenRefreshRequestSchema,
         db: AsyncSession = Depends(get_db),
+        settings: BaseAppSettings = Depends(get_settings),
         jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
 ) -> TokenRefreshResponseSchema:
     """
     Endpoint to refresh an access token.
 
     Validates the provided refresh token, extracts the user ID from it, and issues
-    a new access token. If the token is invalid or expired, an error is returned.
+    a new access token. Refresh tokens are rotated: the presented token is revoked and
+    a new refresh token is returned with the access token, so each refresh token can be
+    used only once. If the token is invalid or expired, an error is returned.
 
     Args:
         token_data (TokenRefreshRequestSchema): Contains the refresh token.
         db (AsyncSession): The asynchronous database session.
+        settings (BaseAppSettings): The application settings.
         jwt_manager (JWTAuthManagerInterface): JWT authentication manager.
 
     Returns:
-        TokenRefreshResponseSchema: A new access token.
+        TokenRefreshResponseSchema: A new access token and the refresh token replacing the presented one.
 
     Raises:
         HTTPException:
             - 400 Bad Request if the token is invalid or expired.
-            - 401 Unauthorized if the refresh token is not found.
+            - 401 Unauthorized if the refresh token is not found or was already used.
             - 404 Not Found if the user associated with the token does not exist.
+            - 500 Internal Server Error if an error occurs while storing the new refresh token.
     """
     try:
         decoded_token = jwt_manager.decode_refresh_token(token_data.refresh_token)
@@ -596,24 +774,151 @@ async def refresh_access_token(
             detail=str(error),
         )
 
-    stmt = select(RefreshTokenModel).filter_by(token=token_data.refresh_token)
-    result = await db.execute(stmt)
-    refresh_token_record = result.scalars().first()
-    if not refresh_token_record:
+    if not await revoke_refresh_token(db, token_data.refresh_token):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token not found.",
         )
 
-    stmt = select(UserModel).filter_by(id=user_id)
+    stmt = select(UserModel.id).filter_by(id=user_id)
     result = await db.execute(stmt)
-    user = result.scalars().first()
-    if not user:
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found.",
         )
 
+    new_refresh_token = jwt_manager.create_refresh_token({"user_id": user_id})
+    try:
+        await store_refresh_token(
+            db,
+            user_id=user_id,
+            token=new_refresh_token,
+            days_valid=settings.LOGIN_TIME_DAYS,
+            max_per_user=settings.REFRESH_TOKENS_MAX_PER_USER,
+        )
+        await db.commit()
+    except SQLAlchemyError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while processing the request.",
+        )
+
     new_access_token = jwt_manager.create_access_token({"user_id": user_id})
 
-    return TokenRefreshResponseSchema(access_token=new_access_token)
+    return TokenRefreshResponseSchema(access_token=new_access_token, refresh_token=new_refresh_token)
+
+
+@router.post(
+    "/logout/",
+    response_model=MessageResponseSchema,
+    summary="Logout User",
+    description=(
+            "Revoke a refresh token and, if sent as a bearer token, the current access token, "
+            "and drop the user's cached authentication state."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {
+            "description": "Bad Request - The provided refresh token is invalid or expired.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Token has expired."
+                    }
+                }
+            },
+        },
+        401: {
+            "description": "Unauthorized - Refresh token not found.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Refresh token not found."
+                    }
+                }
+            },
+        },
+        503: {
+            "description": (
+                "Service Unavailable - The access token could not be revoked; the refresh token "
+                "is kept, so the logout can be retried."
+            ),
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Could not end the session, please try again later."
+                    }
+                }
+            },
+        },
+    },
+)
+async def logout_user(
+        token_data: TokenRefreshRequestSchema,
+        db: AsyncSession = Depends(get_db),
+        jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+        principal_cache: UserPrincipalCache = Depends(get_user_principal_cache),
+        revocation_list: TokenRevocationList = Depends(get_token_revocation_list),
+        access_token: str | None = Depends(optional_oauth2_scheme),
+) -> MessageResponseSchema:
+    """
+    Endpoint for user logout.
+
+    Deletes the provided refresh token so it can no longer be used to obtain access tokens,
+    revokes the bearer access token of the request if it belongs to the same user, and
+    invalidates the user's cached principal.
+
+    Args:
+        token_data (TokenRefreshRequestSchema): Contains the refresh token to revoke.
+        db (AsyncSession): The asynchronous database session.
+        jwt_manager (JWTAuthManagerInterface): JWT authentication manager.
+        principal_cache (UserPrincipalCache): The cache of authenticated users to invalidate.
+        revocation_list (TokenRevocationList): The list revoking the access token.
+        access_token (str | None): The bearer access token of the request, if any.
+
+    Returns:
+        MessageResponseSchema: A response message confirming the logout.
+
+    Raises:
+        HTTPException:
+            - 400 Bad Request if the token is invalid or expired.
+            - 401 Unauthorized if the refresh token is not found.
+            - 503 Service Unavailable if the access token cannot be revoked; nothing is changed.
+    """
+    try:
+        decoded_token = jwt_manager.decode_refresh_token(token_data.refresh_token)
+        user_id = decoded_token.get("user_id")
+    except BaseSecurityError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error),
+        )
+
+    if not await revoke_refresh_token(db, token_data.refresh_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token not found.",
+        )
+
+    if access_token:
+        try:
+            access_claims = jwt_manager.decode_access_token(access_token)
+        except BaseSecurityError:
+            access_claims = {}
+        if access_claims.get("jti") and access_claims.get("user_id") == user_id:
+            try:
+                await revocation_list.revoke_token(access_claims["jti"], access_claims["exp"])
+            except TokenRevocationUnavailableError as error:
+                await db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=str(error),
+                ) from error
+    await db.commit()
+
+    await principal_cache.invalidate(user_id)
+
+    return MessageResponseSchema(message="Logged out successfully.")
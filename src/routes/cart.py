@@ -3,9 +3,10 @@ from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from caches import UserPrincipal
 from config import get_settings
 from config.dependencies_auth import get_current_user
-from database import get_db, Cart, CartItem, UserModel, MovieModel
+from database import get_db, Cart, CartItem, MovieModel
 from schemas import (
     CartReadSchema,
     CartItemCreateSchema,
@@ -30,7 +31,7 @@ app_settings = get_settings()
     },
 )
 async def get_cart(
-    user: UserModel = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    user: UserPrincipal = Depends(get_current_user), db: AsyncSession = Depends(get_db)
 ) -> CartReadSchema:
     """
     Retrieve the authenticated user's cart.
@@ -39,7 +40,7 @@ async def get_cart(
     If the user has no cart, or it is empty, an empty cart structure is returned.
 
     Args:
-        user (UserModel): The currently authenticated user.
+        user (UserPrincipal): The currently authenticated user.
         db (AsyncSession): Database session dependency.
 
     Returns:
@@ -86,7 +87,7 @@ async def get_cart(
 )
 async def add_movie_to_cart(
     cart_item: CartItemCreateSchema,
-    user: UserModel = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -97,7 +98,7 @@ async def add_movie_to_cart(
 
     Args:
         cart_item (CartItemCreateSchema): Payload containing the movie ID.
-        user (UserModel): The currently authenticated user.
+        user (UserPrincipal): The currently authenticated user.
         db (AsyncSession): Database session dependency.
 
     Returns:
@@ -165,7 +166,7 @@ async def add_movie_to_cart(
 async def delete_movie_from_cart(
     item_id: int,
     db: AsyncSession = Depends(get_db),
-    user: UserModel = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
 ) -> None:
     """
     Delete a specific movie from the authenticated user's cart.
@@ -176,7 +177,7 @@ async def delete_movie_from_cart(
     Args:
         item_id (int): ID of the cart item to delete.
         db (AsyncSession): Database session dependency.
-        user (UserModel): The currently authenticated user.
+        user (UserPrincipal): The currently authenticated user.
 
     Returns:
         None
@@ -216,7 +217,7 @@ async def delete_movie_from_cart(
     },
 )
 async def delete_all_movies(
-    db: AsyncSession = Depends(get_db), user: UserModel = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db), user: UserPrincipal = Depends(get_current_user)
 ) -> None:
     """
     Delete all movies from the authenticated user's cart.
@@ -226,7 +227,7 @@ async def delete_all_movies(
 
     Args:
         db (AsyncSession): Database session dependency.
-        user (UserModel): The currently authenticated user.
+        user (UserPrincipal): The currently authenticated user.
 
     Returns:
         None
@@ -1,25 +1,119 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
+import json
+from decimal import Decimal
+from typing import List, Optional
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy import select, func, insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from database import get_db, MovieModel
+from config import (
+    BaseAppSettings,
+    get_settings,
+    get_movie_count_provider,
+    get_movie_search_backend,
+    get_reference_data_cache,
+    get_response_cache,
+)
+from database import get_db, get_db_contextmanager, MovieModel
 from database import (
     CountryModel,
     GenreModel,
     ActorModel,
-    LanguageModel
+    LanguageModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel
 )
+from database.models.movies import MovieStatusEnum
 from schemas import (
     MovieListResponseSchema,
     MovieListItemSchema,
-    MovieDetailSchema
+    MovieSearchItemSchema,
+    MovieSearchResponseSchema,
+    MovieDetailSchema,
+    MovieBatchRequestSchema,
+    MovieBatchResponseSchema,
+    MovieFilterSchema,
+    MovieFacetsResponseSchema,
+    MovieBulkImportResponseSchema,
+    MovieSortFieldEnum,
+    MovieExportFormatEnum,
+    SortOrderEnum
+)
+from schemas.movies import MovieCreateSchema, MovieUpdateSchema, FacetCountSchema, YearBucketSchema
+from caches import ResponseCache
+from exceptions import InvalidCursorError
+from search import MovieSearchInterface
+from services.movie_catalog import MOVIE_SORT_FIELDS, build_movie_filter_conditions, build_movie_facets_stmt
+from services.movie_count import MovieCountProvider
+from services.movie_export import iter_movie_batches, export_movies
+from services.movie_import import MovieImporter
+from services.reference_data import ReferenceDataCache
+from services.pagination import (
+    CURSOR_DIRECTION_NEXT,
+    CURSOR_DIRECTION_PREV,
+    encode_cursor,
+    decode_cursor,
+    apply_keyset,
+    keyset_order_by,
 )
-from schemas.movies import MovieCreateSchema, MovieUpdateSchema
 
 router = APIRouter()
 
+MOVIES_CACHE_NAMESPACE = "movies"
+
+
+def get_movie_filters(
+        genre: List[str] = Query([], description="Genre names; movies having any of them match"),
+        actor: List[str] = Query([], description="Actor names; movies having any of them match"),
+        language: List[str] = Query([], description="Language names; movies having any of them match"),
+        country: List[str] = Query([], description="Country codes; movies from any of them match"),
+        year_from: Optional[int] = Query(None, ge=1, description="Earliest release year (inclusive)"),
+        year_to: Optional[int] = Query(None, ge=1, description="Latest release year (inclusive)"),
+        score_min: Optional[float] = Query(None, ge=0, le=100, description="Minimum score"),
+        score_max: Optional[float] = Query(None, ge=0, le=100, description="Maximum score"),
+        status: Optional[MovieStatusEnum] = Query(None, description="Release status"),
+        price_min: Optional[Decimal] = Query(None, ge=0, description="Minimum current price"),
+        price_max: Optional[Decimal] = Query(None, ge=0, description="Maximum current price"),
+) -> MovieFilterSchema:
+    """
+    Collect the catalog filter query parameters into a `MovieFilterSchema`.
+
+    :raises RequestValidationError: If a range is inverted (e.g. `year_from` > `year_to`).
+    """
+    try:
+        return MovieFilterSchema(
+            genres=genre,
+            actors=actor,
+            languages=language,
+            countries=country,
+            year_from=year_from,
+            year_to=year_to,
+            score_min=score_min,
+            score_max=score_max,
+            status=status,
+            price_min=price_min,
+            price_max=price_max,
+        )
+    except ValidationError as error:
+        raise RequestValidationError(error.errors(include_url=False, include_context=False))
+
+
+def _movie_list_link(request: Request, **params) -> str:
+    """
+    Build a movie list link that keeps the filter and sort parameters of the current request.
+    """
+    kept = [
+        (key, value) for key, value in request.query_params.multi_items()
+        if key not in ("page", "per_page", "cursor")
+    ]
+    return f"/theater/movies/?{urlencode(list(params.items()) + kept)}"
+
 
 @router.get(
     "/movies/",
@@ -29,9 +123,23 @@ router = APIRouter()
             "<h3>This endpoint retrieves a paginated list of movies from the database. "
             "Clients can specify the `page` number and the number of items per page using `per_page`. "
             "The response includes details about the movies, total pages, and total items, "
-            "along with links to the previous and next pages if applicable.</h3>"
+            "along with links to the previous and next pages if applicable. "
+            "Movies can be filtered by genre, actor, language, country, year, score, status and price, "
+            "and sorted by id, score, date, price or revenue. "
+            "Every response also carries opaque `next_cursor`/`prev_cursor` values; passing one back "
+            "as `cursor` switches to keyset pagination, whose latency does not depend on page depth. "
+            "Totals are served from a short-lived cache; in cursor mode `include_total=false` skips "
+            "counting altogether and leaves `total_items`/`total_pages` empty.</h3>"
     ),
     responses={
+        400: {
+            "description": "Invalid pagination cursor.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid pagination cursor."}
+                }
+            },
+        },
         404: {
             "description": "No movies found.",
             "content": {
@@ -43,9 +151,23 @@ router = APIRouter()
     }
 )
 async def get_movie_list(
+        request: Request,
         page: int = Query(1, ge=1, description="Page number (1-based index)"),
         per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor taken from `next_cursor` or `prev_cursor`; `page` is ignored when set"
+        ),
+        include_total: bool = Query(
+            True,
+            description="Whether to compute `total_items`/`total_pages`; only honoured in cursor mode"
+        ),
+        sort_by: MovieSortFieldEnum = Query(MovieSortFieldEnum.ID, description="Attribute to sort by"),
+        order: SortOrderEnum = Query(SortOrderEnum.DESC, description="Sort direction"),
+        filters: MovieFilterSchema = Depends(get_movie_filters),
         db: AsyncSession = Depends(get_db),
+        count_provider: MovieCountProvider = Depends(get_movie_count_provider),
+        response_cache: ResponseCache = Depends(get_response_cache),
 ) -> MovieListResponseSchema:
     """
     Fetch a paginated list of movies from the database (asynchronously).
@@ -54,52 +176,445 @@ async def get_movie_list(
     the page number and the number of items per page. It calculates the total pages
     and provides links to the previous and next pages when applicable.
 
+    Filters and the sort order are applied in the same statement that fetches the page.
+    When a `cursor` is supplied the page is located with a keyset seek on the sort
+    columns instead of ``OFFSET``, so deep pages cost the same as the first one.
+
+    Serialized pages are cached per query string and carry an ETag; a matching
+    `If-None-Match` header yields a 304 response without a body.
+
+    :param request: The incoming request, used to carry filters over to page links.
+    :type request: Request
     :param page: The page number to retrieve (1-based index, must be >= 1).
     :type page: int
     :param per_page: The number of items to display per page (must be between 1 and 20).
     :type per_page: int
+    :param cursor: An opaque keyset cursor returned by a previous call.
+    :type cursor: Optional[str]
+    :param include_total: Whether to compute totals; counting is skipped in cursor mode when False.
+    :type include_total: bool
+    :param sort_by: The attribute to sort by; ties are broken by id.
+    :type sort_by: MovieSortFieldEnum
+    :param order: The sort direction.
+    :type order: SortOrderEnum
+    :param filters: The catalog filters (provided via dependency injection).
+    :type filters: MovieFilterSchema
     :param db: The async SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
+    :param count_provider: The cached movie count provider (provided via dependency injection).
+    :type count_provider: MovieCountProvider
+    :param response_cache: The response cache serving repeated requests (provided via dependency injection).
+    :type response_cache: ResponseCache
 
     :return: A response containing the paginated list of movies and metadata.
     :rtype: MovieListResponseSchema
 
-    :raises HTTPException: Raises a 404 error if no movies are found for the requested page.
+    :raises HTTPException: Raises a 400 error if the cursor is malformed and a 404 error
+        if no movies are found for the requested page.
     """
-    offset = (page - 1) * per_page
+    async def build_page() -> MovieListResponseSchema:
+        conditions = build_movie_filter_conditions(filters)
 
-    count_stmt = select(func.count(MovieModel.id))
-    result_count = await db.execute(count_stmt)
-    total_items = result_count.scalar() or 0
+        total_items = None
+        if include_total or not cursor:
+            if conditions:
+                total_items = await count_provider.get_total(
+                    db,
+                    key=filters.cache_key(),
+                    count_stmt=select(func.count(MovieModel.id)).where(*conditions),
+                )
+            else:
+                total_items = await count_provider.get_total(db)
 
-    if not total_items:
-        raise HTTPException(status_code=404, detail="No movies found.")
+            if not total_items:
+                raise HTTPException(status_code=404, detail="No movies found.")
+
+        sort_field = MOVIE_SORT_FIELDS[sort_by]
+        sort_key = f"{sort_by.value}:{order.value}"
+        descending = order == SortOrderEnum.DESC
+        stmt = select(MovieModel).where(*conditions)
 
-    order_by = MovieModel.default_order_by()
-    stmt = select(MovieModel)
-    if order_by:
-        stmt = stmt.order_by(*order_by)
+        if cursor:
+            try:
+                cursor_sort_key, cursor_values, direction = decode_cursor(cursor)
+                if cursor_sort_key != sort_key:
+                    raise InvalidCursorError
+                stmt = apply_keyset(
+                    stmt, sort_field.columns, sort_field.parse(cursor_values), descending, direction
+                )
+            except (InvalidCursorError, ValueError, TypeError):
+                raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
 
-    stmt = stmt.offset(offset).limit(per_page)
+            result_movies = await db.execute(stmt.limit(per_page + 1))
+            movies = list(result_movies.scalars().all())
+            has_more = len(movies) > per_page
+            movies = movies[:per_page]
+
+            if direction == CURSOR_DIRECTION_PREV:
+                movies.reverse()
+                has_prev, has_next = has_more, True
+            else:
+                has_prev, has_next = True, has_more
+        else:
+            stmt = stmt.order_by(*keyset_order_by(sort_field.columns, descending))
+            stmt = stmt.offset((page - 1) * per_page).limit(per_page)
+
+            result_movies = await db.execute(stmt)
+            movies = list(result_movies.scalars().all())
+
+        if not movies:
+            raise HTTPException(status_code=404, detail="No movies found.")
+
+        movie_list = [MovieListItemSchema.model_validate(movie) for movie in movies]
+
+        total_pages = (total_items + per_page - 1) // per_page if total_items is not None else None
+
+        if not cursor:
+            has_prev, has_next = page > 1, page < total_pages
+
+        next_cursor = (
+            encode_cursor(sort_key, sort_field.values(movies[-1]), CURSOR_DIRECTION_NEXT) if has_next else None
+        )
+        prev_cursor = (
+            encode_cursor(sort_key, sort_field.values(movies[0]), CURSOR_DIRECTION_PREV) if has_prev else None
+        )
+
+        if cursor:
+            prev_page = _movie_list_link(request, cursor=prev_cursor, per_page=per_page) if prev_cursor else None
+            next_page = _movie_list_link(request, cursor=next_cursor, per_page=per_page) if next_cursor else None
+        else:
+            prev_page = _movie_list_link(request, page=page - 1, per_page=per_page) if has_prev else None
+            next_page = _movie_list_link(request, page=page + 1, per_page=per_page) if has_next else None
+
+        response = MovieListResponseSchema(
+            movies=movie_list,
+            prev_page=prev_page,
+            next_page=next_page,
+            prev_cursor=prev_cursor,
+            next_cursor=next_cursor,
+            total_pages=total_pages,
+            total_items=total_items,
+        )
+        return response
+
+    return await response_cache.respond(request, MOVIES_CACHE_NAMESPACE, build_page)
+
+
+@router.get(
+    "/movies/facets/",
+    response_model=MovieFacetsResponseSchema,
+    summary="Get facet counts for the movie catalog",
+    description=(
+            "<h3>Return the number of movies matching the given filters, broken down by genre "
+            "and by release-year bucket. All counts are computed in a single aggregate query.</h3>"
+    ),
+)
+async def get_movie_facets(
+        year_bucket: int = Query(10, ge=1, le=100, description="Width of the release-year buckets"),
+        filters: MovieFilterSchema = Depends(get_movie_filters),
+        db: AsyncSession = Depends(get_db),
+) -> MovieFacetsResponseSchema:
+    """
+    Compute facet counts for the filtered movie catalog.
+
+    :param year_bucket: The width of the release-year buckets in years.
+    :type year_bucket: int
+    :param filters: The catalog filters (provided via dependency injection).
+    :type filters: MovieFilterSchema
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: The total and the per-genre and per-year-bucket counts.
+    :rtype: MovieFacetsResponseSchema
+    """
+    result = await db.execute(build_movie_facets_stmt(filters, year_bucket))
 
-    result_movies = await db.execute(stmt)
-    movies = result_movies.scalars().all()
+    total_items = 0
+    genres = []
+    years = []
+    for facet, value, count in result.all():
+        if facet == "total":
+            total_items = count
+        elif facet == "genre":
+            genres.append(FacetCountSchema(value=value, count=count))
+        else:
+            year_from = int(value)
+            years.append(YearBucketSchema(year_from=year_from, year_to=year_from + year_bucket - 1, count=count))
 
-    if not movies:
+    genres.sort(key=lambda item: (-item.count, item.value))
+    years.sort(key=lambda item: item.year_from)
+
+    return MovieFacetsResponseSchema(total_items=total_items, genres=genres, years=years)
+
+
+EXPORT_MEDIA_TYPES = {
+    MovieExportFormatEnum.NDJSON: "application/x-ndjson",
+    MovieExportFormatEnum.CSV: "text/csv",
+}
+
+
+@router.get(
+    "/movies/export/",
+    summary="Export the movie catalog",
+    description=(
+            "<h3>Stream the whole (optionally filtered) movie catalog as NDJSON or CSV, ordered by id. "
+            "Rows are read through a server-side cursor and sent as they are fetched, so memory use "
+            "does not grow with the catalog size. With `gzip=true` the stream is compressed on the fly "
+            "and served as a `.gz` attachment.</h3>"
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "The exported catalog.",
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+                "application/gzip": {},
+            },
+        }
+    }
+)
+async def export_movie_catalog(
+        export_format: MovieExportFormatEnum = Query(
+            MovieExportFormatEnum.NDJSON, alias="format", description="Output format"
+        ),
+        compress: bool = Query(False, alias="gzip", description="Whether to gzip the output"),
+        filters: MovieFilterSchema = Depends(get_movie_filters),
+        settings: BaseAppSettings = Depends(get_settings),
+) -> StreamingResponse:
+    """
+    Stream the movie catalog in the requested format.
+
+    The stream opens its own database session, because request-scoped dependencies are
+    closed before a streaming response body is sent.
+
+    :param export_format: The output format, `ndjson` or `csv`.
+    :type export_format: MovieExportFormatEnum
+    :param compress: Whether to gzip the output on the fly.
+    :type compress: bool
+    :param filters: The catalog filters (provided via dependency injection).
+    :type filters: MovieFilterSchema
+    :param settings: The application settings (provided via dependency injection).
+    :type settings: BaseAppSettings
+
+    :return: A streaming response with the exported movies.
+    :rtype: StreamingResponse
+    """
+    async def body():
+        async with get_db_contextmanager() as db:
+            batches = iter_movie_batches(db, filters, batch_size=settings.MOVIES_EXPORT_BATCH_SIZE)
+            async for chunk in export_movies(batches, export_format, compress=compress):
+                yield chunk
+
+    filename = f"movies.{export_format.value}"
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    if compress:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/movies/search/",
+    response_model=MovieSearchResponseSchema,
+    summary="Search movies by name and overview",
+    description=(
+            "<h3>Full-text search over movie names and overviews. All words of `q` must match; "
+            "results are ranked by relevance with matches in the name weighted above matches "
+            "in the overview. When nothing matches exactly, similar spellings of the name are "
+            "tried so that typos still return results.</h3>"
+    ),
+    responses={
+        404: {
+            "description": "No movies found.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "No movies found."}
+                }
+            },
+        }
+    }
+)
+async def search_movies(
+        q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+        page: int = Query(1, ge=1, description="Page number (1-based index)"),
+        per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        db: AsyncSession = Depends(get_db),
+        search_backend: MovieSearchInterface = Depends(get_movie_search_backend),
+) -> MovieSearchResponseSchema:
+    """
+    Search movies by a free-text query and return a ranked page of results.
+
+    The backend returns ranked movie ids (one extra is requested to detect a next page);
+    the movies are then loaded in a single query and returned in rank order.
+
+    :param q: The search text.
+    :type q: str
+    :param page: The page number to retrieve (1-based index, must be >= 1).
+    :type page: int
+    :param per_page: The number of items to display per page (must be between 1 and 20).
+    :type per_page: int
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+    :param search_backend: The movie search backend (provided via dependency injection).
+    :type search_backend: MovieSearchInterface
+
+    :return: The ranked page of matching movies with pagination links.
+    :rtype: MovieSearchResponseSchema
+
+    :raises HTTPException: Raises a 404 error if no movies match the query.
+    """
+    offset = (page - 1) * per_page
+    hits = await search_backend.search(db, q, limit=per_page + 1, offset=offset)
+    if not hits:
         raise HTTPException(status_code=404, detail="No movies found.")
 
-    movie_list = [MovieListItemSchema.model_validate(movie) for movie in movies]
+    has_next = len(hits) > per_page
+    hits = hits[:per_page]
+
+    result = await db.execute(select(MovieModel).where(MovieModel.id.in_([movie_id for movie_id, _ in hits])))
+    movies_by_id = {movie.id: movie for movie in result.scalars().all()}
+
+    movie_list = [
+        MovieSearchItemSchema(
+            **MovieListItemSchema.model_validate(movies_by_id[movie_id]).model_dump(),
+            rank=rank,
+        )
+        for movie_id, rank in hits
+        if movie_id in movies_by_id
+    ]
 
-    total_pages = (total_items + per_page - 1) // per_page
+    def search_link(target_page: int) -> str:
+        return f"/theater/movies/search/?{urlencode({'q': q, 'page': target_page, 'per_page': per_page})}"
 
-    response = MovieListResponseSchema(
+    return MovieSearchResponseSchema(
+        query=q,
         movies=movie_list,
-        prev_page=f"/theater/movies/?page={page - 1}&per_page={per_page}" if page > 1 else None,
-        next_page=f"/theater/movies/?page={page + 1}&per_page={per_page}" if page < total_pages else None,
-        total_pages=total_pages,
-        total_items=total_items,
+        prev_page=search_link(page - 1) if page > 1 else None,
+        next_page=search_link(page + 1) if has_next else None,
+    )
+
+
+MOVIE_BATCH_MAX_QUERY_IDS = 100
+
+
+def get_movie_batch_ids(
+        ids: str = Query(
+            ...,
+            pattern=r"^\s*\d+\s*(,\s*\d+\s*)*$",
+            description=f"Comma-separated movie ids, at most {MOVIE_BATCH_MAX_QUERY_IDS}",
+            examples=["1,2,3"],
+        ),
+) -> List[int]:
+    """
+    Parse the comma-separated `ids` query parameter.
+
+    :raises RequestValidationError: If more than `MOVIE_BATCH_MAX_QUERY_IDS` ids are given.
+    """
+    movie_ids = [int(movie_id) for movie_id in ids.split(",")]
+    if len(movie_ids) > MOVIE_BATCH_MAX_QUERY_IDS:
+        raise RequestValidationError([{
+            "type": "too_long",
+            "loc": ("query", "ids"),
+            "msg": f"At most {MOVIE_BATCH_MAX_QUERY_IDS} ids can be requested; use POST for larger sets.",
+            "input": ids,
+        }])
+    return movie_ids
+
+
+async def _load_movie_batch(db: AsyncSession, movie_ids: List[int]) -> MovieBatchResponseSchema:
+    """
+    Load movies with all relationships in a constant number of queries, keyed by id.
+    """
+    unique_ids = list(dict.fromkeys(movie_ids))
+    result = await db.execute(
+        select(MovieModel)
+        .options(*MovieModel.detail_load_options())
+        .where(MovieModel.id.in_(unique_ids))
     )
-    return response
+    movies_by_id = {movie.id: movie for movie in result.scalars().all()}
+
+    return MovieBatchResponseSchema(
+        movies={
+            movie_id: MovieDetailSchema.model_validate(movies_by_id[movie_id])
+            for movie_id in unique_ids
+            if movie_id in movies_by_id
+        },
+        missing=[movie_id for movie_id in unique_ids if movie_id not in movies_by_id],
+    )
+
+
+@router.get(
+    "/movies/batch/",
+    response_model=MovieBatchResponseSchema,
+    summary="Get details of several movies",
+    description=(
+            "<h3>Return the details of up to 100 movies in one request, keyed by id. "
+            "Ids that do not exist are listed in `missing` instead of failing the request. "
+            "Use the POST variant for larger id sets.</h3>"
+    ),
+)
+async def get_movie_batch(
+        request: Request,
+        movie_ids: List[int] = Depends(get_movie_batch_ids),
+        db: AsyncSession = Depends(get_db),
+        response_cache: ResponseCache = Depends(get_response_cache),
+) -> MovieBatchResponseSchema:
+    """
+    Retrieve the details of several movies by their ids.
+
+    The movies are loaded with one query plus one batched query per collection,
+    regardless of how many ids are requested. Responses are cached like single
+    movie details and support `If-None-Match`.
+
+    :param request: The incoming request, used as the cache key and for conditional headers.
+    :type request: Request
+    :param movie_ids: The requested movie ids (provided via dependency injection).
+    :type movie_ids: List[int]
+    :param db: The SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+    :param response_cache: The response cache serving repeated requests (provided via dependency injection).
+    :type response_cache: ResponseCache
+
+    :return: The found movies keyed by id and the ids that were not found.
+    :rtype: MovieBatchResponseSchema
+    """
+    async def build_batch() -> MovieBatchResponseSchema:
+        return await _load_movie_batch(db, movie_ids)
+
+    return await response_cache.respond(request, MOVIES_CACHE_NAMESPACE, build_batch)
+
+
+@router.post(
+    "/movies/batch/",
+    response_model=MovieBatchResponseSchema,
+    summary="Get details of many movies",
+    description=(
+            "<h3>Return the details of up to 1000 movies whose ids are sent in the request body, "
+            "keyed by id. Ids that do not exist are listed in `missing`.</h3>"
+    ),
+)
+async def post_movie_batch(
+        batch: MovieBatchRequestSchema,
+        db: AsyncSession = Depends(get_db),
+) -> MovieBatchResponseSchema:
+    """
+    Retrieve the details of many movies by ids sent in the request body.
+
+    :param batch: The requested movie ids.
+    :type batch: MovieBatchRequestSchema
+    :param db: The SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: The found movies keyed by id and the ids that were not found.
+    :rtype: MovieBatchResponseSchema
+    """
+    return await _load_movie_batch(db, batch.ids)
 
 
 @router.post(
@@ -129,7 +644,11 @@ async def get_movie_list(
 )
 async def create_movie(
         movie_data: MovieCreateSchema,
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_db),
+        count_provider: MovieCountProvider = Depends(get_movie_count_provider),
+        search_backend: MovieSearchInterface = Depends(get_movie_search_backend),
+        response_cache: ResponseCache = Depends(get_response_cache),
+        reference_cache: ReferenceDataCache = Depends(get_reference_data_cache),
 ) -> MovieDetailSchema:
     """
     Add a new movie to the database.
@@ -138,10 +657,22 @@ async def create_movie(
     name, release date, genres, actors, and languages. It automatically
     handles linking or creating related entities.
 
+    Related names are resolved through the reference data cache, which looks up
+    all misses of a kind in one query and creates the missing rows in one bulk
+    insert; the associations are then written with one multi-row insert per table.
+
     :param movie_data: The data required to create a new movie.
     :type movie_data: MovieCreateSchema
     :param db: The SQLAlchemy async database session (provided via dependency injection).
     :type db: AsyncSession
+    :param count_provider: The cached movie count provider, invalidated once the movie is stored.
+    :type count_provider: MovieCountProvider
+    :param search_backend: The movie search backend, invalidated once the movie is stored.
+    :type search_backend: MovieSearchInterface
+    :param response_cache: The response cache, invalidated once the movie is stored.
+    :type response_cache: ResponseCache
+    :param reference_cache: The cache resolving genre, actor, language and country names to ids.
+    :type reference_cache: ReferenceDataCache
 
     :return: The created movie with all details.
     :rtype: MovieDetailSchema
@@ -167,49 +698,10 @@ async def create_movie(
         )
 
     try:
-        country_stmt = select(CountryModel).where(CountryModel.code == movie_data.country)
-        country_result = await db.execute(country_stmt)
-        country = country_result.scalars().first()
-        if not country:
-            country = CountryModel(code=movie_data.country)
-            db.add(country)
-            await db.flush()
-
-        genres = []
-        for genre_name in movie_data.genres:
-            genre_stmt = select(GenreModel).where(GenreModel.name == genre_name)
-            genre_result = await db.execute(genre_stmt)
-            genre = genre_result.scalars().first()
-
-            if not genre:
-                genre = GenreModel(name=genre_name)
-                db.add(genre)
-                await db.flush()
-            genres.append(genre)
-
-        actors = []
-        for actor_name in movie_data.actors:
-            actor_stmt = select(ActorModel).where(ActorModel.name == actor_name)
-            actor_result = await db.execute(actor_stmt)
-            actor = actor_result.scalars().first()
-
-            if not actor:
-                actor = ActorModel(name=actor_name)
-                db.add(actor)
-                await db.flush()
-            actors.append(actor)
-
-        languages = []
-        for language_name in movie_data.languages:
-            lang_stmt = select(LanguageModel).where(LanguageModel.name == language_name)
-            lang_result = await db.execute(lang_stmt)
-            language = lang_result.scalars().first()
-
-            if not language:
-                language = LanguageModel(name=language_name)
-                db.add(language)
-                await db.flush()
-            languages.append(language)
+        country_ids = await reference_cache.resolve_ids(db, CountryModel, [movie_data.country])
+        genre_ids = await reference_cache.resolve_ids(db, GenreModel, movie_data.genres)
+        actor_ids = await reference_cache.resolve_ids(db, ActorModel, movie_data.actors)
+        language_ids = await reference_cache.resolve_ids(db, LanguageModel, movie_data.languages)
 
         movie = MovieModel(
             name=movie_data.name,
@@ -219,14 +711,26 @@ async def create_movie(
             status=movie_data.status,
             budget=movie_data.budget,
             revenue=movie_data.revenue,
-            country=country,
-            genres=genres,
-            actors=actors,
-            languages=languages,
+            country_id=country_ids[movie_data.country],
         )
         db.add(movie)
+        await db.flush()
+
+        for table, column, ids in (
+                (MoviesGenresModel, "genre_id", genre_ids),
+                (ActorsMoviesModel, "actor_id", actor_ids),
+                (MoviesLanguagesModel, "language_id", language_ids),
+        ):
+            if ids:
+                await db.execute(
+                    insert(table).values([{"movie_id": movie.id, column: model_id} for model_id in ids.values()])
+                )
+
         await db.commit()
-        await db.refresh(movie, ["genres", "actors", "languages"])
+        count_provider.invalidate()
+        search_backend.invalidate()
+        await response_cache.invalidate(MOVIES_CACHE_NAMESPACE)
+        await db.refresh(movie, ["country", "genres", "actors", "languages"])
 
         return MovieDetailSchema.model_validate(movie)
 
@@ -235,6 +739,121 @@ async def create_movie(
         raise HTTPException(status_code=400, detail="Invalid input data.")
 
 
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+@router.post(
+    "/movies/bulk/",
+    response_model=MovieBulkImportResponseSchema,
+    summary="Import many movies at once",
+    description=(
+            "<h3>Create movies in bulk from a JSON array or an NDJSON stream "
+            "(`Content-Type: application/x-ndjson`) of movie records. Records are validated "
+            "individually, deduplicated on name and release date, and written in chunks with "
+            "multi-row inserts. The response reports the status of every record by its position: "
+            "`created`, `duplicate` (already stored or repeated in the request), `invalid` or "
+            "`failed`.</h3>"
+    ),
+    responses={
+        400: {
+            "description": "The body is neither a JSON array nor NDJSON.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Expected a JSON array or an NDJSON stream of movies."}
+                }
+            },
+        }
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/MovieCreateSchema"}}
+                },
+                "application/x-ndjson": {
+                    "schema": {"$ref": "#/components/schemas/MovieCreateSchema"}
+                },
+            },
+        }
+    },
+)
+async def bulk_create_movies(
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+        settings: BaseAppSettings = Depends(get_settings),
+        count_provider: MovieCountProvider = Depends(get_movie_count_provider),
+        search_backend: MovieSearchInterface = Depends(get_movie_search_backend),
+        response_cache: ResponseCache = Depends(get_response_cache),
+        reference_cache: ReferenceDataCache = Depends(get_reference_data_cache),
+) -> MovieBulkImportResponseSchema:
+    """
+    Import a batch of movies and report a status for every record.
+
+    NDJSON bodies are consumed while they are received and imported chunk by chunk;
+    JSON arrays are decoded first. Each chunk is committed on its own.
+
+    :param request: The incoming request whose body holds the movie records.
+    :type request: Request
+    :param db: The SQLAlchemy async database session (provided via dependency injection).
+    :type db: AsyncSession
+    :param settings: The application settings (provided via dependency injection).
+    :type settings: BaseAppSettings
+    :param count_provider: The cached movie count provider, invalidated when movies are created.
+    :type count_provider: MovieCountProvider
+    :param search_backend: The movie search backend, invalidated when movies are created.
+    :type search_backend: MovieSearchInterface
+    :param response_cache: The response cache, invalidated when movies are created.
+    :type response_cache: ResponseCache
+    :param reference_cache: The cache resolving genre, actor, language and country names to ids.
+    :type reference_cache: ReferenceDataCache
+
+    :return: Counts per status and the per-record results.
+    :rtype: MovieBulkImportResponseSchema
+
+    :raises HTTPException: Raises a 400 error if a JSON body is not an array.
+    """
+    importer = MovieImporter(db, reference_cache, chunk_size=settings.MOVIES_BULK_IMPORT_CHUNK_SIZE)
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    if content_type in NDJSON_CONTENT_TYPES:
+        async def add_line(line: bytes) -> None:
+            if not line.strip():
+                return
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                importer.reject([{"type": "json_invalid", "loc": [], "msg": f"Invalid JSON: {error}"}])
+                return
+            await importer.add(record)
+
+        buffer = b""
+        async for body_chunk in request.stream():
+            buffer += body_chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                await add_line(line)
+        await add_line(buffer)
+    else:
+        try:
+            records = json.loads(await request.body())
+        except ValueError:
+            records = None
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array or an NDJSON stream of movies.")
+        for record in records:
+            await importer.add(record)
+
+    await importer.flush()
+
+    report = importer.report()
+    if report.created:
+        count_provider.invalidate()
+        search_backend.invalidate()
+        await response_cache.invalidate(MOVIES_CACHE_NAMESPACE)
+    return report
+
+
 @router.get(
     "/movies/{movie_id}/",
     response_model=MovieDetailSchema,
@@ -257,8 +876,10 @@ async def create_movie(
     }
 )
 async def get_movie_by_id(
+        request: Request,
         movie_id: int,
         db: AsyncSession = Depends(get_db),
+        response_cache: ResponseCache = Depends(get_response_cache),
 ) -> MovieDetailSchema:
     """
     Retrieve detailed information about a specific movie by its ID.
@@ -266,37 +887,42 @@ async def get_movie_by_id(
     This function fetches detailed information about a movie identified by its unique ID.
     If the movie does not exist, a 404 error is returned.
 
+    Serialized responses are cached and carry an ETag; a matching `If-None-Match`
+    header yields a 304 response without a body.
+
+    :param request: The incoming request, used as the cache key and for conditional headers.
+    :type request: Request
     :param movie_id: The unique identifier of the movie to retrieve.
     :type movie_id: int
     :param db: The SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
+    :param response_cache: The response cache serving repeated requests (provided via dependency injection).
+    :type response_cache: ResponseCache
 
     :return: The details of the requested movie.
     :rtype: MovieDetailResponseSchema
 
     :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
     """
-    stmt = (
-        select(MovieModel)
-        .options(
-            joinedload(MovieModel.country),
-            joinedload(MovieModel.genres),
-            joinedload(MovieModel.actors),
-            joinedload(MovieModel.languages),
+    async def build_detail() -> MovieDetailSchema:
+        stmt = (
+            select(MovieModel)
+            .options(*MovieModel.detail_load_options())
+            .where(MovieModel.id == movie_id)
         )
-        .where(MovieModel.id == movie_id)
-    )
 
-    result = await db.execute(stmt)
-    movie = result.scalars().first()
+        result = await db.execute(stmt)
+        movie = result.scalars().first()
 
-    if not movie:
-        raise HTTPException(
-            status_code=404,
-            detail="Movie with the given ID was not found."
-        )
+        if not movie:
+            raise HTTPException(
+                status_code=404,
+                detail="Movie with the given ID was not found."
+            )
+
+        return MovieDetailSchema.model_validate(movie)
 
-    return MovieDetailSchema.model_validate(movie)
+    return await response_cache.respond(request, MOVIES_CACHE_NAMESPACE, build_detail)
 
 
 @router.delete(
@@ -325,6 +951,9 @@ async def get_movie_by_id(
 async def delete_movie(
         movie_id: int,
         db: AsyncSession = Depends(get_db),
+        count_provider: MovieCountProvider = Depends(get_movie_count_provider),
+        search_backend: MovieSearchInterface = Depends(get_movie_search_backend),
+        response_cache: ResponseCache = Depends(get_response_cache),
 ):
     """
     Delete a specific movie by its ID.
@@ -336,6 +965,12 @@ async def delete_movie(
     :type movie_id: int
     :param db: The SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
+    :param count_provider: The cached movie count provider, invalidated once the movie is removed.
+    :type count_provider: MovieCountProvider
+    :param search_backend: The movie search backend, invalidated once the movie is removed.
+    :type search_backend: MovieSearchInterface
+    :param response_cache: The response cache, invalidated once the movie is removed.
+    :type response_cache: ResponseCache
 
     :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
 
@@ -354,6 +989,9 @@ async def delete_movie(
 
     await db.delete(movie)
     await db.commit()
+    count_provider.invalidate()
+    search_backend.invalidate()
+    await response_cache.invalidate(MOVIES_CACHE_NAMESPACE)
 
     return {"detail": "Movie deleted successfully."}
 
@@ -389,6 +1027,9 @@ async def update_movie(
         movie_id: int,
         movie_data: MovieUpdateSchema,
         db: AsyncSession = Depends(get_db),
+        count_provider: MovieCountProvider = Depends(get_movie_count_provider),
+        search_backend: MovieSearchInterface = Depends(get_movie_search_backend),
+        response_cache: ResponseCache = Depends(get_response_cache),
 ):
     """
     Update a specific movie by its ID.
@@ -402,6 +1043,12 @@ async def update_movie(
     :type movie_data: MovieUpdateSchema
     :param db: The SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
+    :param count_provider: The cached movie count provider; filtered totals may change on update.
+    :type count_provider: MovieCountProvider
+    :param search_backend: The movie search backend; the name or overview may change on update.
+    :type search_backend: MovieSearchInterface
+    :param response_cache: The response cache, invalidated once the movie is updated.
+    :type response_cache: ResponseCache
 
     :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
 
@@ -423,6 +1070,9 @@ async def update_movie(
 
     try:
         await db.commit()
+        count_provider.invalidate()
+        search_backend.invalidate()
+        await response_cache.invalidate(MOVIES_CACHE_NAMESPACE)
         await db.refresh(movie)
     except IntegrityError:
         await db.rollback()
@@ -1,4 +1,3 @@
-import asyncio
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -7,11 +6,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from starlette import status
 
-from config import get_settings, get_order_by_id_and_user, get_accounts_email_notificator, get_payment_service
+from caches import UserPrincipal
+from config import get_settings, get_order_by_id_and_user, get_payment_service
 from config.dependencies_auth import get_current_user
+from config.dependencies_notifications import get_email_outbox
 from notifications import EmailSenderInterface
 from database import (
-    UserModel,
     get_db,
     Cart,
     CartItem,
@@ -142,7 +142,7 @@ async def return_order_by_id(
 )
 async def cancel_order(order_id: int,
                        db: AsyncSession = Depends(get_db),
-                       user: UserModel = Depends(get_current_user)) -> MessageResponseSchema:
+                       user: UserPrincipal = Depends(get_current_user)) -> MessageResponseSchema:
     """
     Description
     Cancels an order by its ID.
@@ -184,7 +184,7 @@ async def pay_order(order_id: int,
                     db: AsyncSession = Depends(get_db),
                     user=Depends(get_current_user),
                     payment_service: PaymentService = Depends(get_payment_service),
-                    email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator)
+                    email_sender: EmailSenderInterface = Depends(get_email_outbox)
 ):
     """
         Process payment for an order
@@ -195,7 +195,7 @@ async def pay_order(order_id: int,
         3. Validate payment data
         4. Process payment through payment gateway
         5. Update order status to PAID
-        6. Send confirmation email
+        6. Queue the confirmation email in the outbox, committed with the payment
             """
 
     order = await get_order_by_id_and_user(order_id, db, user)
@@ -245,15 +245,13 @@ async def pay_order(order_id: int,
                 price_at_payment=order_item.price_at_order
             )
             db.add(payment_item)
-        await db.commit()
-        await asyncio.create_task(
-            email_sender.send_payment_confirmation_email(
-                email=user.email,
-                order_id=order.id,
-                amount=Decimal(str(order.total_amount)),
-                transaction_id=payment_result["transaction_id"]
-            )
+        await email_sender.send_payment_confirmation_email(
+            email=user.email,
+            order_id=order.id,
+            amount=Decimal(str(order.total_amount)),
+            transaction_id=payment_result["transaction_id"]
         )
+        await db.commit()
         await db.refresh(order)
         return OrderResponseSchema.from_orm(order)
     except HTTPException:
@@ -1,9 +1,21 @@
 from schemas.movies import (
     MovieDetailSchema,
+    MovieBatchRequestSchema,
+    MovieBatchResponseSchema,
     MovieListResponseSchema,
     MovieListItemSchema,
+    MovieSearchItemSchema,
+    MovieSearchResponseSchema,
     MovieCreateSchema,
-    MovieUpdateSchema
+    MovieUpdateSchema,
+    MovieFilterSchema,
+    MovieFacetsResponseSchema,
+    MovieImportResultSchema,
+    MovieImportStatusEnum,
+    MovieExportFormatEnum,
+    MovieBulkImportResponseSchema,
+    MovieSortFieldEnum,
+    SortOrderEnum
 )
 from schemas.accounts import (
     UserRegistrationRequestSchema,
@@ -68,4 +68,5 @@ class TokenRefreshRequestSchema(BaseModel):
 
 class TokenRefreshResponseSchema(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
@@ -14,10 +14,21 @@ movie_list_response_schema_example = {
     ],
     "prev_page": "/theater/movies/?page=1&per_page=1",
     "next_page": "/theater/movies/?page=3&per_page=1",
+    "prev_cursor": "eyJzIjoiaWQ6ZGVzYyIsInYiOls5OTMyXSwiZCI6InByZXYifQ",
+    "next_cursor": "eyJzIjoiaWQ6ZGVzYyIsInYiOls5OTMyXSwiZCI6Im5leHQifQ",
     "total_pages": 9933,
     "total_items": 9933
 }
 
+movie_search_response_schema_example = {
+    "query": "swan princess",
+    "movies": [
+        {**movie_item_schema_example, "rank": 4.39}
+    ],
+    "prev_page": None,
+    "next_page": "/theater/movies/search/?q=swan+princess&page=2&per_page=1"
+}
+
 movie_create_schema_example = {
     "name": "New Movie",
     "date": "2025-01-01",
@@ -65,6 +76,13 @@ movie_detail_schema_example = {
     "languages": [language_schema_example]
 }
 
+movie_batch_response_schema_example = {
+    "movies": {
+        "9933": movie_detail_schema_example
+    },
+    "missing": [1]
+}
+
 movie_update_schema_example = {
     "name": "Update Movie",
     "date": "2025-01-01",
@@ -74,3 +92,32 @@ movie_update_schema_example = {
     "budget": 1000000.00,
     "revenue": 5000000.00,
 }
+
+movie_facets_response_schema_example = {
+    "total_items": 412,
+    "genres": [
+        {"value": "Drama", "count": 180},
+        {"value": "Comedy", "count": 96}
+    ],
+    "years": [
+        {"year_from": 2010, "year_to": 2019, "count": 245},
+        {"year_from": 2020, "year_to": 2029, "count": 167}
+    ]
+}
+
+movie_bulk_import_response_schema_example = {
+    "created": 1,
+    "duplicates": 1,
+    "invalid": 1,
+    "failed": 0,
+    "results": [
+        {"index": 0, "status": "created", "movie_id": 9934, "errors": None},
+        {"index": 1, "status": "duplicate", "movie_id": None, "errors": None},
+        {
+            "index": 2,
+            "status": "invalid",
+            "movie_id": None,
+            "errors": [{"type": "missing", "loc": ["score"], "msg": "Field required"}]
+        }
+    ]
+}
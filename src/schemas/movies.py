@@ -1,8 +1,9 @@
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, List
+from enum import Enum
+from typing import Dict, Optional, List
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from database.models.movies import MovieStatusEnum
 from schemas.examples.movies import (
@@ -12,12 +13,41 @@ from schemas.examples.movies import (
     actor_schema_example,
     movie_item_schema_example,
     movie_list_response_schema_example,
+    movie_search_response_schema_example,
     movie_create_schema_example,
     movie_detail_schema_example,
-    movie_update_schema_example
+    movie_batch_response_schema_example,
+    movie_update_schema_example,
+    movie_facets_response_schema_example,
+    movie_bulk_import_response_schema_example
 )
 
 
+class MovieSortFieldEnum(str, Enum):
+    ID = "id"
+    SCORE = "score"
+    DATE = "date"
+    PRICE = "price"
+    REVENUE = "revenue"
+
+
+class SortOrderEnum(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class MovieExportFormatEnum(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class MovieImportStatusEnum(str, Enum):
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+    FAILED = "failed"
+
+
 class LanguageSchema(BaseModel):
     id: int
     name: str
@@ -103,7 +133,7 @@ class MovieDetailSchema(MovieBaseSchema):
     genres: List[GenreSchema]
     actors: List[ActorSchema]
     languages: List[LanguageSchema]
-    current_price: Decimal
+    current_price: Optional[Decimal] = None
 
     model_config = {
         "from_attributes": True,
@@ -115,6 +145,31 @@ class MovieDetailSchema(MovieBaseSchema):
     }
 
 
+class MovieBatchRequestSchema(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {"ids": [9933, 9932, 1]}
+            ]
+        }
+    }
+
+
+class MovieBatchResponseSchema(BaseModel):
+    movies: Dict[int, MovieDetailSchema]
+    missing: List[int]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_batch_response_schema_example
+            ]
+        }
+    }
+
+
 class MovieListItemSchema(BaseModel):
     id: int
     name: str
@@ -136,8 +191,10 @@ class MovieListResponseSchema(BaseModel):
     movies: List[MovieListItemSchema]
     prev_page: Optional[str]
     next_page: Optional[str]
-    total_pages: int
-    total_items: int
+    prev_cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
+    total_pages: Optional[int]
+    total_items: Optional[int]
 
     model_config = {
         "from_attributes": True,
@@ -149,6 +206,25 @@ class MovieListResponseSchema(BaseModel):
     }
 
 
+class MovieSearchItemSchema(MovieListItemSchema):
+    rank: float
+
+
+class MovieSearchResponseSchema(BaseModel):
+    query: str
+    movies: List[MovieSearchItemSchema]
+    prev_page: Optional[str]
+    next_page: Optional[str]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_search_response_schema_example
+            ]
+        }
+    }
+
+
 class MovieCreateSchema(BaseModel):
     name: str
     date: date
@@ -182,6 +258,29 @@ class MovieCreateSchema(BaseModel):
         return [item.title() for item in value]
 
 
+class MovieImportResultSchema(BaseModel):
+    index: int
+    status: MovieImportStatusEnum
+    movie_id: Optional[int] = None
+    errors: Optional[List[dict]] = None
+
+
+class MovieBulkImportResponseSchema(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    failed: int
+    results: List[MovieImportResultSchema]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_bulk_import_response_schema_example
+            ]
+        }
+    }
+
+
 class MovieUpdateSchema(BaseModel):
     name: Optional[str] = None
     date: Optional[date] = None
@@ -199,3 +298,63 @@ class MovieUpdateSchema(BaseModel):
             ]
         }
     }
+
+
+class MovieFilterSchema(BaseModel):
+    genres: List[str] = []
+    actors: List[str] = []
+    languages: List[str] = []
+    countries: List[str] = []
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    score_min: Optional[float] = Field(None, ge=0, le=100)
+    score_max: Optional[float] = Field(None, ge=0, le=100)
+    status: Optional[MovieStatusEnum] = None
+    price_min: Optional[Decimal] = Field(None, ge=0)
+    price_max: Optional[Decimal] = Field(None, ge=0)
+
+    @field_validator("genres", "actors", "languages", mode="before")
+    @classmethod
+    def normalize_names(cls, value: List[str]) -> List[str]:
+        return sorted({item.title() for item in value})
+
+    @field_validator("countries", mode="before")
+    @classmethod
+    def normalize_countries(cls, value: List[str]) -> List[str]:
+        return sorted({item.upper() for item in value})
+
+    @model_validator(mode="after")
+    def validate_ranges(self):
+        for low, high in (("year_from", "year_to"), ("score_min", "score_max"), ("price_min", "price_max")):
+            low_value, high_value = getattr(self, low), getattr(self, high)
+            if low_value is not None and high_value is not None and low_value > high_value:
+                raise ValueError(f"'{low}' cannot be greater than '{high}'.")
+        return self
+
+    def cache_key(self) -> str:
+        return self.model_dump_json(exclude_defaults=True)
+
+
+class FacetCountSchema(BaseModel):
+    value: str
+    count: int
+
+
+class YearBucketSchema(BaseModel):
+    year_from: int
+    year_to: int
+    count: int
+
+
+class MovieFacetsResponseSchema(BaseModel):
+    total_items: int
+    genres: List[FacetCountSchema]
+    years: List[YearBucketSchema]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_facets_response_schema_example
+            ]
+        }
+    }
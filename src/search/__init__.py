@@ -0,0 +1,3 @@
+from search.interfaces import MovieSearchInterface
+from search.inverted_index import InvertedIndexMovieSearch
+from search.postgres import PostgresMovieSearch
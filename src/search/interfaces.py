@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class MovieSearchInterface(ABC):
+
+    @abstractmethod
+    async def search(self, db: AsyncSession, query: str, limit: int, offset: int = 0) -> list[tuple[int, float]]:
+        """
+        Find movies whose name or overview match a free-text query.
+
+        :param db: The database session to search with.
+        :param query: The user-supplied search text.
+        :param limit: The maximum number of results to return.
+        :param offset: The number of best-ranked results to skip.
+        :return: ``(movie_id, rank)`` pairs ordered from the best match down.
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """
+        Notify the backend that movie names or overviews have changed.
+        """
+        pass
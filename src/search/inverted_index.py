@@ -0,0 +1,134 @@
+import difflib
+import math
+import re
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from caches import LRUCache
+from database import MovieModel
+from search.interfaces import MovieSearchInterface
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_INDEX_KEY = "movies"
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """
+    Split text into lower-cased word tokens.
+    """
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+class _MovieIndex:
+
+    def __init__(self, postings: dict[str, dict[int, float]], documents: int):
+        self.postings = postings
+        self.documents = documents
+        self.vocabulary = list(postings)
+
+    def idf(self, term: str) -> float:
+        return math.log(1 + self.documents / len(self.postings[term]))
+
+
+class InvertedIndexMovieSearch(MovieSearchInterface):
+    """
+    Pure-Python movie search used with the SQLite testing database.
+
+    An inverted index of name and overview tokens is built on the first search and kept
+    until :meth:`invalidate` is called. All query terms must match (like
+    ``websearch_to_tsquery``); results are ranked by the sum of field-weighted term
+    frequencies scaled by inverse document frequency, with names outweighing overviews.
+    When no movie matches, each unknown term is replaced by its closest vocabulary words
+    so that typos still find results, mirroring the trigram fallback in PostgreSQL.
+    """
+
+    def __init__(
+            self,
+            name_weight: float = 2.0,
+            overview_weight: float = 1.0,
+            fuzzy_cutoff: float = 0.75,
+    ):
+        self._name_weight = name_weight
+        self._overview_weight = overview_weight
+        self._fuzzy_cutoff = fuzzy_cutoff
+        self._cache = LRUCache(max_size=1)
+
+    async def search(self, db: AsyncSession, query: str, limit: int, offset: int = 0) -> list[tuple[int, float]]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        index = await self._get_index(db)
+        scores = self._score(index, [[term] for term in terms])
+        if not scores:
+            expanded = [
+                [term] if term in index.postings
+                else difflib.get_close_matches(term, index.vocabulary, n=3, cutoff=self._fuzzy_cutoff)
+                for term in terms
+            ]
+            scores = self._score(index, expanded)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return ranked[offset:offset + limit]
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+    async def _get_index(self, db: AsyncSession) -> _MovieIndex:
+        index = self._cache.get(_INDEX_KEY)
+        if index is None:
+            index = await self._build_index(db)
+            self._cache.set(_INDEX_KEY, index)
+        return index
+
+    async def _build_index(self, db: AsyncSession) -> _MovieIndex:
+        result = await db.execute(select(MovieModel.id, MovieModel.name, MovieModel.overview))
+        postings: dict[str, dict[int, float]] = defaultdict(dict)
+        documents = 0
+
+        for movie_id, name, overview in result.all():
+            documents += 1
+            for tokens, weight in (
+                    (tokenize(name), self._name_weight),
+                    (tokenize(overview), self._overview_weight),
+            ):
+                for token in tokens:
+                    postings[token][movie_id] = postings[token].get(movie_id, 0.0) + weight
+
+        return _MovieIndex(dict(postings), documents)
+
+    @staticmethod
+    def _score(index: _MovieIndex, alternatives: list[list[str]]) -> dict[int, float]:
+        """
+        Score movies matching at least one alternative for every query term.
+        """
+        scores: Optional[dict[int, float]] = None
+
+        for candidates in alternatives:
+            term_scores: dict[int, float] = {}
+            for term in candidates:
+                movies = index.postings.get(term)
+                if not movies:
+                    continue
+                idf = index.idf(term)
+                for movie_id, frequency in movies.items():
+                    term_scores[movie_id] = max(term_scores.get(movie_id, 0.0), frequency * idf)
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    movie_id: score + term_scores[movie_id]
+                    for movie_id, score in scores.items()
+                    if movie_id in term_scores
+                }
+            if not scores:
+                return {}
+
+        return scores or {}
@@ -0,0 +1,56 @@
+from sqlalchemy import select, func, exists, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import MovieModel
+from search.interfaces import MovieSearchInterface
+
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+
+class PostgresMovieSearch(MovieSearchInterface):
+    """
+    Full-text movie search backed by PostgreSQL.
+
+    Matches against the generated ``movies.search_vector`` column (names weighted above
+    overviews, GIN indexed) and ranks with ``ts_rank_cd``. When the full-text query finds
+    nothing at all, typos are tolerated by falling back to the trigram ``%`` operator on
+    the name, which is served by the ``gin_trgm_ops`` index.
+    """
+
+    def __init__(self, text_search_config: str = "english"):
+        self._config = text_search_config
+
+    async def search(self, db: AsyncSession, query: str, limit: int, offset: int = 0) -> list[tuple[int, float]]:
+        search_vector = literal_column(f"{MovieModel.__tablename__}.{SEARCH_VECTOR_COLUMN}")
+        ts_query = func.websearch_to_tsquery(self._config, query)
+        matches = search_vector.op("@@")(ts_query)
+        rank = func.ts_rank_cd(search_vector, ts_query).label("rank")
+
+        stmt = (
+            select(MovieModel.id, rank)
+            .where(matches)
+            .order_by(rank.desc(), MovieModel.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        rows = [(movie_id, float(score)) for movie_id, score in result.all()]
+        if rows:
+            return rows
+
+        if offset and await db.scalar(select(exists().where(matches))):
+            return []
+
+        similarity = func.similarity(MovieModel.name, query).label("rank")
+        stmt = (
+            select(MovieModel.id, similarity)
+            .where(MovieModel.name.op("%")(query))
+            .order_by(similarity.desc(), MovieModel.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return [(movie_id, float(score)) for movie_id, score in result.all()]
+
+    def invalidate(self) -> None:
+        return None
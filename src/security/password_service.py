@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from exceptions import PasswordServiceBusyError
+from security.passwords import hash_password, verify_password, verify_and_update_password
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordService:
+    """
+    Run password hashing and verification off the event loop in a bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so a small thread pool gives real parallelism
+    without blocking the event loop. At most ``max_workers`` hashes run at once and at
+    most ``max_pending`` more may wait for a worker; further calls fail fast with
+    :class:`PasswordServiceBusyError` so callers can answer 503 instead of queueing
+    requests behind seconds of CPU work.
+
+    The time each call spends waiting for a worker is recorded; see :meth:`metrics`.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16, slow_wait_seconds: float = 1.0):
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+        if max_pending < 0:
+            raise ValueError("max_pending must not be negative.")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password")
+        self._capacity = max_workers + max_pending
+        self._slow_wait_seconds = slow_wait_seconds
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._started = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    async def hash(self, raw_password: str) -> str:
+        """
+        Hash a plain-text password.
+
+        Args:
+            raw_password (str): The plain-text password.
+
+        Returns:
+            str: The password hash.
+
+        Raises:
+            PasswordServiceBusyError: If the pool and its queue are full.
+        """
+        return await self._run(hash_password, raw_password)
+
+    async def verify(self, raw_password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain-text password against a stored hash.
+
+        Args:
+            raw_password (str): The plain-text password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            bool: True if the password matches.
+
+        Raises:
+            PasswordServiceBusyError: If the pool and its queue are full.
+        """
+        return await self._run(verify_password, raw_password, hashed_password)
+
+    async def verify_and_update(self, raw_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """
+        Verify a plain-text password and re-hash it if the stored hash is outdated.
+
+        Args:
+            raw_password (str): The plain-text password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            tuple[bool, Optional[str]]: Whether the password matches, and the replacement
+            hash if the stored one no longer matches the cost policy.
+
+        Raises:
+            PasswordServiceBusyError: If the pool and its queue are full.
+        """
+        return await self._run(verify_and_update_password, raw_password, hashed_password)
+
+    def metrics(self) -> dict[str, float]:
+        """
+        Return a snapshot of the pool load and queue wait times.
+
+        Returns:
+            dict[str, float]: ``in_flight``, ``started`` and ``rejected`` counts and the
+            average and maximum seconds calls waited for a worker.
+        """
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "started": self._started,
+                "rejected": self._rejected,
+                "wait_seconds_avg": self._wait_total / self._started if self._started else 0.0,
+                "wait_seconds_max": self._wait_max,
+            }
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker threads once queued calls have finished.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._in_flight >= self._capacity:
+                self._rejected += 1
+                raise PasswordServiceBusyError
+            self._in_flight += 1
+
+        submitted_at = time.perf_counter()
+
+        def call() -> T:
+            self._record_wait(time.perf_counter() - submitted_at)
+            return func(*args)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self._started += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        if waited >= self._slow_wait_seconds:
+            logger.warning("Password hashing call waited %.3fs for a worker", waited)
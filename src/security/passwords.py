@@ -1,5 +1,9 @@
+from typing import Optional
+
 from passlib.context import CryptContext
 
+PASSWORD_HASH_SCHEMES = ("bcrypt", "argon2")
+
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     bcrypt__rounds=14,
@@ -7,6 +11,47 @@ pwd_context = CryptContext(
 )
 
 
+def configure_password_context(
+        scheme: str = "bcrypt",
+        bcrypt_rounds: int = 14,
+        argon2_time_cost: int = 3,
+        argon2_memory_cost: int = 65536,
+        argon2_parallelism: int = 4,
+) -> None:
+    """
+    Apply the password hashing cost policy to the shared password context.
+
+    New hashes use ``scheme`` with the given cost. Hashes of the other scheme, or of the same
+    scheme with different cost parameters, still verify but are reported by
+    :func:`password_needs_update`, so they can be re-hashed on the next successful login.
+    The argon2 scheme hashes with argon2id and needs the optional ``argon2-cffi`` package.
+
+    Args:
+        scheme (str): The scheme for new hashes, one of ``PASSWORD_HASH_SCHEMES``.
+        bcrypt_rounds (int): The bcrypt cost factor (log2 of the number of rounds).
+        argon2_time_cost (int): The number of argon2 iterations.
+        argon2_memory_cost (int): The argon2 memory usage in KiB.
+        argon2_parallelism (int): The number of argon2 lanes.
+
+    Raises:
+        ValueError: If ``scheme`` is not supported.
+    """
+    if scheme not in PASSWORD_HASH_SCHEMES:
+        raise ValueError(f"Unsupported password hash scheme: {scheme}.")
+
+    schemes = [scheme] + [other for other in PASSWORD_HASH_SCHEMES if other != scheme]
+    pwd_context.load({
+        "schemes": schemes,
+        "default": scheme,
+        "deprecated": "auto",
+        "bcrypt__rounds": bcrypt_rounds,
+        "argon2__type": "ID",
+        "argon2__time_cost": argon2_time_cost,
+        "argon2__memory_cost": argon2_memory_cost,
+        "argon2__parallelism": argon2_parallelism,
+    })
+
+
 def hash_password(password: str) -> str:
     """
     Hash a plain-text password using the configured password context.
@@ -38,3 +83,34 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if the password is correct, False otherwise.
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and re-hash it when its hash does not match the current cost policy.
+
+    The re-hash only happens for a correct password, so a login pays for it at most once
+    per user and policy change.
+
+    Args:
+        plain_password (str): The plain-text password provided by the user.
+        hashed_password (str): The hashed password stored in the database.
+
+    Returns:
+        tuple[bool, Optional[str]]: Whether the password is correct, and the replacement hash
+        if the stored one should be updated (``None`` otherwise).
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def password_needs_update(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash was produced with a deprecated scheme or cost.
+
+    Args:
+        hashed_password (str): The hashed password stored in the database.
+
+    Returns:
+        bool: True if the hash should be replaced.
+    """
+    return pwd_context.needs_update(hashed_password)
@@ -1,10 +1,14 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from jose import jwt, JWTError, ExpiredSignatureError
 
+from caches import LRUCache
 from exceptions import TokenExpiredError, InvalidTokenError
 from security.interfaces import JWTAuthManagerInterface
+from security.utils import generate_secure_token
 
 
 class JWTAuthManager(JWTAuthManagerInterface):
@@ -15,13 +19,24 @@ class JWTAuthManager(JWTAuthManagerInterface):
     _ACCESS_KEY_TIMEDELTA_MINUTES = 60
     _REFRESH_KEY_TIMEDELTA_MINUTES = 60 * 24 * 7
 
-    def __init__(self, secret_key_access: str, secret_key_refresh: str, algorithm: str):
+    def __init__(
+            self,
+            secret_key_access: str,
+            secret_key_refresh: str,
+            algorithm: str,
+            access_cache_max_entries: Optional[int] = None,
+    ):
         """
         Initialize the manager with secret keys and algorithm for token operations.
+
+        With ``access_cache_max_entries`` set, the claims of successfully decoded access tokens
+        are kept in an LRU cache keyed by the token's SHA-256 digest until the token's ``exp``,
+        so repeated requests with the same token skip signature verification and parsing.
         """
         self._secret_key_access = secret_key_access
         self._secret_key_refresh = secret_key_refresh
         self._algorithm = algorithm
+        self._access_cache = LRUCache(max_size=access_cache_max_entries) if access_cache_max_entries else None
 
     def _create_token(self, data: dict, secret_key: str, expires_delta: timedelta) -> str:
         """
@@ -35,18 +50,25 @@ class JWTAuthManager(JWTAuthManagerInterface):
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """
         Create a new access token with a default or specified expiration time.
+
+        Every access token carries a random ``jti`` claim, by which it can be revoked, and an
+        ``iat`` claim with sub-second precision, by which all tokens of a user issued before
+        a revocation can be told apart from those issued after it.
         """
         return self._create_token(
-            data,
+            {"jti": generate_secure_token(16), "iat": time.time(), **data},
             self._secret_key_access,
             expires_delta or timedelta(minutes=self._ACCESS_KEY_TIMEDELTA_MINUTES))
 
     def create_refresh_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """
         Create a new refresh token with a default or specified expiration time.
+
+        Every refresh token carries a random ``jti`` claim, so two tokens issued to the same user
+        within the same second still differ and can be stored and revoked individually.
         """
         return self._create_token(
-            data,
+            {"jti": generate_secure_token(16), **data},
             self._secret_key_refresh,
             expires_delta or timedelta(minutes=self._REFRESH_KEY_TIMEDELTA_MINUTES))
 
@@ -54,19 +76,32 @@ class JWTAuthManager(JWTAuthManagerInterface):
         """
         Decode and validate an access token, returning the token's data.
         """
-        try:
-            return jwt.decode(token, self._secret_key_access, algorithms=[self._algorithm])
-        except ExpiredSignatureError:
-            raise TokenExpiredError
-        except JWTError:
-            raise InvalidTokenError
+        if self._access_cache is None:
+            return self._decode(token, self._secret_key_access)
+
+        digest = hashlib.sha256(token.encode()).digest()
+        claims = self._access_cache.get(digest)
+        if claims is None:
+            claims = self._decode(token, self._secret_key_access)
+            expires_at = claims.get("exp")
+            if isinstance(expires_at, (int, float)):
+                ttl = expires_at - time.time()
+                if ttl > 0:
+                    self._access_cache.set(digest, claims, ttl=ttl)
+        return dict(claims)
 
     def decode_refresh_token(self, token: str) -> dict:
         """
         Decode and validate a refresh token, returning the token's data.
         """
+        return self._decode(token, self._secret_key_refresh)
+
+    def _decode(self, token: str, secret_key: str) -> dict:
+        """
+        Verify a token's signature and expiration and return its claims.
+        """
         try:
-            return jwt.decode(token, self._secret_key_refresh, algorithms=[self._algorithm])
+            return jwt.decode(token, secret_key, algorithms=[self._algorithm])
         except ExpiredSignatureError:
             raise TokenExpiredError
         except JWTError:
@@ -1,3 +1,4 @@
+import hashlib
 import secrets
 
 
@@ -9,3 +10,16 @@ def generate_secure_token(length: int = 32) -> str:
         str: Securely generated token.
     """
     return secrets.token_urlsafe(length)
+
+
+def hash_token(token: str) -> str:
+    """
+    Return the SHA-256 hex digest of a token, for storing and looking up tokens without keeping them.
+
+    Args:
+        token (str): The token to hash.
+
+    Returns:
+        str: The 64-character hex digest.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
@@ -0,0 +1,94 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import EmailOutboxModel, EmailOutboxStatusEnum
+from exceptions import BaseEmailError
+from notifications import BatchEmail, EmailSenderInterface
+
+logger = logging.getLogger(__name__)
+
+
+def _send_arguments(email: EmailOutboxModel) -> dict:
+    if email.kind == "send_payment_confirmation_email":
+        return {**email.payload, "amount": Decimal(email.payload["amount"])}
+    return email.payload
+
+
+async def _deliver(email_sender: EmailSenderInterface, email: EmailOutboxModel) -> None:
+    if email.kind != "send_batch":
+        await getattr(email_sender, email.kind)(**_send_arguments(email))
+        return
+    result = await email_sender.send_batch(
+        email.payload["template_name"],
+        email.payload["subject"],
+        [BatchEmail(email.recipient, email.payload["context"])],
+    )
+    if email.recipient in result.failed:
+        raise BaseEmailError(result.failed[email.recipient])
+
+
+async def deliver_outbox_emails(
+        db: AsyncSession,
+        email_sender: EmailSenderInterface,
+        batch_size: int,
+        max_attempts: int,
+        retry_delay_seconds: float,
+) -> dict[str, int]:
+    """
+    Deliver the due emails of the outbox in batches, committing after each batch.
+
+    Each batch claims at most ``batch_size`` pending emails whose next attempt is due with
+    ``FOR UPDATE SKIP LOCKED``, so concurrent workers never deliver the same email. Delivered
+    emails are deleted. A failed email is retried after ``retry_delay_seconds``, doubled with
+    every further failure, and marked ``DEAD`` after ``max_attempts`` failures.
+
+    Args:
+        db (AsyncSession): The database session.
+        email_sender (EmailSenderInterface): The sender delivering the emails.
+        batch_size (int): The number of emails claimed per transaction.
+        max_attempts (int): The number of failures after which an email is dead-lettered.
+        retry_delay_seconds (float): The delay before the first retry.
+
+    Returns:
+        dict[str, int]: The number of ``sent``, ``retried`` and ``dead`` emails.
+    """
+    report = {"sent": 0, "retried": 0, "dead": 0}
+    while True:
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            select(EmailOutboxModel)
+            .where(
+                EmailOutboxModel.status == EmailOutboxStatusEnum.PENDING,
+                EmailOutboxModel.next_attempt_at <= now,
+            )
+            .order_by(EmailOutboxModel.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        emails = result.scalars().all()
+
+        for email in emails:
+            try:
+                await _deliver(email_sender, email)
+            except Exception as error:
+                email.attempts += 1
+                email.last_error = str(error)
+                if email.attempts >= max_attempts:
+                    email.status = EmailOutboxStatusEnum.DEAD
+                    report["dead"] += 1
+                    logger.error("Giving up on email id=%s to %s: %s", email.id, email.recipient, error)
+                else:
+                    email.next_attempt_at = now + timedelta(seconds=retry_delay_seconds * 2 ** (email.attempts - 1))
+                    report["retried"] += 1
+                    logger.warning("Email id=%s to %s failed, retrying: %s", email.id, email.recipient, error)
+            else:
+                await db.delete(email)
+                report["sent"] += 1
+
+        await db.commit()
+        if len(emails) < batch_size:
+            return report
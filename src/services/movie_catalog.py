@@ -0,0 +1,181 @@
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable
+
+from sqlalchemy import Select, select, func, literal, cast, extract, Integer, String, union_all
+from sqlalchemy.sql.elements import ColumnElement
+
+from database import (
+    MovieModel,
+    GenreModel,
+    ActorModel,
+    LanguageModel,
+    CountryModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel,
+)
+from schemas import MovieFilterSchema, MovieSortFieldEnum
+
+
+@dataclass(frozen=True)
+class MovieSortField:
+    """
+    Describes how the movie list can be ordered by one attribute.
+
+    ``columns`` always ends with ``MovieModel.id`` so the ordering is total and can be
+    used for keyset seeks; ``values`` extracts the matching boundary values from a row
+    and ``parse`` turns JSON-decoded cursor values back into bind-compatible types.
+    """
+
+    columns: tuple[ColumnElement, ...]
+    values: Callable[[MovieModel], list[Any]]
+    parse: Callable[[list[Any]], list[Any]]
+
+
+def _parse_with(converter: Callable[[Any], Any]) -> Callable[[list[Any]], list[Any]]:
+    def parse(values: list[Any]) -> list[Any]:
+        *sort_values, movie_id = values
+        return [converter(value) for value in sort_values] + [int(movie_id)]
+
+    return parse
+
+
+MOVIE_SORT_FIELDS: dict[MovieSortFieldEnum, MovieSortField] = {
+    MovieSortFieldEnum.ID: MovieSortField(
+        columns=(MovieModel.id,),
+        values=lambda movie: [movie.id],
+        parse=_parse_with(int),
+    ),
+    MovieSortFieldEnum.SCORE: MovieSortField(
+        columns=(MovieModel.score, MovieModel.id),
+        values=lambda movie: [movie.score, movie.id],
+        parse=_parse_with(float),
+    ),
+    MovieSortFieldEnum.DATE: MovieSortField(
+        columns=(MovieModel.date, MovieModel.id),
+        values=lambda movie: [movie.date.isoformat(), movie.id],
+        parse=_parse_with(datetime.date.fromisoformat),
+    ),
+    MovieSortFieldEnum.PRICE: MovieSortField(
+        columns=(MovieModel.price_sort_key(), MovieModel.id),
+        values=lambda movie: [str(movie.current_price or 0), movie.id],
+        parse=_parse_with(lambda value: Decimal(str(value))),
+    ),
+    MovieSortFieldEnum.REVENUE: MovieSortField(
+        columns=(MovieModel.revenue, MovieModel.id),
+        values=lambda movie: [movie.revenue, movie.id],
+        parse=_parse_with(float),
+    ),
+}
+
+
+def build_movie_filter_conditions(filters: MovieFilterSchema) -> list[ColumnElement]:
+    """
+    Translate catalog filters into WHERE conditions on ``MovieModel``.
+
+    Reference filters are expressed as semi-joins over the association tables so each
+    one is resolved through the ``(<entity>_id, movie_id)`` indexes; several values for
+    the same filter match movies having any of them.
+
+    Args:
+        filters (MovieFilterSchema): The requested filters.
+
+    Returns:
+        list[ColumnElement]: Conditions to pass to ``Select.where``.
+    """
+    conditions = []
+
+    if filters.genres:
+        conditions.append(MovieModel.id.in_(
+            select(MoviesGenresModel.c.movie_id)
+            .join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+            .where(GenreModel.name.in_(filters.genres))
+        ))
+    if filters.actors:
+        conditions.append(MovieModel.id.in_(
+            select(ActorsMoviesModel.c.movie_id)
+            .join(ActorModel, ActorModel.id == ActorsMoviesModel.c.actor_id)
+            .where(ActorModel.name.in_(filters.actors))
+        ))
+    if filters.languages:
+        conditions.append(MovieModel.id.in_(
+            select(MoviesLanguagesModel.c.movie_id)
+            .join(LanguageModel, LanguageModel.id == MoviesLanguagesModel.c.language_id)
+            .where(LanguageModel.name.in_(filters.languages))
+        ))
+    if filters.countries:
+        conditions.append(MovieModel.country_id.in_(
+            select(CountryModel.id).where(CountryModel.code.in_(filters.countries))
+        ))
+    if filters.year_from is not None:
+        conditions.append(MovieModel.date >= datetime.date(filters.year_from, 1, 1))
+    if filters.year_to is not None:
+        conditions.append(MovieModel.date < datetime.date(filters.year_to + 1, 1, 1))
+    if filters.score_min is not None:
+        conditions.append(MovieModel.score >= filters.score_min)
+    if filters.score_max is not None:
+        conditions.append(MovieModel.score <= filters.score_max)
+    if filters.status is not None:
+        conditions.append(MovieModel.status == filters.status)
+    if filters.price_min is not None:
+        conditions.append(MovieModel.current_price >= filters.price_min)
+    if filters.price_max is not None:
+        conditions.append(MovieModel.current_price <= filters.price_max)
+
+    return conditions
+
+
+def build_movie_facets_stmt(filters: MovieFilterSchema, year_bucket: int) -> Select:
+    """
+    Build a single statement returning the total, per-genre and per-year-bucket counts.
+
+    The filtered movies are computed once in a CTE and the three aggregates are combined
+    with ``UNION ALL`` so all facets come back in one round-trip. Each row is
+    ``(facet, value, count)`` where ``facet`` is ``"total"``, ``"genre"`` or ``"year"``.
+
+    Args:
+        filters (MovieFilterSchema): The requested filters.
+        year_bucket (int): The width of the year buckets, e.g. 10 for decades.
+
+    Returns:
+        Select: The facets statement.
+    """
+    filtered = (
+        select(MovieModel.id, MovieModel.date)
+        .where(*build_movie_filter_conditions(filters))
+        .cte("filtered_movies")
+    )
+
+    total_stmt = select(
+        literal("total").label("facet"),
+        cast(literal(""), String).label("value"),
+        func.count().label("count"),
+    ).select_from(filtered)
+
+    genre_stmt = (
+        select(
+            literal("genre").label("facet"),
+            GenreModel.name.label("value"),
+            func.count().label("count"),
+        )
+        .select_from(filtered)
+        .join(MoviesGenresModel, MoviesGenresModel.c.movie_id == filtered.c.id)
+        .join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+        .group_by(GenreModel.name)
+    )
+
+    year = cast(extract("year", filtered.c.date), Integer)
+    bucket = (year // year_bucket) * year_bucket
+    year_stmt = (
+        select(
+            literal("year").label("facet"),
+            cast(bucket, String).label("value"),
+            func.count().label("count"),
+        )
+        .select_from(filtered)
+        .group_by(bucket)
+    )
+
+    return union_all(total_stmt, genre_stmt, year_stmt)
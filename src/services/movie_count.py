@@ -0,0 +1,100 @@
+import logging
+from typing import Hashable, Optional
+
+from sqlalchemy import Select, select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from caches import LRUCache
+from database import MovieModel
+
+logger = logging.getLogger(__name__)
+
+COUNT_MODE_EXACT = "exact"
+COUNT_MODE_ESTIMATED = "estimated"
+
+ALL_MOVIES_KEY = "all"
+
+
+class MovieCountProvider:
+    """
+    Serve movie totals for the catalog list from a short-lived in-process cache.
+
+    Counting the whole ``movies`` table is a sequential scan on PostgreSQL, so totals are
+    cached per filter key for ``ttl`` seconds and dropped by :meth:`invalidate` whenever
+    the catalog changes. In ``estimated`` mode the unfiltered total is read from the
+    planner statistics in ``pg_class.reltuples`` once the table is large enough for an
+    exact count to be too expensive.
+    """
+
+    def __init__(
+            self,
+            ttl: float,
+            mode: str = COUNT_MODE_EXACT,
+            estimate_min_rows: int = 1_000_000,
+            max_entries: int = 1024,
+    ):
+        if mode not in (COUNT_MODE_EXACT, COUNT_MODE_ESTIMATED):
+            raise ValueError(f"Unsupported count mode: {mode}")
+        self._mode = mode
+        self._estimate_min_rows = estimate_min_rows
+        self._cache = LRUCache(max_size=max_entries, ttl=ttl)
+
+    async def get_total(
+            self,
+            db: AsyncSession,
+            key: Hashable = ALL_MOVIES_KEY,
+            count_stmt: Optional[Select] = None,
+    ) -> int:
+        """
+        Return the number of movies matching ``count_stmt``, using the cache when possible.
+
+        Args:
+            db (AsyncSession): The database session used on a cache miss.
+            key (Hashable): The cache key identifying the filter behind ``count_stmt``.
+            count_stmt (Optional[Select]): A ``SELECT count(...)`` statement; defaults to all movies.
+
+        Returns:
+            int: The (possibly estimated) number of movies.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        total = None
+        if count_stmt is None and self._mode == COUNT_MODE_ESTIMATED:
+            total = await self._estimate_total(db)
+
+        if total is None:
+            stmt = count_stmt if count_stmt is not None else select(func.count(MovieModel.id))
+            result = await db.execute(stmt)
+            total = result.scalar() or 0
+
+        self._cache.set(key, total)
+        return total
+
+    def invalidate(self) -> None:
+        """
+        Drop every cached total; call after movies are created or deleted.
+        """
+        self._cache.clear()
+
+    async def _estimate_total(self, db: AsyncSession) -> Optional[int]:
+        """
+        Read the planner's row estimate for the movies table.
+
+        Returns ``None`` when the database is not PostgreSQL, the table has never been
+        analyzed, or the estimate is below the threshold where exact counting is cheap.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return None
+
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)"),
+            {"table_name": MovieModel.__tablename__},
+        )
+        estimate = result.scalar()
+        if estimate is None or estimate < self._estimate_min_rows:
+            return None
+
+        logger.debug("Using estimated movie count %s", estimate)
+        return int(estimate)
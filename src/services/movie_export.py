@@ -0,0 +1,181 @@
+import csv
+import io
+import json
+import zlib
+from collections import defaultdict
+from typing import AsyncIterator, Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import (
+    MovieModel,
+    GenreModel,
+    ActorModel,
+    LanguageModel,
+    CountryModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel,
+)
+from schemas import MovieFilterSchema, MovieExportFormatEnum
+from services.movie_catalog import build_movie_filter_conditions
+
+EXPORT_FIELDS = (
+    "id",
+    "name",
+    "date",
+    "score",
+    "overview",
+    "status",
+    "budget",
+    "revenue",
+    "current_price",
+    "country",
+    "genres",
+    "actors",
+    "languages",
+)
+
+# Separator for multi-valued columns in CSV exports.
+CSV_LIST_SEPARATOR = "|"
+
+_ASSOCIATIONS = (
+    ("genres", MoviesGenresModel, MoviesGenresModel.c.genre_id, GenreModel),
+    ("actors", ActorsMoviesModel, ActorsMoviesModel.c.actor_id, ActorModel),
+    ("languages", MoviesLanguagesModel, MoviesLanguagesModel.c.language_id, LanguageModel),
+)
+
+
+async def iter_movie_batches(
+        db: AsyncSession,
+        filters: MovieFilterSchema,
+        batch_size: int,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Yield the filtered catalog as batches of flat movie records, ordered by id.
+
+    Movies are read through a server-side cursor (``AsyncSession.stream`` with
+    ``yield_per``), so only one batch is held in memory at a time. Genres, actors and
+    languages are fetched with one query per association table per batch.
+
+    Args:
+        db (AsyncSession): The database session to read from.
+        filters (MovieFilterSchema): The catalog filters to apply.
+        batch_size (int): The number of movies fetched and yielded at a time.
+
+    Yields:
+        list[dict[str, Any]]: Movie records keyed by ``EXPORT_FIELDS``.
+    """
+    stmt = (
+        select(
+            MovieModel.id,
+            MovieModel.name,
+            MovieModel.date,
+            MovieModel.score,
+            MovieModel.overview,
+            MovieModel.status,
+            MovieModel.budget,
+            MovieModel.revenue,
+            MovieModel.current_price,
+            CountryModel.code.label("country"),
+        )
+        .join(CountryModel, CountryModel.id == MovieModel.country_id)
+        .where(*build_movie_filter_conditions(filters))
+        .order_by(MovieModel.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    result = await db.stream(stmt)
+    async for partition in result.partitions():
+        movies = [dict(row._mapping) for row in partition]
+        movie_ids = [movie["id"] for movie in movies]
+
+        for field, table, column, model in _ASSOCIATIONS:
+            names = defaultdict(list)
+            related = await db.execute(
+                select(table.c.movie_id, model.name)
+                .join(model, model.id == column)
+                .where(table.c.movie_id.in_(movie_ids))
+                .order_by(table.c.movie_id, model.name)
+            )
+            for movie_id, name in related.all():
+                names[movie_id].append(name)
+            for movie in movies:
+                movie[field] = names.get(movie["id"], [])
+
+        yield movies
+
+
+def _encode_scalar(value: Any) -> Any:
+    """
+    Encode dates, enums and decimals the way they appear in the JSON API.
+    """
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+def format_ndjson(movies: Iterable[dict[str, Any]]) -> str:
+    """
+    Render movie records as newline-delimited JSON.
+    """
+    return "".join(json.dumps(movie, default=_encode_scalar) + "\n" for movie in movies)
+
+
+def format_csv(movies: Iterable[dict[str, Any]], header: bool = False) -> str:
+    """
+    Render movie records as CSV rows; list columns are joined with ``CSV_LIST_SEPARATOR``.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    for movie in movies:
+        writer.writerow([
+            CSV_LIST_SEPARATOR.join(movie[field]) if isinstance(movie[field], list)
+            else _encode_scalar(movie[field]) if movie[field] is not None else ""
+            for field in EXPORT_FIELDS
+        ])
+    return buffer.getvalue()
+
+
+async def export_movies(
+        batches: AsyncIterator[list[dict[str, Any]]],
+        export_format: MovieExportFormatEnum,
+        compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Encode movie batches as NDJSON or CSV, optionally gzip-compressed on the fly.
+
+    Args:
+        batches (AsyncIterator[list[dict[str, Any]]]): Batches from :func:`iter_movie_batches`.
+        export_format (MovieExportFormatEnum): The output format.
+        compress (bool): Whether to gzip the output stream.
+
+    Yields:
+        bytes: Encoded chunks, one per batch.
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+
+    def encode(text: str) -> bytes:
+        data = text.encode()
+        return compressor.compress(data) if compressor is not None else data
+
+    if export_format == MovieExportFormatEnum.CSV:
+        header = encode(format_csv([], header=True))
+        if header:
+            yield header
+
+    async for movies in batches:
+        if export_format == MovieExportFormatEnum.CSV:
+            chunk = encode(format_csv(movies))
+        else:
+            chunk = encode(format_ndjson(movies))
+        if chunk:
+            yield chunk
+
+    if compressor is not None:
+        yield compressor.flush()
@@ -0,0 +1,194 @@
+import datetime
+import logging
+from collections import Counter
+from typing import Any, Sequence
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import (
+    MovieModel,
+    GenreModel,
+    ActorModel,
+    LanguageModel,
+    CountryModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel,
+)
+from schemas import (
+    MovieCreateSchema,
+    MovieImportResultSchema,
+    MovieImportStatusEnum,
+    MovieBulkImportResponseSchema,
+)
+from services.reference_data import ReferenceDataCache, dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# Association rows carry two bind parameters each; this keeps a statement far from the limits.
+ASSOCIATION_ROWS_PER_STATEMENT = 5000
+
+
+class MovieImporter:
+    """
+    Import movies in chunks with a fixed number of statements per chunk.
+
+    Records are validated with ``MovieCreateSchema`` and deduplicated on ``(name, date)``
+    within the request; reference names of the whole chunk are resolved through the
+    :class:`ReferenceDataCache`. Movies are written with one multi-row
+    ``INSERT ... ON CONFLICT (name, date) DO NOTHING RETURNING`` so rows that already exist
+    are reported as duplicates without a separate lookup, followed by multi-row inserts
+    into the association tables. Every chunk is committed on its own, so a failure only
+    affects the records of that chunk.
+    """
+
+    def __init__(self, db: AsyncSession, reference_cache: ReferenceDataCache, chunk_size: int = 500):
+        self._db = db
+        self._reference_cache = reference_cache
+        self._chunk_size = chunk_size
+        self._seen: set[tuple[str, datetime.date]] = set()
+        self._pending: list[tuple[int, MovieCreateSchema]] = []
+        self._next_index = 0
+        self.results: list[MovieImportResultSchema] = []
+
+    def report(self) -> MovieBulkImportResponseSchema:
+        """
+        Summarize the import; per-record results are ordered by their position in the request.
+        """
+        results = sorted(self.results, key=lambda result: result.index)
+        counts = Counter(result.status for result in results)
+        return MovieBulkImportResponseSchema(
+            created=counts[MovieImportStatusEnum.CREATED],
+            duplicates=counts[MovieImportStatusEnum.DUPLICATE],
+            invalid=counts[MovieImportStatusEnum.INVALID],
+            failed=counts[MovieImportStatusEnum.FAILED],
+            results=results,
+        )
+
+    def reject(self, errors: list[dict]) -> None:
+        """
+        Record a record that could not even be decoded as invalid.
+
+        Args:
+            errors (list[dict]): Error entries in the format of ``ValidationError.errors()``.
+        """
+        self.results.append(MovieImportResultSchema(
+            index=self._next_index, status=MovieImportStatusEnum.INVALID, errors=errors
+        ))
+        self._next_index += 1
+
+    async def add(self, record: Any) -> None:
+        """
+        Validate one raw record and queue it, flushing a chunk when it is full.
+
+        Args:
+            record (Any): The decoded JSON value of one movie.
+        """
+        index = self._next_index
+        self._next_index += 1
+
+        try:
+            movie_data = MovieCreateSchema.model_validate(record)
+        except ValidationError as error:
+            self.results.append(MovieImportResultSchema(
+                index=index,
+                status=MovieImportStatusEnum.INVALID,
+                errors=error.errors(include_url=False, include_context=False, include_input=False),
+            ))
+            return
+
+        key = (movie_data.name, movie_data.date)
+        if key in self._seen:
+            self.results.append(MovieImportResultSchema(index=index, status=MovieImportStatusEnum.DUPLICATE))
+            return
+        self._seen.add(key)
+
+        self._pending.append((index, movie_data))
+        if len(self._pending) >= self._chunk_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Write the queued records and commit them.
+
+        A database error (a constraint violation as well as e.g. a lost connection or a
+        statement timeout) rolls the chunk back and reports its records as failed, so the
+        following chunks are still imported.
+        """
+        chunk, self._pending = self._pending, []
+        if not chunk:
+            return
+
+        try:
+            self.results.extend(await self._insert_chunk(chunk))
+            await self._db.commit()
+        except DBAPIError:
+            await self._db.rollback()
+            logger.warning("Bulk movie import chunk of %s records failed", len(chunk), exc_info=True)
+            self.results.extend(
+                MovieImportResultSchema(index=index, status=MovieImportStatusEnum.FAILED)
+                for index, _ in chunk
+            )
+
+    async def _insert_chunk(self, chunk: Sequence[tuple[int, MovieCreateSchema]]) -> list[MovieImportResultSchema]:
+        movies = [movie_data for _, movie_data in chunk]
+        resolve = self._reference_cache.resolve_ids
+        country_ids = await resolve(self._db, CountryModel, [movie.country for movie in movies])
+        genre_ids = await resolve(self._db, GenreModel, [name for movie in movies for name in movie.genres])
+        actor_ids = await resolve(self._db, ActorModel, [name for movie in movies for name in movie.actors])
+        language_ids = await resolve(self._db, LanguageModel, [name for movie in movies for name in movie.languages])
+
+        stmt = (
+            dialect_insert(self._db, MovieModel)
+            .values([
+                {
+                    "name": movie.name,
+                    "date": movie.date,
+                    "score": movie.score,
+                    "overview": movie.overview,
+                    "status": movie.status,
+                    "budget": movie.budget,
+                    "revenue": movie.revenue,
+                    "country_id": country_ids[movie.country],
+                }
+                for movie in movies
+            ])
+            .on_conflict_do_nothing(index_elements=["name", "date"])
+            .returning(MovieModel.id, MovieModel.name, MovieModel.date)
+        )
+        result = await self._db.execute(stmt)
+        created_ids = {(name, date): movie_id for movie_id, name, date in result.all()}
+
+        association_rows: dict[Any, list[dict[str, int]]] = {
+            MoviesGenresModel: [],
+            ActorsMoviesModel: [],
+            MoviesLanguagesModel: [],
+        }
+        results = []
+        for index, movie in chunk:
+            movie_id = created_ids.get((movie.name, movie.date))
+            if movie_id is None:
+                results.append(MovieImportResultSchema(index=index, status=MovieImportStatusEnum.DUPLICATE))
+                continue
+
+            results.append(MovieImportResultSchema(
+                index=index, status=MovieImportStatusEnum.CREATED, movie_id=movie_id
+            ))
+            association_rows[MoviesGenresModel].extend(
+                {"movie_id": movie_id, "genre_id": genre_ids[name]} for name in dict.fromkeys(movie.genres)
+            )
+            association_rows[ActorsMoviesModel].extend(
+                {"movie_id": movie_id, "actor_id": actor_ids[name]} for name in dict.fromkeys(movie.actors)
+            )
+            association_rows[MoviesLanguagesModel].extend(
+                {"movie_id": movie_id, "language_id": language_ids[name]} for name in dict.fromkeys(movie.languages)
+            )
+
+        for table, rows in association_rows.items():
+            for start in range(0, len(rows), ASSOCIATION_ROWS_PER_STATEMENT):
+                await self._db.execute(insert(table).values(rows[start:start + ASSOCIATION_ROWS_PER_STATEMENT]))
+
+        return results
@@ -0,0 +1,113 @@
+import base64
+import binascii
+import json
+from typing import Any, Sequence
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from exceptions import InvalidCursorError
+
+CURSOR_DIRECTION_NEXT = "next"
+CURSOR_DIRECTION_PREV = "prev"
+
+
+def encode_cursor(sort_key: str, values: Sequence[Any], direction: str) -> str:
+    """
+    Encode a keyset position into an opaque, URL-safe cursor string.
+
+    Args:
+        sort_key (str): The name of the ordering the cursor belongs to.
+        values (Sequence[Any]): The sort key values of the boundary row (the last tie-breaker is the id).
+        direction (str): Either ``"next"`` (rows after the boundary) or ``"prev"`` (rows before it).
+
+    Returns:
+        str: A base64url encoded cursor without padding.
+    """
+    payload = {"s": sort_key, "v": list(values), "d": direction}
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, list[Any], str]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor received from a client.
+
+    Returns:
+        tuple[str, list[Any], str]: The sort key, the boundary values and the direction.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_key, values, direction = payload["s"], payload["v"], payload["d"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as error:
+        raise InvalidCursorError from error
+
+    if (
+            not isinstance(sort_key, str)
+            or not isinstance(values, list)
+            or not values
+            or direction not in (CURSOR_DIRECTION_NEXT, CURSOR_DIRECTION_PREV)
+    ):
+        raise InvalidCursorError
+    return sort_key, values, direction
+
+
+def keyset_order_by(columns: Sequence[ColumnElement], descending: bool) -> list[ColumnElement]:
+    """
+    Build the ORDER BY clause matching a keyset ordering.
+
+    Args:
+        columns (Sequence[ColumnElement]): The sort columns, the last one being a unique tie-breaker.
+        descending (bool): Whether the ordering is descending.
+
+    Returns:
+        list[ColumnElement]: Ordering expressions suitable for ``Select.order_by``.
+    """
+    return [column.desc() if descending else column.asc() for column in columns]
+
+
+def apply_keyset(
+        stmt: Select,
+        columns: Sequence[ColumnElement],
+        values: Sequence[Any],
+        descending: bool,
+        direction: str,
+) -> Select:
+    """
+    Restrict a statement to the rows after (or before) a keyset boundary.
+
+    The boundary is expressed as a row-value comparison so the database can seek
+    directly into a composite index on ``columns`` instead of scanning and discarding
+    ``OFFSET`` rows. When paging backwards the ordering is inverted, so callers must
+    reverse the fetched rows to restore the canonical order.
+
+    Args:
+        stmt (Select): The statement to restrict.
+        columns (Sequence[ColumnElement]): The sort columns, the last one being a unique tie-breaker.
+        values (Sequence[Any]): The boundary values, one per column.
+        descending (bool): Whether the canonical ordering is descending.
+        direction (str): Either ``"next"`` or ``"prev"``.
+
+    Returns:
+        Select: The restricted and ordered statement.
+    """
+    if len(values) != len(columns):
+        raise InvalidCursorError
+
+    forward = direction == CURSOR_DIRECTION_NEXT
+    key = tuple_(*columns)
+    boundary = tuple_(*values)
+
+    if descending == forward:
+        stmt = stmt.where(key < boundary)
+    else:
+        stmt = stmt.where(key > boundary)
+
+    return stmt.order_by(*keyset_order_by(columns, descending if forward else not descending))
@@ -5,7 +5,8 @@ from typing import Any
 import stripe
 
 from config.settings import Settings
-from database import Order, UserModel
+from caches import UserPrincipal
+from database import Order
 from schemas import PaymentRequestSchema
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,7 @@ class PaymentService:
             self,
             order: "Order",
             payment_data: PaymentRequestSchema,
-            user: "UserModel") -> dict[str, Any]:
+            user: UserPrincipal) -> dict[str, Any]:
 
         try:
             amount_in_cents = int(order.total_amount * 100)
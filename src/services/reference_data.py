@@ -0,0 +1,174 @@
+from typing import Iterable, Type
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from caches import LRUCache
+from database import GenreModel, ActorModel, LanguageModel, CountryModel
+from database.models.base import Base
+
+_DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Keeps every statement well below the bind parameter limits of PostgreSQL and SQLite.
+MAX_KEYS_PER_STATEMENT = 1000
+
+
+def dialect_insert(db: AsyncSession, table):
+    """
+    Build an ``INSERT`` for the session's dialect, which supports ``on_conflict_do_nothing``.
+    """
+    return _DIALECT_INSERTS[db.get_bind().dialect.name](table)
+
+
+class ReferenceDataCache:
+    """
+    Resolve genre, actor, language and country names to ids with an in-process cache.
+
+    Each reference model gets its own bounded LRU map of ``name -> id`` (countries are
+    keyed by ``code``). Misses are resolved with one ``IN (...)`` lookup per model and the
+    names that still do not exist are created with a single
+    ``INSERT ... ON CONFLICT DO NOTHING RETURNING``, so resolving a batch of names costs at
+    most three statements (very large batches are split to respect bind parameter limits).
+    Rows inserted concurrently by another transaction are picked up by a final lookup.
+
+    Reference rows are never deleted through the API, so cached ids stay valid. Ids looked up
+    or inserted in a transaction are kept pending on its session and only cached once the
+    session commits; a rollback discards them, so ids of rows that were never committed are
+    not cached.
+    """
+
+    KEY_COLUMNS: dict[Type[Base], InstrumentedAttribute] = {
+        GenreModel: GenreModel.name,
+        ActorModel: ActorModel.name,
+        LanguageModel: LanguageModel.name,
+        CountryModel: CountryModel.code,
+    }
+
+    def __init__(self, max_entries: int = 10_000):
+        self._max_entries = max_entries
+        self._caches = {model: LRUCache(max_size=max_entries) for model in self.KEY_COLUMNS}
+
+    async def warm(self, db: AsyncSession) -> None:
+        """
+        Preload up to ``max_entries`` rows of every reference model.
+
+        Args:
+            db (AsyncSession): The database session to read from.
+        """
+        for model, key_column in self.KEY_COLUMNS.items():
+            result = await db.execute(select(key_column, model.id).limit(self._max_entries))
+            cache = self._caches[model]
+            for key, model_id in result.all():
+                cache.set(key, model_id)
+
+    async def resolve_ids(self, db: AsyncSession, model: Type[Base], keys: Iterable[str]) -> dict[str, int]:
+        """
+        Return the ids of the given names, creating the rows that do not exist yet.
+
+        Args:
+            db (AsyncSession): The database session; new rows are inserted but not committed.
+            model (Type[Base]): One of the reference models in ``KEY_COLUMNS``.
+            keys (Iterable[str]): The names (or country codes) to resolve.
+
+        Returns:
+            dict[str, int]: A mapping of every requested key to its id.
+        """
+        key_column = self.KEY_COLUMNS[model]
+        cache = self._caches[model]
+        pending = self._pending_ids(db)[model]
+
+        resolved: dict[str, int] = {}
+        misses = []
+        for key in dict.fromkeys(keys):
+            model_id = cache.get(key)
+            if model_id is None:
+                model_id = pending.get(key)
+            if model_id is None:
+                misses.append(key)
+            else:
+                resolved[key] = model_id
+
+        if misses:
+            found = await self._select_ids(db, model, key_column, misses)
+            missing = [key for key in misses if key not in found]
+            if missing:
+                found.update(await self._insert_ids(db, model, key_column, missing))
+                conflicted = [key for key in missing if key not in found]
+                if conflicted:
+                    found.update(await self._select_ids(db, model, key_column, conflicted))
+
+            pending.update(found)
+            resolved.update(found)
+
+        return resolved
+
+    def _pending_ids(self, db: AsyncSession) -> dict[Type[Base], dict[str, int]]:
+        """
+        Return the ids resolved in the session's transaction, registering the commit and
+        rollback hooks that cache or discard them on first use.
+        """
+        session = db.sync_session
+        pending = session.info.get(self)
+        if pending is None:
+            pending = session.info[self] = {model: {} for model in self.KEY_COLUMNS}
+            event.listen(session, "after_commit", self._cache_pending)
+            event.listen(session, "after_rollback", self._discard_pending)
+        return pending
+
+    def _cache_pending(self, session: Session) -> None:
+        for model, ids in session.info[self].items():
+            cache = self._caches[model]
+            for key, model_id in ids.items():
+                cache.set(key, model_id)
+            ids.clear()
+
+    def _discard_pending(self, session: Session) -> None:
+        for ids in session.info[self].values():
+            ids.clear()
+
+    def invalidate(self) -> None:
+        """
+        Drop every cached id.
+        """
+        for cache in self._caches.values():
+            cache.clear()
+
+    @staticmethod
+    async def _select_ids(
+            db: AsyncSession,
+            model: Type[Base],
+            key_column: InstrumentedAttribute,
+            keys: list[str],
+    ) -> dict[str, int]:
+        found = {}
+        for start in range(0, len(keys), MAX_KEYS_PER_STATEMENT):
+            chunk = keys[start:start + MAX_KEYS_PER_STATEMENT]
+            result = await db.execute(select(key_column, model.id).where(key_column.in_(chunk)))
+            found.update(result.all())
+        return found
+
+    @staticmethod
+    async def _insert_ids(
+            db: AsyncSession,
+            model: Type[Base],
+            key_column: InstrumentedAttribute,
+            keys: list[str],
+    ) -> dict[str, int]:
+        inserted = {}
+        for start in range(0, len(keys), MAX_KEYS_PER_STATEMENT):
+            chunk = keys[start:start + MAX_KEYS_PER_STATEMENT]
+            stmt = (
+                dialect_insert(db, model)
+                .values([{key_column.key: key} for key in chunk])
+                .on_conflict_do_nothing(index_elements=[key_column.key])
+                .returning(key_column, model.id)
+            )
+            result = await db.execute(stmt)
+            inserted.update(result.all())
+        return inserted
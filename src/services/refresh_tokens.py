@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import select, delete, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import RefreshTokenModel
+from security.utils import hash_token
+
+
+async def store_refresh_token(
+        db: AsyncSession,
+        user_id: int,
+        token: str,
+        days_valid: int,
+        max_per_user: int,
+) -> None:
+    """
+    Store a newly issued refresh token and trim the user's other tokens.
+
+    After the insert, the user's expired tokens and all but the ``max_per_user`` most recently
+    issued live tokens are deleted with one statement, so every user keeps a bounded number of
+    rows. The caller commits.
+
+    Args:
+        db (AsyncSession): The database session.
+        user_id (int): The owner of the token.
+        token (str): The raw refresh token; only its digest is stored.
+        days_valid (int): The number of days the token is valid.
+        max_per_user (int): The number of live tokens a user may hold.
+    """
+    db.add(RefreshTokenModel.create(user_id=user_id, days_valid=days_valid, token=token))
+    await db.flush()
+
+    newest = (
+        select(RefreshTokenModel.id)
+        .where(RefreshTokenModel.user_id == user_id)
+        .order_by(RefreshTokenModel.id.desc())
+        .limit(max_per_user)
+    )
+    await db.execute(
+        delete(RefreshTokenModel)
+        .where(
+            RefreshTokenModel.user_id == user_id,
+            or_(
+                RefreshTokenModel.expires_at < datetime.now(timezone.utc),
+                RefreshTokenModel.id.not_in(newest.scalar_subquery()),
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
+    """
+    Delete a stored refresh token. The caller commits.
+
+    The delete doubles as the existence check, so of two concurrent requests presenting the
+    same token only one succeeds; this is what makes rotation single-use.
+
+    Args:
+        db (AsyncSession): The database session.
+        token (str): The raw refresh token.
+
+    Returns:
+        bool: True if the token was stored and has been deleted.
+    """
+    result = await db.execute(
+        delete(RefreshTokenModel)
+        .where(RefreshTokenModel.token == hash_token(token))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount > 0
+
+
+async def revoke_user_refresh_tokens(db: AsyncSession, user_id: int) -> None:
+    """
+    Delete every stored refresh token of a user. The caller commits.
+
+    Args:
+        db (AsyncSession): The database session.
+        user_id (int): The owner of the tokens.
+    """
+    await db.execute(
+        delete(RefreshTokenModel)
+        .where(RefreshTokenModel.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    )
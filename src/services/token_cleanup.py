@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import ActivationTokenModel, PasswordResetTokenModel, RefreshTokenModel
+from database.models.accounts import TokenBaseModel
+
+logger = logging.getLogger(__name__)
+
+EXPIRING_TOKEN_MODELS: tuple[type[TokenBaseModel], ...] = (
+    ActivationTokenModel,
+    PasswordResetTokenModel,
+    RefreshTokenModel,
+)
+
+
+async def delete_expired_tokens(
+        db: AsyncSession,
+        model: type[TokenBaseModel],
+        batch_size: int,
+        pause_seconds: float = 0.0,
+) -> int:
+    """
+    Delete the expired rows of a token table in batches, committing after each batch.
+
+    Every batch selects at most ``batch_size`` ids through the ``expires_at`` index and deletes
+    them by primary key, so each transaction touches a bounded number of rows and holds its locks
+    only briefly. Sleeping ``pause_seconds`` between batches leaves room for concurrent writes to
+    the table.
+
+    Args:
+        db (AsyncSession): The database session.
+        model (type[TokenBaseModel]): The token model to clean up.
+        batch_size (int): The number of rows deleted per transaction.
+        pause_seconds (float): The pause between two batches.
+
+    Returns:
+        int: The number of deleted rows.
+    """
+    now = datetime.now(timezone.utc)
+    deleted = 0
+    while True:
+        expired = select(model.id).where(model.expires_at < now).limit(batch_size)
+        result = await db.execute(
+            delete(model)
+            .where(model.id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+        if pause_seconds:
+            await asyncio.sleep(pause_seconds)
+
+
+async def cleanup_expired_tokens(db: AsyncSession, batch_size: int, pause_seconds: float = 0.0) -> dict:
+    """
+    Delete the expired activation, password reset and refresh tokens.
+
+    Args:
+        db (AsyncSession): The database session.
+        batch_size (int): The number of rows deleted per transaction.
+        pause_seconds (float): The pause between two batches of the same table.
+
+    Returns:
+        dict: The number of deleted rows per table and the total duration in
+        ``duration_seconds``.
+    """
+    started = time.perf_counter()
+    report = {}
+    for model in EXPIRING_TOKEN_MODELS:
+        table_started = time.perf_counter()
+        report[model.__tablename__] = await delete_expired_tokens(db, model, batch_size, pause_seconds)
+        logger.info(
+            "Deleted %d expired rows from %s in %.2fs",
+            report[model.__tablename__], model.__tablename__, time.perf_counter() - table_started,
+        )
+    report["duration_seconds"] = round(time.perf_counter() - started, 3)
+    return report
@@ -24,3 +24,15 @@ class S3StorageInterface(ABC):
         :return: The full URL to access the file.
         """
         pass
+
+    async def connect(self) -> None:
+        """
+        Open the connections of the storage ahead of the first request; a no-op by default.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release the connections held by the storage; a no-op by default.
+        """
+        pass
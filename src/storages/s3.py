@@ -1,6 +1,10 @@
-from typing import Union
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from typing import Any, Optional, Union
 
 import aioboto3
+from botocore.config import Config
 from botocore.exceptions import (
     BotoCoreError,
     NoCredentialsError,
@@ -11,6 +15,8 @@ from botocore.exceptions import (
 from exceptions import S3ConnectionError, S3FileUploadError
 from storages import S3StorageInterface
 
+logger = logging.getLogger(__name__)
+
 
 class S3StorageClient(S3StorageInterface):
 
@@ -19,26 +25,83 @@ class S3StorageClient(S3StorageInterface):
         endpoint_url: str,
         access_key: str,
         secret_key: str,
-        bucket_name: str
+        bucket_name: str,
+        max_pool_connections: int = 10,
+        retry_mode: str = "standard",
+        max_attempts: int = 3,
     ):
         """
         Initialize the asynchronous S3 Storage Client using an aioboto3 Session.
 
+        The botocore client, with its HTTP connection pool, is opened on first use (or by
+        :meth:`connect`) and kept until :meth:`close`, so uploads reuse its connections. It
+        belongs to the event loop that opened it; used from another loop, the client is opened
+        anew and the old one is closed on its loop if that loop is still running.
+
         Args:
             endpoint_url (str): S3-compatible storage endpoint.
             access_key (str): Access key for authentication.
             secret_key (str): Secret key for authentication.
             bucket_name (str): Name of the bucket where files will be stored.
+            max_pool_connections (int): The maximum number of open HTTP connections.
+            retry_mode (str): The botocore retry mode: "legacy", "standard" or "adaptive".
+            max_attempts (int): The maximum number of attempts per request, retries included.
         """
         self._endpoint_url = endpoint_url
         self._access_key = access_key
         self._secret_key = secret_key
         self._bucket_name = bucket_name
+        self._config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={"mode": retry_mode, "max_attempts": max_attempts},
+        )
 
         self._session = aioboto3.Session(
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
         )
+        self._client = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _get_client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            previous_loop, previous_exit_stack = self._loop, self._exit_stack
+            self._loop, self._lock = loop, asyncio.Lock()
+            self._client, self._exit_stack = None, None
+            if previous_exit_stack is not None:
+                await self._close_abandoned_client(previous_exit_stack, previous_loop)
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    exit_stack = AsyncExitStack()
+                    self._client = await exit_stack.enter_async_context(
+                        self._session.client("s3", endpoint_url=self._endpoint_url, config=self._config)
+                    )
+                    self._exit_stack = exit_stack
+        return self._client
+
+    @staticmethod
+    async def _close_abandoned_client(exit_stack: AsyncExitStack, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Close the client of a previous event loop on that loop, or log it if the loop has stopped.
+        """
+        if not loop.is_running():
+            logger.warning("Abandoning the S3 client of a stopped event loop; its connections are not closed")
+            return
+        try:
+            closed = asyncio.run_coroutine_threadsafe(exit_stack.aclose(), loop)
+            await asyncio.wait_for(asyncio.wrap_future(closed), timeout=5.0)
+        except Exception:
+            logger.warning("Failed to close the S3 client of a previous event loop", exc_info=True)
+
+    async def connect(self) -> None:
+        """
+        Open the long-lived S3 client for the running event loop, unless it is already open.
+        """
+        await self._get_client()
 
     async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
         """
@@ -53,15 +116,13 @@ class S3StorageClient(S3StorageInterface):
             S3FileUploadError: If the file upload fails due to a BotoCore error.
         """
         try:
-            async with self._session.client(
-                "s3", endpoint_url=self._endpoint_url
-            ) as client:
-                await client.put_object(
-                    Bucket=self._bucket_name,
-                    Key=file_name,
-                    Body=file_data,
-                    ContentType="image/jpeg"
-                )
+            client = await self._get_client()
+            await client.put_object(
+                Bucket=self._bucket_name,
+                Key=file_name,
+                Body=file_data,
+                ContentType="image/jpeg"
+            )
         except (ConnectionError, HTTPClientError, NoCredentialsError) as e:
             raise S3ConnectionError(f"Failed to connect to S3 storage: {str(e)}") from e
         except BotoCoreError as e:
@@ -78,3 +139,11 @@ class S3StorageClient(S3StorageInterface):
             str: The full URL to access the file.
         """
         return f"{self._endpoint_url}/{self._bucket_name}/{file_name}"
+
+    async def close(self) -> None:
+        """
+        Close the S3 client and its HTTP connections.
+        """
+        exit_stack, self._exit_stack, self._client = self._exit_stack, None, None
+        if exit_stack is not None:
+            await exit_stack.aclose()
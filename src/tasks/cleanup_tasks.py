@@ -1,30 +1,31 @@
-from datetime import datetime, timezone
+import logging
+
 from celery import shared_task
-from sqlalchemy import delete
 
-from database import ActivationTokenModel, PasswordResetTokenModel
+from config.dependencies import get_settings
 from database.session_postgresql import AsyncPostgresqlSessionLocal
+from services.token_cleanup import cleanup_expired_tokens
+from tasks.runtime import worker_runtime
+
+logger = logging.getLogger(__name__)
 
 
-@shared_task
-def cleanup_expired_tokens():
+@shared_task(name="tasks.cleanup_expired_tokens")
+def cleanup_expired_tokens_task() -> dict:
     """
-    Celery task to delete expired activation and password reset tokens.
-    NOTE: This is a synchronous Celery task, but it runs async SQLAlchemy under the hood.
+    Celery task to delete expired activation, password reset and refresh tokens.
+
+    Rows are deleted in batches of TOKEN_CLEANUP_BATCH_SIZE with a pause of
+    TOKEN_CLEANUP_PAUSE_SECONDS between batches. Returns the deleted rows per table and the
+    duration.
     """
-    async def _cleanup():
+    async def _cleanup() -> dict:
+        settings = get_settings()
         async with AsyncPostgresqlSessionLocal() as session:
-            now = datetime.now(timezone.utc)
-            await session.execute(
-                delete(ActivationTokenModel).where(ActivationTokenModel.expires_at < now)
+            return await cleanup_expired_tokens(
+                session, settings.TOKEN_CLEANUP_BATCH_SIZE, settings.TOKEN_CLEANUP_PAUSE_SECONDS
             )
 
-            await session.execute(
-                delete(PasswordResetTokenModel).where(PasswordResetTokenModel.expires_at < now)
-            )
-            await session.comit()
-
-        import asyncio
-        asyncio.run(_cleanup())
-
-        return "Expired tokens deleted"
+    report = worker_runtime.run(_cleanup())
+    logger.info("Expired token cleanup finished: %s", report)
+    return report
@@ -1,32 +1,121 @@
-import asyncio
+import logging
+from dataclasses import asdict
+from decimal import Decimal
+from typing import Any, Optional
+
 from celery import shared_task
 
-from config.dependencies import get_settings
-from notifications.emails import EmailSender
+from config.dependencies import get_settings, get_accounts_email_notificator
+from database.session_postgresql import AsyncPostgresqlSessionLocal
+from exceptions import BaseEmailError, EmailTemplateError
+from notifications import BatchEmail, EmailSenderInterface
+from services.email_outbox import deliver_outbox_emails
+from tasks.runtime import worker_runtime
+
+logger = logging.getLogger(__name__)
+
+# A failed send is retried with exponential backoff; a broken template never succeeds.
+EMAIL_TASK_OPTIONS = {
+    "autoretry_for": (BaseEmailError,),
+    "dont_autoretry_for": (EmailTemplateError,),
+    "retry_backoff": True,
+    "retry_jitter": True,
+    "max_retries": 5,
+}
+
 
+def _email_sender() -> EmailSenderInterface:
+    return get_accounts_email_notificator(get_settings())
 
-@shared_task(name="tasks.send_activation_email")
+
+@shared_task(name="tasks.send_activation_email", **EMAIL_TASK_OPTIONS)
 def send_activation_email_task(email: str, activation_link: str) -> None:
     """
-    Celery task to send activation email.
+    Celery task to send an account activation email.
+    """
+    worker_runtime.run(_email_sender().send_activation_email(email, activation_link))
+
+
+@shared_task(name="tasks.send_activation_complete_email", **EMAIL_TASK_OPTIONS)
+def send_activation_complete_email_task(email: str, login_link: str) -> None:
+    """
+    Celery task to send an account activation completion email.
+    """
+    worker_runtime.run(_email_sender().send_activation_complete_email(email, login_link))
+
+
+@shared_task(name="tasks.send_password_reset_email", **EMAIL_TASK_OPTIONS)
+def send_password_reset_email_task(email: str, reset_link: str) -> None:
+    """
+    Celery task to send a password reset request email.
     """
+    worker_runtime.run(_email_sender().send_password_reset_email(email, reset_link))
+
 
-    async def _send():
+@shared_task(name="tasks.send_password_reset_complete_email", **EMAIL_TASK_OPTIONS)
+def send_password_reset_complete_email_task(email: str, login_link: str) -> None:
+    """
+    Celery task to send a password reset completion email.
+    """
+    worker_runtime.run(_email_sender().send_password_reset_complete_email(email, login_link))
+
+
+@shared_task(name="tasks.send_payment_confirmation_email", **EMAIL_TASK_OPTIONS)
+def send_payment_confirmation_email_task(email: str, order_id: int, amount: str, transaction_id: str) -> None:
+    """
+    Celery task to send a payment confirmation email.
+
+    The amount is passed as a string, as task arguments are serialized to JSON; the transaction
+    id is the payment provider's reference and is passed through unchanged.
+    """
+    worker_runtime.run(
+        _email_sender().send_payment_confirmation_email(email, order_id, Decimal(amount), transaction_id)
+    )
+
+
+@shared_task(name="tasks.send_batch_email")
+def send_batch_email_task(
+        template_name: str,
+        subject: str,
+        emails: list[dict[str, Any]],
+        shared_context: Optional[dict[str, Any]] = None,
+) -> dict:
+    """
+    Celery task to send one template to many recipients.
+
+    ``emails`` holds a ``recipient`` and an optional ``context`` per message. The task is not
+    retried, as that would resend the delivered messages; returns the recipients sent to and
+    the errors of those that failed.
+    """
+    result = worker_runtime.run(_email_sender().send_batch(
+        template_name,
+        subject,
+        [BatchEmail(**email) for email in emails],
+        shared_context,
+    ))
+    return asdict(result)
+
+
+@shared_task(name="tasks.deliver_email_outbox")
+def deliver_email_outbox_task() -> dict:
+    """
+    Celery task to deliver the due emails of the email outbox.
+
+    Scheduled every EMAIL_OUTBOX_POLL_SECONDS; delivers batches of EMAIL_OUTBOX_BATCH_SIZE emails
+    until no due email is left and returns the number of sent, retried and dead emails.
+    """
+    async def _deliver() -> dict:
         settings = get_settings()
+        async with AsyncPostgresqlSessionLocal() as session:
+            return await deliver_outbox_emails(
+                session,
+                get_accounts_email_notificator(settings),
+                batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+                max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+                retry_delay_seconds=settings.EMAIL_OUTBOX_RETRY_DELAY_SECONDS,
+            )
 
-        sender = EmailSender(
-            hostname=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            email=settings.SMTP_EMAIL,
-            password=settings.SMTP_PASSWORD,
-            use_tls=settings.SMTP_USE_TLS,
-            template_dir=settings.EMAIL_TEMPLATE_DIR,
-            activation_email_template_name=settings.ACTIVATION_EMAIL_TEMPLATE,
-            activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_TEMPLATE,
-            password_email_template_name=settings.PASSWORD_RESET_TEMPLATE,
-            password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE,
-        )
-
-        await sender.send_activation_email(email, activation_link)
-
-    asyncio.run(_send())
+    report = worker_runtime.run(_deliver())
+    if any(report.values()):
+        logger.info("Email outbox delivered: %s", report)
+    return report
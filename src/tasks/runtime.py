@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncWorkerRuntime:
+    """
+    A long-lived event loop running the coroutines of a worker process's tasks.
+
+    Celery tasks are synchronous. Running each of them with ``asyncio.run`` would start a new
+    loop per task, so nothing bound to a loop (pooled SMTP sessions, database connections)
+    could be kept from one task to the next. The runtime runs a single loop in a background
+    thread of the worker process; :meth:`run` submits a coroutine to it and waits for the
+    result, so services taken from the container keep their connections between tasks.
+
+    The loop is started by the ``worker_process_init`` signal, or on the first :meth:`run` in
+    pools that do not send it. A loop inherited through ``fork`` is discarded and a new one is
+    started in the child.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Whether this process has a running loop.
+        """
+        return self._loop is not None and self._pid == os.getpid()
+
+    def start(self) -> None:
+        """
+        Start the loop thread of this process, unless it is already running.
+        """
+        with self._lock:
+            if self.is_running:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._run_loop, args=(loop,), name="async-worker-runtime", daemon=True)
+            thread.start()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+        logger.info("Started the async worker runtime in process %s", self._pid)
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the loop of this process and return its result.
+
+        If the waiting thread is interrupted, as by a task time limit, the coroutine is cancelled.
+
+        Raises:
+            Exception: Whatever the coroutine raises.
+        """
+        self.start()
+        future: Future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the loop of this process and wait up to ``timeout`` seconds for its thread to end.
+        """
+        with self._lock:
+            if not self.is_running:
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+
+worker_runtime = AsyncWorkerRuntime()
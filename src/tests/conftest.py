@@ -5,6 +5,7 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from caches import clear_all_caches
 from config import get_settings, get_accounts_email_notificator, get_s3_storage_client
 from database import (
     reset_database,
@@ -18,6 +19,7 @@ from main import app
 from schemas import PaymentRequestSchema
 from security.interfaces import JWTAuthManagerInterface
 from security.token_manager import JWTAuthManager
+from services.email_outbox import deliver_outbox_emails
 from storages import S3StorageClient
 from tests.doubles.fakes.storage import FakeS3Storage
 from tests.doubles.stubs.emails import StubEmailSender
@@ -41,13 +43,15 @@ async def reset_db(request):
     Reset the SQLite database before each test function, except for tests marked with 'e2e'.
 
     By default, this fixture ensures that the database is cleared and recreated before every
-    test function to maintain test isolation. However, if the test is marked with 'e2e',
+    test function to maintain test isolation, and drops in-process caches that could still
+    hold data from the previous database. However, if the test is marked with 'e2e',
     the database reset is skipped to allow preserving state between end-to-end tests.
     """
     if "e2e" in request.keywords:
         yield
     else:
         await reset_database()
+        clear_all_caches()
         yield
 
 
@@ -160,6 +164,26 @@ async def e2e_db_session():
         yield session
 
 
+@pytest_asyncio.fixture(scope="function")
+async def deliver_email_outbox(settings, e2e_db_session):
+    """
+    Provide a coroutine function delivering the queued emails of the outbox.
+
+    The API only stores emails in the outbox; end-to-end tests call it to send them to MailHog
+    before inspecting the mailbox, as the Celery delivery task would.
+    """
+    async def deliver() -> None:
+        await deliver_outbox_emails(
+            e2e_db_session,
+            get_accounts_email_notificator(settings),
+            batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+            retry_delay_seconds=settings.EMAIL_OUTBOX_RETRY_DELAY_SECONDS,
+        )
+
+    return deliver
+
+
 @pytest_asyncio.fixture(scope="function")
 async def jwt_manager() -> JWTAuthManagerInterface:
     """
@@ -0,0 +1,59 @@
+import asyncio
+from typing import Dict, Optional, Set
+
+from aiohttp import web
+
+
+class FakeS3Server:
+    """
+    Fake S3-compatible server for testing.
+
+    This class answers just enough of the S3 HTTP API on a local socket for ``PutObject``
+    requests to succeed. It stores the uploaded objects by bucket and key and records the
+    client connections, identified by their peer address, that sent them, and which of them
+    are still open.
+    """
+
+    def __init__(self):
+        """
+        Initialize the fake server; call :meth:`start` to listen.
+        """
+        self.objects: Dict[str, bytes] = {}
+        self.connections: Set[tuple] = set()
+        self._transports: Dict[tuple, asyncio.BaseTransport] = {}
+        self.port: Optional[int] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def open_connections(self) -> int:
+        return sum(not transport.is_closing() for transport in self._transports.values())
+
+    @property
+    def endpoint_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def start(self) -> None:
+        """
+        Listen on a free local port, stored in ``port``.
+        """
+        app = web.Application()
+        app.router.add_put("/{bucket}/{key:.+}", self._put_object)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Stop listening and drop every connection.
+        """
+        await self._runner.cleanup()
+
+    async def _put_object(self, request: web.Request) -> web.Response:
+        peer = request.transport.get_extra_info("peername")
+        self.connections.add(peer)
+        self._transports[peer] = request.transport
+        key = f"{request.match_info['bucket']}/{request.match_info['key']}"
+        self.objects[key] = await request.read()
+        return web.Response(headers={"ETag": '"fake-etag"'})
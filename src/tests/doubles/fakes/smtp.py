@@ -0,0 +1,83 @@
+import asyncio
+from typing import List, Optional, Set
+
+
+class FakeSMTPServer:
+    """
+    Fake SMTP server for testing.
+
+    This class speaks just enough SMTP over a local socket for ``aiosmtplib`` to connect, log in
+    with ``AUTH PLAIN`` and send messages. It records the accepted messages and counts the
+    connections, refuses the recipients in ``refused_recipients``, and can drop every open
+    connection to simulate a server restart.
+    """
+
+    def __init__(self):
+        """
+        Initialize the fake server; call :meth:`start` to listen.
+        """
+        self.messages: List[str] = []
+        self.connections = 0
+        self.refused_recipients: Set[str] = set()
+        self.port: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: List[asyncio.StreamWriter] = []
+
+    async def start(self) -> None:
+        """
+        Listen on a free local port, stored in ``port``.
+        """
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Drop every connection and stop listening.
+        """
+        self.disconnect_all()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def disconnect_all(self) -> None:
+        """
+        Close every open connection without a reply, as a restarting server would.
+        """
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.append(writer)
+
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        try:
+            await reply("220 fake.smtp ready")
+            while line := (await reader.readline()).decode().rstrip("\r\n"):
+                command = line.split(" ", 1)[0].upper()
+                if command == "EHLO":
+                    await reply("250-fake.smtp")
+                    await reply("250 AUTH PLAIN")
+                elif command == "AUTH":
+                    await reply("235 Authentication successful")
+                elif command == "RCPT" and line.split("<", 1)[-1].rstrip(">") in self.refused_recipients:
+                    await reply("550 Mailbox unavailable")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = []
+                    while (data_line := (await reader.readline()).decode()) not in (".\r\n", ""):
+                        data.append(data_line)
+                    self.messages.append("".join(data))
+                    await reply("250 OK")
+                elif command == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("250 OK")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
@@ -1,6 +1,7 @@
 from decimal import Decimal
+from typing import Any, Iterable, Mapping, Optional
 
-from notifications import EmailSenderInterface
+from notifications import EmailSenderInterface, BatchEmail, BatchSendResult
 
 
 class StubEmailSender(EmailSenderInterface):
@@ -49,7 +50,7 @@ class StubEmailSender(EmailSenderInterface):
                                               email: str,
                                               order_id: int,
                                               amount: Decimal,
-                                              transaction_id: int) -> None:
+                                              transaction_id: str) -> None:
         """
                Stub implementation for sending a payment confirmation email.
 
@@ -57,6 +58,22 @@ class StubEmailSender(EmailSenderInterface):
                    email (str): The recipient's email address.
                    order_id (int): The order ID.
                    amount (float): The payment amount.
-                   transaction_id (int): |The transaction ID
+                   transaction_id (str): |The transaction ID
                    """
         return None
+
+    async def send_batch(self,
+                         template_name: str,
+                         subject: str,
+                         emails: Iterable[BatchEmail],
+                         shared_context: Optional[Mapping[str, Any]] = None) -> BatchSendResult:
+        """
+        Stub implementation for sending an email batch; every recipient counts as sent.
+
+        Args:
+            template_name (str): The template file to render.
+            subject (str): The subject of every message.
+            emails (Iterable[BatchEmail]): The recipients and their template variables.
+            shared_context (Optional[Mapping[str, Any]]): Template variables common to all messages.
+        """
+        return BatchSendResult(sent=[email.recipient for email in emails])
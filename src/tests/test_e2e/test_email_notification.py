@@ -17,7 +17,9 @@ from database import (
 @pytest.mark.e2e
 @pytest.mark.order(1)
 @pytest.mark.asyncio
-async def test_registration(e2e_client, reset_db_once_for_e2e, settings, seed_user_groups, e2e_db_session):
+async def test_registration(
+        e2e_client, reset_db_once_for_e2e, settings, seed_user_groups, e2e_db_session, deliver_email_outbox
+):
     """
     End-to-end test for user registration.
 
@@ -43,6 +45,7 @@ async def test_registration(e2e_client, reset_db_once_for_e2e, settings, seed_us
     response_data = response.json()
     assert response_data["email"] == user_data["email"]
 
+    await deliver_email_outbox()
     mailhog_url = f"http://{settings.EMAIL_HOST}:{settings.MAILHOG_API_PORT}/api/v2/messages"
     async with httpx.AsyncClient() as client:
         mailhog_response = await client.get(mailhog_url)
@@ -79,7 +82,7 @@ async def test_registration(e2e_client, reset_db_once_for_e2e, settings, seed_us
 @pytest.mark.e2e
 @pytest.mark.order(2)
 @pytest.mark.asyncio
-async def test_account_activation(e2e_client, settings, e2e_db_session):
+async def test_account_activation(e2e_client, settings, e2e_db_session, deliver_email_outbox):
     """
     End-to-end test for account activation.
 
@@ -121,6 +124,7 @@ async def test_account_activation(e2e_client, settings, e2e_db_session):
     activated_user = result_user.scalars().first()
     assert activated_user.is_active, f"User {user_email} is not active!"
 
+    await deliver_email_outbox()
     mailhog_url = f"http://{settings.EMAIL_HOST}:{settings.MAILHOG_API_PORT}/api/v2/messages"
     async with httpx.AsyncClient() as client:
         mailhog_response = await client.get(mailhog_url)
@@ -199,7 +203,7 @@ async def test_user_login(e2e_client, e2e_db_session):
 @pytest.mark.e2e
 @pytest.mark.order(4)
 @pytest.mark.asyncio
-async def test_request_password_reset(e2e_client, e2e_db_session, settings):
+async def test_request_password_reset(e2e_client, e2e_db_session, settings, deliver_email_outbox):
     """
     End-to-end test for requesting a password reset (async version).
 
@@ -233,6 +237,7 @@ async def test_request_password_reset(e2e_client, e2e_db_session, settings):
     reset_token = result.scalars().first()
     assert reset_token, f"Password reset token for email {user_email} was not created!"
 
+    await deliver_email_outbox()
     mailhog_url = f"http://{settings.EMAIL_HOST}:{settings.MAILHOG_API_PORT}/api/v2/messages"
     async with httpx.AsyncClient() as client:
         mailhog_response = await client.get(mailhog_url)
@@ -267,7 +272,7 @@ async def test_request_password_reset(e2e_client, e2e_db_session, settings):
 @pytest.mark.e2e
 @pytest.mark.order(5)
 @pytest.mark.asyncio
-async def test_reset_password(e2e_client, e2e_db_session, settings):
+async def test_reset_password(e2e_client, e2e_db_session, settings, deliver_email_outbox):
     """
     End-to-end test for resetting a user's password (async version).
 
@@ -328,6 +333,7 @@ async def test_reset_password(e2e_client, e2e_db_session, settings):
 
     await e2e_db_session.commit()
 
+    await deliver_email_outbox()
     mailhog_url = f"http://{settings.EMAIL_HOST}:{settings.MAILHOG_API_PORT}/api/v2/messages"
     async with httpx.AsyncClient() as client:
         mailhog_response = await client.get(mailhog_url)
@@ -1,7 +1,11 @@
+import asyncio
+import time
 from datetime import datetime, timezone, timedelta
-from unittest.mock import patch
+from decimal import Decimal
+from unittest.mock import patch, AsyncMock
 
 import pytest
+from passlib.hash import bcrypt
 from sqlalchemy import select, delete, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
@@ -12,8 +16,19 @@ from database import (
     PasswordResetTokenModel,
     UserGroupModel,
     UserGroupEnum,
-    RefreshTokenModel
+    RefreshTokenModel,
+    EmailOutboxModel,
+    EmailOutboxStatusEnum
 )
+from exceptions import PasswordServiceBusyError, BaseEmailError
+from notifications import BatchEmail, BatchSendResult, EmailSenderInterface
+from notifications.outbox import OutboxEmailSender
+from config import get_token_revocation_list
+from main import app
+from revocation import InMemoryRevocationStore, TokenRevocationList
+from security.utils import hash_token
+from services.email_outbox import deliver_outbox_emails
+from services.token_cleanup import cleanup_expired_tokens, delete_expired_tokens
 
 
 @pytest.mark.asyncio
@@ -726,7 +741,8 @@ async def test_login_user_success(client, db_session, jwt_manager, seed_user_gro
     result_refresh = await db_session.execute(stmt_refresh)
     refresh_token_record = result_refresh.scalars().first()
     assert refresh_token_record is not None, "Refresh token was not stored in the database."
-    assert refresh_token_record.token == response_data["refresh_token"], "Stored refresh token does not match."
+    assert refresh_token_record.token == hash_token(response_data["refresh_token"]), \
+        "Stored refresh token digest does not match."
 
     expires_at = refresh_token_record.expires_at
     if expires_at.tzinfo is None:
@@ -856,6 +872,76 @@ async def test_login_user_commit_error(client, db_session, seed_user_groups):
     )
 
 
+@pytest.mark.asyncio
+async def test_login_user_upgrades_outdated_password_hash(client, db_session, settings, seed_user_groups):
+    """
+    Test that a successful login re-hashes a password stored under an outdated cost policy.
+
+    Validates that the stored hash is replaced with one using the configured bcrypt rounds,
+    and that the new hash still verifies the password.
+    """
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    stmt = select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER)
+    result = await db_session.execute(stmt)
+    user_group = result.scalars().first()
+    assert user_group is not None, "Default user group should exist."
+
+    user = UserModel.create(
+        email=user_payload["email"],
+        raw_password=user_payload["password"],
+        group_id=user_group.id
+    )
+    user._hashed_password = bcrypt.using(rounds=settings.PASSWORD_BCRYPT_ROUNDS + 1).hash(user_payload["password"])
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await client.post("/api/v1/accounts/login/", json=user_payload)
+    assert response.status_code == 201, "Expected status code 201 for successful login."
+
+    await db_session.refresh(user)
+    assert user._hashed_password.startswith(f"$2b${settings.PASSWORD_BCRYPT_ROUNDS:02d}$"), \
+        "Password hash should be upgraded to the configured bcrypt rounds."
+    assert user.verify_password(user_payload["password"]), "Upgraded hash should verify the password."
+
+
+@pytest.mark.asyncio
+async def test_login_user_password_service_busy(client, db_session, seed_user_groups):
+    """
+    Test login when the password hashing pool is saturated.
+
+    Validates that the endpoint answers 503 with a Retry-After header instead of queueing the request.
+    """
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    stmt = select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER)
+    result = await db_session.execute(stmt)
+    user_group = result.scalars().first()
+    assert user_group is not None, "Default user group should exist."
+
+    user = UserModel.create(
+        email=user_payload["email"],
+        raw_password=user_payload["password"],
+        group_id=user_group.id
+    )
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    with patch("routes.accounts.PasswordService.verify_and_update", side_effect=PasswordServiceBusyError):
+        response = await client.post("/api/v1/accounts/login/", json=user_payload)
+
+    assert response.status_code == 503, "Expected status code 503 when the password pool is saturated."
+    assert response.json()["detail"] == "The server is busy, please try again later.", \
+        "Unexpected error message for a saturated password pool."
+    assert response.headers.get("retry-after") == "1", "Expected a Retry-After header."
+
+
 @pytest.mark.asyncio
 async def test_refresh_access_token_success(client, db_session, jwt_manager, seed_user_groups):
     """
@@ -992,3 +1078,506 @@ async def test_refresh_access_token_user_not_found(client, db_session, jwt_manag
 
     assert refresh_response.status_code == 404, "Expected status code 404 for non-existent user."
     assert refresh_response.json()["detail"] == "User not found.", "Unexpected error message."
+
+
+@pytest.mark.asyncio
+async def test_logout_user_revokes_refresh_token(client, db_session, seed_user_groups):
+    """
+    Test logout with a valid refresh token.
+
+    Validates that the refresh token is deleted, so it can no longer refresh the access token
+    or be used to log out again.
+    """
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    stmt = select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER)
+    result = await db_session.execute(stmt)
+    user_group = result.scalars().first()
+    assert user_group is not None, "Default user group should exist."
+
+    user = UserModel.create(
+        email=user_payload["email"],
+        raw_password=user_payload["password"],
+        group_id=user_group.id
+    )
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    login_response = await client.post("/api/v1/accounts/login/", json=user_payload)
+    assert login_response.status_code == 201, "Expected status code 201 for successful login."
+    refresh_payload = {"refresh_token": login_response.json()["refresh_token"]}
+
+    response = await client.post("/api/v1/accounts/logout/", json=refresh_payload)
+    assert response.status_code == 200, "Expected status code 200 for successful logout."
+    assert response.json()["message"] == "Logged out successfully."
+
+    stmt = select(func.count(RefreshTokenModel.id)).where(RefreshTokenModel.user_id == user.id)
+    result = await db_session.execute(stmt)
+    assert result.scalar_one() == 0, "Refresh token should be deleted on logout."
+
+    response = await client.post("/api/v1/accounts/refresh/", json=refresh_payload)
+    assert response.status_code == 401, "Revoked refresh token should not refresh the access token."
+
+    response = await client.post("/api/v1/accounts/logout/", json=refresh_payload)
+    assert response.status_code == 401, "Expected status code 401 for an already revoked token."
+
+
+@pytest.mark.asyncio
+async def test_logout_user_revokes_access_token(client, db_session, seed_user_groups):
+    """
+    Test logout with the access token sent as a bearer token.
+
+    Validates that the access token is rejected afterwards, while a newly issued one works.
+    """
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    await _create_active_user(db_session, user_payload["email"], user_payload["password"])
+
+    login_response = await client.post("/api/v1/accounts/login/", json=user_payload)
+    assert login_response.status_code == 201, "Expected status code 201 for successful login."
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 200, "The access token should be valid before logout."
+
+    response = await client.post(
+        "/api/v1/accounts/logout/",
+        json={"refresh_token": login_response.json()["refresh_token"]},
+        headers=headers,
+    )
+    assert response.status_code == 200, "Expected status code 200 for successful logout."
+
+    response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 401, "The access token should be revoked by logout."
+    assert response.json()["detail"] == "Token has been revoked"
+
+    login_response = await client.post("/api/v1/accounts/login/", json=user_payload)
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 200, "A token issued after logout should be valid."
+
+
+@pytest.mark.asyncio
+async def test_reset_password_revokes_user_tokens(client, db_session, seed_user_groups):
+    """
+    Test that completing a password reset ends the user's sessions.
+
+    Validates that access and refresh tokens issued before the reset are rejected, while
+    tokens from a login with the new password work.
+    """
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    user = await _create_active_user(db_session, user_payload["email"], user_payload["password"])
+
+    login_response = await client.post("/api/v1/accounts/login/", json=user_payload)
+    assert login_response.status_code == 201, "Expected status code 201 for successful login."
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 200, "The access token should be valid before the reset."
+
+    reset_token = PasswordResetTokenModel(user_id=user.id)
+    db_session.add(reset_token)
+    await db_session.commit()
+
+    reset_complete_payload = {
+        "email": user_payload["email"],
+        "token": reset_token.token,
+        "password": "NewSecurePassword123!"
+    }
+    response = await client.post("/api/v1/accounts/reset-password/complete/", json=reset_complete_payload)
+    assert response.status_code == 200, "Expected status code 200 for successful password reset."
+
+    response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 401, "Access tokens issued before the reset should be revoked."
+
+    response = await client.post(
+        "/api/v1/accounts/refresh/", json={"refresh_token": login_response.json()["refresh_token"]}
+    )
+    assert response.status_code == 401, "Refresh tokens issued before the reset should be deleted."
+
+    login_response = await client.post(
+        "/api/v1/accounts/login/",
+        json={"email": user_payload["email"], "password": reset_complete_payload["password"]},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 200, "A token issued after the reset should be valid."
+
+
+
+class UnavailableRevocationStore(InMemoryRevocationStore):
+    """
+    A revocation store whose server is down for writes.
+    """
+
+    async def add(self, key: str, revoked_at: float, ttl: float) -> None:
+        raise ConnectionError("Connection refused")
+
+
+@pytest.mark.asyncio
+async def test_session_end_fails_without_changes_when_revocation_store_unavailable(
+        client, db_session, seed_user_groups
+):
+    """
+    Test that logout and password reset change nothing when access tokens cannot be revoked.
+
+    Validates that both answer 503, the refresh token stays usable and the password is unchanged.
+    """
+    app.dependency_overrides[get_token_revocation_list] = lambda: TokenRevocationList(
+        UnavailableRevocationStore(), user_revocation_ttl_seconds=3600
+    )
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    user = await _create_active_user(db_session, user_payload["email"], user_payload["password"])
+    login_response = await client.post("/api/v1/accounts/login/", json=user_payload)
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    refresh_token = login_response.json()["refresh_token"]
+
+    response = await client.post("/api/v1/accounts/logout/", json={"refresh_token": refresh_token}, headers=headers)
+    assert response.status_code == 503, "Expected status code 503 when the access token cannot be revoked."
+    response = await client.post("/api/v1/accounts/refresh/", json={"refresh_token": refresh_token})
+    assert response.status_code == 200, "The refresh token should be kept when logout fails."
+
+    reset_token = PasswordResetTokenModel(user_id=user.id)
+    db_session.add(reset_token)
+    await db_session.commit()
+    response = await client.post(
+        "/api/v1/accounts/reset-password/complete/",
+        json={"email": user_payload["email"], "token": reset_token.token, "password": "NewSecurePassword123!"},
+    )
+    assert response.status_code == 503, "Expected status code 503 when the user's tokens cannot be revoked."
+    response = await client.post("/api/v1/accounts/login/", json=user_payload)
+    assert response.status_code == 201, "The password should be unchanged when the reset fails."
+
+
+@pytest.mark.asyncio
+async def test_token_revocation_list_syncs_in_background():
+    """
+    Test that revocations made by another worker are picked up by the background sync, not by lookups.
+    """
+    store = InMemoryRevocationStore()
+    revocation_list = TokenRevocationList(store, user_revocation_ttl_seconds=3600, sync_interval_seconds=0.01)
+    await store.add("jti:other-worker", time.time(), 60)
+
+    assert not await revocation_list.is_revoked("other-worker", None, None), \
+        "Lookups should not rebuild the filter from the store."
+
+    revocation_list.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert await revocation_list.is_revoked("other-worker", None, None), \
+            "The background sync should pick up revocations of other workers."
+    finally:
+        await revocation_list.close()
+
+
+async def _create_active_user(db_session, email: str, password: str) -> UserModel:
+    stmt = select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER)
+    result = await db_session.execute(stmt)
+    user_group = result.scalars().first()
+    assert user_group is not None, "Default user group should exist."
+
+    user = UserModel.create(email=email, raw_password=password, group_id=user_group.id)
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_rotates_refresh_token(client, db_session, seed_user_groups):
+    """
+    Test that refreshing rotates the refresh token.
+
+    Validates that the response carries a new refresh token that works, and that the presented
+    token is revoked, so replaying it fails.
+    """
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    await _create_active_user(db_session, user_payload["email"], user_payload["password"])
+
+    login_response = await client.post("/api/v1/accounts/login/", json=user_payload)
+    assert login_response.status_code == 201, "Expected status code 201 for successful login."
+    old_refresh_token = login_response.json()["refresh_token"]
+
+    refresh_response = await client.post("/api/v1/accounts/refresh/", json={"refresh_token": old_refresh_token})
+    assert refresh_response.status_code == 200, "Expected status code 200 for successful token refresh."
+    new_refresh_token = refresh_response.json()["refresh_token"]
+    assert new_refresh_token != old_refresh_token, "Refresh token should be rotated."
+
+    replay_response = await client.post("/api/v1/accounts/refresh/", json={"refresh_token": old_refresh_token})
+    assert replay_response.status_code == 401, "A rotated refresh token should not be accepted again."
+
+    refresh_response = await client.post("/api/v1/accounts/refresh/", json={"refresh_token": new_refresh_token})
+    assert refresh_response.status_code == 200, "The rotated refresh token should be accepted."
+
+
+@pytest.mark.asyncio
+async def test_login_user_caps_refresh_tokens_per_user(client, db_session, settings, seed_user_groups, monkeypatch):
+    """
+    Test that a user keeps at most REFRESH_TOKENS_MAX_PER_USER refresh tokens.
+
+    Validates that logging in more often drops the oldest tokens and keeps the newest ones usable.
+    """
+    monkeypatch.setattr(settings, "REFRESH_TOKENS_MAX_PER_USER", 2)
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    user = await _create_active_user(db_session, user_payload["email"], user_payload["password"])
+
+    refresh_tokens = []
+    for _ in range(3):
+        response = await client.post("/api/v1/accounts/login/", json=user_payload)
+        assert response.status_code == 201, "Expected status code 201 for successful login."
+        refresh_tokens.append(response.json()["refresh_token"])
+
+    stmt = select(RefreshTokenModel.token).where(RefreshTokenModel.user_id == user.id)
+    result = await db_session.execute(stmt)
+    stored = set(result.scalars().all())
+    assert stored == {hash_token(token) for token in refresh_tokens[1:]}, \
+        "Only the two most recent refresh tokens should be kept."
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_refresh_tokens(db_session, seed_user_groups):
+    """
+    Test batched deletion of expired refresh tokens.
+
+    Validates that every expired token is deleted across several batches and live tokens are kept.
+    """
+    user = await _create_active_user(db_session, "testuser@example.com", "StrongPassword123!")
+    db_session.add_all(
+        [RefreshTokenModel.create(user_id=user.id, days_valid=-1, token=f"expired-{number}") for number in range(5)]
+        + [RefreshTokenModel.create(user_id=user.id, days_valid=1, token="live")]
+    )
+    await db_session.commit()
+
+    deleted = await delete_expired_tokens(db_session, RefreshTokenModel, batch_size=2)
+
+    assert deleted == 5, "Every expired refresh token should be deleted."
+    stmt = select(RefreshTokenModel.token).where(RefreshTokenModel.user_id == user.id)
+    result = await db_session.execute(stmt)
+    assert result.scalars().all() == [hash_token("live")], "Live refresh tokens should be kept."
+
+
+@pytest.mark.asyncio
+async def test_login_user_rate_limited_by_email(client, db_session, settings, seed_user_groups, monkeypatch):
+    """
+    Test that repeated login attempts for one email are rate limited.
+
+    Validates that once the email's bucket is empty the endpoint answers 429 with a Retry-After
+    header, without verifying the password.
+    """
+    monkeypatch.setattr(settings, "AUTH_RATE_LIMIT_EMAIL_CAPACITY", 2)
+    user_payload = {
+        "email": "testuser@example.com",
+        "password": "WrongPassword123!"
+    }
+    await _create_active_user(db_session, user_payload["email"], "StrongPassword123!")
+
+    for _ in range(2):
+        response = await client.post("/api/v1/accounts/login/", json=user_payload)
+        assert response.status_code == 401, "Expected status code 401 for a wrong password."
+
+    with patch("routes.accounts.PasswordService.verify_and_update") as verify_mock:
+        response = await client.post("/api/v1/accounts/login/", json=user_payload)
+
+    assert response.status_code == 429, "Expected status code 429 once the email's bucket is empty."
+    assert response.json()["detail"] == "Too many requests, please try again later.", \
+        "Unexpected error message for a rate limited request."
+    assert int(response.headers["retry-after"]) > 0, "Expected a Retry-After header."
+    verify_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_login_user_rate_limited_by_forwarded_client_ip(client, settings, monkeypatch):
+    """
+    Test that behind a trusted proxy login attempts are rate limited per forwarded client IP.
+
+    Validates that:
+    1. Clients behind the proxy get separate buckets, taken from X-Forwarded-For.
+    2. A forged X-Forwarded-For hop left of the proxy's own does not change the bucket.
+    3. Without a trusted proxy the header is ignored and the peer address is used.
+    """
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", "127.0.0.1")
+    monkeypatch.setattr(settings, "AUTH_RATE_LIMIT_IP_CAPACITY", 2)
+    monkeypatch.setattr(settings, "AUTH_RATE_LIMIT_EMAIL_CAPACITY", 100)
+    payload = {"email": "nobody@example.com", "password": "WrongPassword123!"}
+
+    async def login(forwarded_for):
+        return await client.post("/api/v1/accounts/login/", json=payload, headers={"X-Forwarded-For": forwarded_for})
+
+    for forged in ("10.0.0.1", "10.0.0.2"):
+        response = await login(f"{forged}, 203.0.113.7")
+        assert response.status_code == 401, "Expected status code 401 while the client has budget left."
+    response = await login("10.0.0.3, 203.0.113.7")
+    assert response.status_code == 429, "Forged hops should not give a client a new bucket."
+
+    response = await login("198.51.100.4")
+    assert response.status_code == 401, "Another client behind the proxy should have its own bucket."
+
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", "")
+    for _ in range(2):
+        response = await login("192.0.2.1")
+        assert response.status_code == 401, "Expected status code 401 while the peer has budget left."
+    response = await login("192.0.2.2")
+    assert response.status_code == 429, "Without a trusted proxy the peer address should be limited."
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_tokens(db_session, seed_user_groups):
+    """
+    Test the batched cleanup of expired activation, password reset and refresh tokens.
+
+    Validates that expired rows of every token table are deleted across several batches, live
+    rows are kept, and the deleted rows are reported per table.
+    """
+    expired_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+    users = [
+        await _create_active_user(db_session, f"testuser{number}@example.com", "StrongPassword123!")
+        for number in range(3)
+    ]
+    db_session.add_all(
+        [ActivationTokenModel(user_id=user.id, expires_at=expired_at) for user in users]
+        + [PasswordResetTokenModel(user_id=users[0].id, expires_at=expired_at)]
+        + [PasswordResetTokenModel(user_id=users[1].id)]
+        + [RefreshTokenModel.create(user_id=users[0].id, days_valid=-1, token="expired")]
+    )
+    await db_session.commit()
+
+    report = await cleanup_expired_tokens(db_session, batch_size=2)
+
+    assert report["activation_tokens"] == 3, "Every expired activation token should be deleted."
+    assert report["password_reset_tokens"] == 1, "Only the expired password reset token should be deleted."
+    assert report["refresh_tokens"] == 1, "The expired refresh token should be deleted."
+    assert report["duration_seconds"] >= 0, "The cleanup duration should be reported."
+
+    result = await db_session.execute(select(func.count(ActivationTokenModel.id)))
+    assert result.scalar_one() == 0, "No activation tokens should remain."
+    result = await db_session.execute(select(PasswordResetTokenModel.user_id))
+    assert result.scalars().all() == [users[1].id], "The live password reset token should be kept."
+
+
+@pytest.mark.asyncio
+async def test_register_user_enqueues_activation_email(client, db_session, seed_user_groups):
+    """
+    Test that registration stores the activation email in the outbox instead of sending it.
+    """
+    payload = {
+        "email": "testuser@example.com",
+        "password": "StrongPassword123!"
+    }
+    response = await client.post("/api/v1/accounts/register/", json=payload)
+    assert response.status_code == 201, "Expected status code 201 Created."
+
+    result = await db_session.execute(select(EmailOutboxModel))
+    emails = result.scalars().all()
+    assert [(email.kind, email.recipient) for email in emails] == [("send_activation_email", payload["email"])], \
+        "The activation email should be queued in the outbox."
+    assert emails[0].status == EmailOutboxStatusEnum.PENDING
+
+
+@pytest.mark.asyncio
+async def test_deliver_outbox_emails(db_session):
+    """
+    Test delivery of queued emails.
+
+    Validates that delivered emails are sent with their original arguments and deleted from the outbox.
+    """
+    outbox = OutboxEmailSender(db_session)
+    await outbox.send_password_reset_email("first@example.com", "http://reset")
+    await outbox.send_payment_confirmation_email("second@example.com", 7, Decimal("9.99"), "tx_1")
+    await db_session.commit()
+
+    email_sender = AsyncMock(spec=EmailSenderInterface)
+    report = await deliver_outbox_emails(
+        db_session, email_sender, batch_size=1, max_attempts=3, retry_delay_seconds=0
+    )
+
+    assert report == {"sent": 2, "retried": 0, "dead": 0}, "Both emails should be sent."
+    email_sender.send_password_reset_email.assert_awaited_once_with(
+        email="first@example.com", reset_link="http://reset"
+    )
+    email_sender.send_payment_confirmation_email.assert_awaited_once_with(
+        email="second@example.com", order_id=7, amount=Decimal("9.99"), transaction_id="tx_1"
+    )
+    result = await db_session.execute(select(func.count(EmailOutboxModel.id)))
+    assert result.scalar_one() == 0, "Delivered emails should be deleted from the outbox."
+
+
+@pytest.mark.asyncio
+async def test_deliver_outbox_emails_retries_and_dead_letters(db_session):
+    """
+    Test delivery of an email that keeps failing.
+
+    Validates that the email is retried with its error recorded and dead-lettered once it used up its attempts.
+    """
+    await OutboxEmailSender(db_session).send_activation_email("testuser@example.com", "http://activate")
+    await db_session.commit()
+
+    email_sender = AsyncMock(spec=EmailSenderInterface)
+    email_sender.send_activation_email.side_effect = BaseEmailError("SMTP unavailable")
+
+    report = await deliver_outbox_emails(
+        db_session, email_sender, batch_size=10, max_attempts=2, retry_delay_seconds=0
+    )
+    assert report == {"sent": 0, "retried": 1, "dead": 0}, "The first failure should be retried."
+
+    report = await deliver_outbox_emails(
+        db_session, email_sender, batch_size=10, max_attempts=2, retry_delay_seconds=0
+    )
+    assert report == {"sent": 0, "retried": 0, "dead": 1}, "The last failure should dead-letter the email."
+
+    result = await db_session.execute(select(EmailOutboxModel))
+    email = result.scalars().one()
+    assert email.status == EmailOutboxStatusEnum.DEAD, "The email should be kept as dead."
+    assert email.attempts == 2
+    assert email.last_error == "SMTP unavailable"
+
+
+@pytest.mark.asyncio
+async def test_deliver_outbox_batch_emails_per_recipient(db_session):
+    """
+    Test queuing and delivery of a batch through the outbox.
+
+    Validates that every recipient is queued with its merged context and delivered on its own, so a failed
+    recipient is retried without resending the others.
+    """
+    result = await OutboxEmailSender(db_session).send_batch(
+        "notification.html",
+        "News",
+        [BatchEmail("first@example.com", {"name": "First"}), BatchEmail("second@example.com")],
+        shared_context={"name": "Everyone", "link": "http://news"},
+    )
+    await db_session.commit()
+    assert result.sent == ["first@example.com", "second@example.com"], "Every recipient should be queued."
+
+    email_sender = AsyncMock(spec=EmailSenderInterface)
+    email_sender.send_batch.side_effect = [
+        BatchSendResult(sent=["first@example.com"]),
+        BatchSendResult(failed={"second@example.com": "Recipient refused"}),
+    ]
+    report = await deliver_outbox_emails(
+        db_session, email_sender, batch_size=10, max_attempts=3, retry_delay_seconds=0
+    )
+
+    assert report == {"sent": 1, "retried": 1, "dead": 0}, "Only the failed recipient should be retried."
+    assert [call.args for call in email_sender.send_batch.await_args_list] == [
+        ("notification.html", "News", [BatchEmail("first@example.com", {"name": "First", "link": "http://news"})]),
+        ("notification.html", "News", [BatchEmail("second@example.com", {"name": "Everyone", "link": "http://news"})]),
+    ]
+    email = (await db_session.execute(select(EmailOutboxModel))).scalars().one()
+    assert email.recipient == "second@example.com"
+    assert email.last_error == "Recipient refused"
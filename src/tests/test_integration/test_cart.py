@@ -1,12 +1,19 @@
-from datetime import date
+import calendar
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import insert, select
+from sqlalchemy import insert, select, event
 
+from caches import UserPrincipal, UserPrincipalCache
+from config.dependencies_auth import get_current_user
 from database.models.movies import MovieStatusEnum
+from database.session_sqlite import sqlite_engine
 from main import app
+from revocation import InMemoryRevocationStore, TokenRevocationList
 
 
 @pytest.mark.asyncio
@@ -92,3 +99,71 @@ async def test_delete_movies_from_empty_cart(client, jwt_manager, test_user):
 
     response = await client.delete(f"/api/v1/cart/items/", headers=headers)
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_cart_uses_cached_user_principal(client, jwt_manager, test_user):
+    """Test that repeated authenticated requests skip the user lookup.
+
+    Endpoint: GET /api/v1/cart/me
+    Expected: The first request loads the user, later ones are served from the principal cache"""
+    token = jwt_manager.create_access_token(
+        {"sub": test_user.email, "id": test_user.id}
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 200
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(sqlite_engine.sync_engine, "before_cursor_execute", record_statement)
+    try:
+        response = await client.get("/api/v1/cart/me", headers=headers)
+    finally:
+        event.remove(sqlite_engine.sync_engine, "before_cursor_execute", record_statement)
+
+    assert response.status_code == 200
+    assert statements, "Expected the cart to be queried"
+    assert not any("FROM users" in statement for statement in statements), \
+        "Expected no user query on a principal cache hit"
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_the_same_principal_on_cache_hit_and_miss(db_session, jwt_manager, test_user):
+    """Test that the current user is a detached principal whether or not the cache was hit.
+
+    Expected: Equal principals on both paths; user attributes outside the principal are not exposed"""
+    token = jwt_manager.create_access_token({"sub": test_user.email, "id": test_user.id})
+    principal_cache = UserPrincipalCache(ttl=60)
+    revocation_list = TokenRevocationList(InMemoryRevocationStore(), user_revocation_ttl_seconds=3600)
+
+    loaded = await get_current_user(token, jwt_manager, db_session, principal_cache, revocation_list)
+    cached = await get_current_user(token, jwt_manager, db_session, principal_cache, revocation_list)
+
+    assert loaded == cached == UserPrincipal(
+        id=test_user.id, email=test_user.email, is_active=test_user.is_active, group_id=test_user.group_id
+    )
+    assert not hasattr(cached, "group"), "Relationships should not be reachable from the principal"
+
+
+@pytest.mark.asyncio
+async def test_get_cart_rejects_access_token_after_expiry(client, jwt_manager, test_user):
+    """Test that a decoded access token is not reused past its expiration.
+
+    Endpoint: GET /api/v1/cart/me
+    Expected: 200 while the token is valid, 401 once it has expired"""
+    token = jwt_manager.create_access_token(
+        {"sub": test_user.email, "id": test_user.id}, expires_delta=timedelta(seconds=1)
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 200
+
+    monotonic = time.monotonic
+    with patch("caches.memory.time.monotonic", side_effect=lambda: monotonic() + 60), \
+            patch("jose.jwt.timegm", side_effect=lambda timetuple: calendar.timegm(timetuple) + 60):
+        response = await client.get("/api/v1/cart/me", headers=headers)
+    assert response.status_code == 401
@@ -1,7 +1,14 @@
+import csv
+import gzip
+import io
+import json
 import random
+from datetime import date
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select, func
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import joinedload
 
 from database import MovieModel
@@ -9,8 +16,15 @@ from database import (
     GenreModel,
     ActorModel,
     LanguageModel,
-    CountryModel
+    CountryModel,
+    MoviesGenresModel
 )
+from caches import CacheBackendInterface, ResponseCache
+from config import get_response_cache
+from main import app
+from redis.exceptions import ConnectionError as RedisConnectionError
+from services.movie_import import MovieImporter
+from services.reference_data import ReferenceDataCache
 
 
 @pytest.mark.asyncio
@@ -222,6 +236,332 @@ async def test_movie_list_with_pagination(client, db_session, seed_database):
     assert response_data["next_page"] == expected_next_page, "Next page link mismatch."
 
 
+@pytest.mark.asyncio
+async def test_movie_list_cursor_pagination(client, seed_database):
+    """
+    Test that following `next_cursor` and `prev_cursor` walks the same pages as offset pagination.
+    """
+    per_page = 5
+
+    first_page = await client.get(f"/api/v1/theater/movies/?page=1&per_page={per_page}")
+    assert first_page.status_code == 200, f"Expected status code 200, but got {first_page.status_code}"
+    first_data = first_page.json()
+    assert first_data["prev_cursor"] is None, "Expected no prev_cursor on the first page."
+    assert first_data["next_cursor"], "Expected next_cursor on the first page."
+
+    second_page = await client.get(f"/api/v1/theater/movies/?page=2&per_page={per_page}")
+    expected_ids = [movie["id"] for movie in second_page.json()["movies"]]
+
+    cursor_page = await client.get(
+        f"/api/v1/theater/movies/?cursor={first_data['next_cursor']}&per_page={per_page}"
+    )
+    assert cursor_page.status_code == 200, f"Expected status code 200, but got {cursor_page.status_code}"
+    cursor_data = cursor_page.json()
+    assert [movie["id"] for movie in cursor_data["movies"]] == expected_ids, (
+        "Keyset page does not match the equivalent offset page."
+    )
+    assert cursor_data["next_page"] == (
+        f"/theater/movies/?cursor={cursor_data['next_cursor']}&per_page={per_page}"
+    ), "Next page link should carry the next cursor."
+
+    back_page = await client.get(
+        f"/api/v1/theater/movies/?cursor={cursor_data['prev_cursor']}&per_page={per_page}"
+    )
+    assert back_page.status_code == 200, f"Expected status code 200, but got {back_page.status_code}"
+    back_data = back_page.json()
+    assert [movie["id"] for movie in back_data["movies"]] == [movie["id"] for movie in first_data["movies"]], (
+        "Paging backwards should return the first page in canonical order."
+    )
+    assert back_data["prev_cursor"] is None, "Expected no prev_cursor when paging back to the first page."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_invalid_cursor(client, seed_database):
+    """
+    Test that a malformed cursor is rejected with a 400 error.
+    """
+    response = await client.get("/api/v1/theater/movies/?cursor=not-a-cursor")
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+    assert response.json() == {"detail": "Invalid pagination cursor."}
+
+
+@pytest.mark.asyncio
+async def test_movie_list_cursor_without_total(client, seed_database):
+    """
+    Test that cursor mode can skip counting and leaves the totals empty.
+    """
+    first_page = await client.get("/api/v1/theater/movies/?per_page=5")
+    next_cursor = first_page.json()["next_cursor"]
+
+    response = await client.get(f"/api/v1/theater/movies/?cursor={next_cursor}&per_page=5&include_total=false")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response_data = response.json()
+    assert len(response_data["movies"]) == 5, "Expected a full page of movies."
+    assert response_data["total_items"] is None, "Expected total_items to be skipped."
+    assert response_data["total_pages"] is None, "Expected total_pages to be skipped."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_total_refreshed_after_create_and_delete(client, db_session, seed_database):
+    """
+    Test that the cached total is invalidated when movies are created or deleted.
+    """
+    response = await client.get("/api/v1/theater/movies/")
+    initial_total = response.json()["total_items"]
+
+    movie_data = {
+        "name": "Cached Count Movie",
+        "date": "2024-05-01",
+        "score": 70.0,
+        "overview": "Checks count invalidation.",
+        "status": "Released",
+        "budget": 1000.00,
+        "revenue": 2000.00,
+        "country": "US",
+        "genres": ["Drama"],
+        "actors": ["Count Actor"],
+        "languages": ["English"]
+    }
+    await client.post("/api/v1/theater/movies/", json=movie_data)
+
+    stmt = select(MovieModel.id).where(MovieModel.name == movie_data["name"])
+    result = await db_session.execute(stmt)
+    movie_id = result.scalar_one()
+
+    response = await client.get("/api/v1/theater/movies/")
+    assert response.json()["total_items"] == initial_total + 1, "Total was not refreshed after create."
+
+    await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+
+    response = await client.get("/api/v1/theater/movies/")
+    assert response.json()["total_items"] == initial_total, "Total was not refreshed after delete."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_filter_by_genre_and_year(client, db_session, seed_database):
+    """
+    Test that genre and year filters are applied together and reflected in the totals.
+    """
+    stmt = (
+        select(MovieModel.id)
+        .join(MoviesGenresModel, MoviesGenresModel.c.movie_id == MovieModel.id)
+        .join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+        .where(GenreModel.name == "Drama", MovieModel.date >= date(2022, 1, 1))
+        .order_by(MovieModel.id.desc())
+    )
+    result = await db_session.execute(stmt)
+    expected_ids = list(result.scalars().all())
+    assert expected_ids, "Seed data should contain dramas released since 2022."
+
+    response = await client.get("/api/v1/theater/movies/?genre=drama&year_from=2022&per_page=20")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response_data = response.json()
+    assert [movie["id"] for movie in response_data["movies"]] == expected_ids, "Filtered movies mismatch."
+    assert response_data["total_items"] == len(expected_ids), "Filtered total mismatch."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_sorted_by_score_with_cursor(client, db_session, seed_database):
+    """
+    Test that walking a score-sorted list with cursors visits every movie exactly once, in order.
+    """
+    stmt = select(MovieModel.id).order_by(MovieModel.score.asc(), MovieModel.id.asc())
+    result = await db_session.execute(stmt)
+    expected_ids = list(result.scalars().all())
+
+    response = await client.get("/api/v1/theater/movies/?sort_by=score&order=asc&per_page=7")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    page_data = response.json()
+    collected_ids = [movie["id"] for movie in page_data["movies"]]
+
+    while page_data["next_page"]:
+        assert "sort_by=score" in page_data["next_page"], "Next page link lost the sort parameters."
+        response = await client.get(f"/api/v1{page_data['next_page']}")
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        page_data = response.json()
+        collected_ids.extend(movie["id"] for movie in page_data["movies"])
+
+    assert collected_ids == expected_ids, "Cursor walk does not match the score ordering."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_cursor_rejected_for_other_sort(client, seed_database):
+    """
+    Test that a cursor issued for one ordering cannot be reused with another.
+    """
+    response = await client.get("/api/v1/theater/movies/?per_page=5")
+    next_cursor = response.json()["next_cursor"]
+
+    response = await client.get(f"/api/v1/theater/movies/?cursor={next_cursor}&sort_by=revenue")
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_movie_list_inverted_range(client):
+    """
+    Test that an inverted year range is rejected.
+    """
+    response = await client.get("/api/v1/theater/movies/?year_from=2020&year_to=2010")
+    assert response.status_code == 422, f"Expected status code 422, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_movie_facets(client, db_session, seed_database):
+    """
+    Test that facet counts match per-genre counts in the database and that year buckets add up.
+    """
+    stmt = (
+        select(GenreModel.name, func.count())
+        .join(MoviesGenresModel, MoviesGenresModel.c.genre_id == GenreModel.id)
+        .group_by(GenreModel.name)
+    )
+    result = await db_session.execute(stmt)
+    expected_genres = dict(result.all())
+
+    total_result = await db_session.execute(select(func.count(MovieModel.id)))
+    total_movies = total_result.scalar_one()
+
+    response = await client.get("/api/v1/theater/movies/facets/?year_bucket=5")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response_data = response.json()
+    assert response_data["total_items"] == total_movies, "Facet total mismatch."
+    assert {item["value"]: item["count"] for item in response_data["genres"]} == expected_genres, (
+        "Genre facet counts mismatch."
+    )
+    assert sum(item["count"] for item in response_data["years"]) == total_movies, "Year buckets do not add up."
+    for bucket in response_data["years"]:
+        assert bucket["year_from"] % 5 == 0, "Year bucket is not aligned."
+        assert bucket["year_to"] == bucket["year_from"] + 4, "Year bucket has the wrong width."
+
+
+def _search_movie_payload(name: str, overview: str) -> dict:
+    return {
+        "name": name,
+        "date": "2024-05-01",
+        "score": 70.0,
+        "overview": overview,
+        "status": "Released",
+        "budget": 1000.00,
+        "revenue": 2000.00,
+        "country": "US",
+        "genres": ["Drama"],
+        "actors": ["Search Actor"],
+        "languages": ["English"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_movies_ranks_name_matches_first(client, db_session):
+    """
+    Test that all query words must match and that name matches outrank overview matches.
+    """
+    await client.post("/api/v1/theater/movies/", json=_search_movie_payload(
+        "Quiet Lighthouse", "A keeper waits for ships."
+    ))
+    await client.post("/api/v1/theater/movies/", json=_search_movie_payload(
+        "Stormy Harbour", "A quiet town hides a lighthouse secret."
+    ))
+    await client.post("/api/v1/theater/movies/", json=_search_movie_payload(
+        "Quiet Mountain", "Nothing to see here."
+    ))
+
+    response = await client.get("/api/v1/theater/movies/search/?q=quiet lighthouse")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response_data = response.json()
+    names = [movie["name"] for movie in response_data["movies"]]
+    assert names == ["Quiet Lighthouse", "Stormy Harbour"], f"Unexpected search results: {names}"
+    assert response_data["movies"][0]["rank"] > response_data["movies"][1]["rank"], "Results are not ranked."
+    assert response_data["next_page"] is None, "Expected no next page."
+
+
+@pytest.mark.asyncio
+async def test_search_movies_tolerates_typos(client, db_session):
+    """
+    Test that a misspelled query still finds the movie.
+    """
+    await client.post("/api/v1/theater/movies/", json=_search_movie_payload(
+        "Quiet Lighthouse", "A keeper waits for ships."
+    ))
+
+    response = await client.get("/api/v1/theater/movies/search/?q=lighthuose")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert [movie["name"] for movie in response.json()["movies"]] == ["Quiet Lighthouse"]
+
+
+@pytest.mark.asyncio
+async def test_search_movies_pagination_and_invalidation(client, db_session, seed_database):
+    """
+    Test search pagination links and that new and deleted movies are reflected in results.
+    """
+    response = await client.get("/api/v1/theater/movies/search/?q=lighthouse")
+    assert response.status_code == 404, f"Expected status code 404, but got {response.status_code}"
+
+    for number in range(3):
+        await client.post("/api/v1/theater/movies/", json=_search_movie_payload(
+            f"Lighthouse {number}", "A keeper waits for ships."
+        ))
+
+    response = await client.get("/api/v1/theater/movies/search/?q=lighthouse&per_page=2")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    first_page = response.json()
+    assert len(first_page["movies"]) == 2, "Expected a full first page."
+    assert first_page["prev_page"] is None, "Expected no previous page."
+
+    response = await client.get(f"/api/v1{first_page['next_page']}")
+    second_page = response.json()
+    assert len(second_page["movies"]) == 1, "Expected one movie on the second page."
+    assert second_page["next_page"] is None, "Expected no next page."
+
+    deleted_id = second_page["movies"][0]["id"]
+    await client.delete(f"/api/v1/theater/movies/{deleted_id}/")
+
+    response = await client.get("/api/v1/theater/movies/search/?q=lighthouse&per_page=20")
+    ids = [movie["id"] for movie in response.json()["movies"]]
+    assert len(ids) == 2 and deleted_id not in ids, "Deleted movie is still returned by search."
+
+
+@pytest.mark.asyncio
+async def test_export_movies_ndjson(client, db_session, seed_database):
+    """
+    Test that the NDJSON export contains every movie once, in id order, with its associations.
+    """
+    result = await db_session.execute(
+        select(MovieModel).options(joinedload(MovieModel.genres)).order_by(MovieModel.id)
+    )
+    movies = result.scalars().unique().all()
+
+    response = await client.get("/api/v1/theater/movies/export/?format=ndjson")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.headers["content-type"].startswith("application/x-ndjson"), "Unexpected content type."
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [movie.id for movie in movies], "Exported ids mismatch."
+    assert rows[0]["genres"] == sorted(genre.name for genre in movies[0].genres), "Exported genres mismatch."
+    assert rows[0]["date"] == movies[0].date.isoformat(), "Exported date mismatch."
+
+
+@pytest.mark.asyncio
+async def test_export_movies_csv_gzip_with_filters(client, db_session, seed_database):
+    """
+    Test that a filtered CSV export can be gzip-compressed on the fly.
+    """
+    stmt = select(func.count(MovieModel.id)).where(MovieModel.date >= date(2022, 1, 1))
+    expected_count = (await db_session.execute(stmt)).scalar_one()
+
+    response = await client.get("/api/v1/theater/movies/export/?format=csv&gzip=true&year_from=2022")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.headers["content-type"] == "application/gzip", "Unexpected content type."
+    assert "movies.csv.gz" in response.headers["content-disposition"], "Unexpected file name."
+
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode())))
+    assert len(rows) == expected_count, f"Expected {expected_count} rows, got {len(rows)}"
+    assert all(row["date"] >= "2022-01-01" for row in rows), "Filter was not applied to the export."
+
+
 @pytest.mark.asyncio
 async def test_movies_fields_match_schema(client, db_session, seed_database):
     """
@@ -355,6 +695,47 @@ async def test_get_movie_by_id_fields_match_database(client, db_session, seed_da
     assert actual_languages == expected_languages, "Languages do not match."
 
 
+@pytest.mark.asyncio
+async def test_get_movie_batch(client, db_session, seed_database):
+    """
+    Test that the batch endpoint returns movies keyed by id and reports missing ids.
+    """
+    result = await db_session.execute(
+        select(MovieModel).options(*MovieModel.detail_load_options()).order_by(MovieModel.id).limit(3)
+    )
+    movies = result.scalars().all()
+    missing_id = 10 ** 9
+    ids = [movies[2].id, movies[0].id, missing_id, movies[1].id, movies[0].id]
+
+    response = await client.get(f"/api/v1/theater/movies/batch/?ids={','.join(map(str, ids))}")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response_data = response.json()
+    assert list(response_data["movies"]) == [str(movies[2].id), str(movies[0].id), str(movies[1].id)], (
+        "Movies are not keyed by id in request order."
+    )
+    assert response_data["missing"] == [missing_id], "Missing ids were not reported."
+
+    movie = movies[0]
+    detail = response_data["movies"][str(movie.id)]
+    assert detail["name"] == movie.name, "Movie name mismatch."
+    assert sorted(actor["name"] for actor in detail["actors"]) == sorted(actor.name for actor in movie.actors)
+
+    response = await client.post("/api/v1/theater/movies/batch/", json={"ids": ids})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json() == response_data, "GET and POST variants disagree."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ids", ["", "1,a", ",".join(str(number) for number in range(1, 102))])
+async def test_get_movie_batch_invalid_ids(client, ids):
+    """
+    Test that malformed or oversized id lists are rejected.
+    """
+    response = await client.get(f"/api/v1/theater/movies/batch/?ids={ids}")
+    assert response.status_code == 422, f"Expected status code 422, but got {response.status_code}"
+
+
 @pytest.mark.asyncio
 async def test_create_movie_and_related_models(client, db_session):
     """
@@ -409,6 +790,156 @@ async def test_create_movie_and_related_models(client, db_session):
     assert country is not None, f"Country '{movie_data['country']}' was not created."
 
 
+@pytest.mark.asyncio
+async def test_create_movie_reuses_reference_data(client, db_session, seed_database):
+    """
+    Test that existing and newly created genres, actors and languages are reused by later movies.
+    """
+    existing_genre = (await db_session.execute(select(GenreModel).limit(1))).scalars().one()
+    movie_data = {
+        "name": "Reference Movie",
+        "date": "2024-02-02",
+        "score": 60.0,
+        "overview": "Shares its cast.",
+        "status": "Released",
+        "budget": 1000.00,
+        "revenue": 2000.00,
+        "country": "US",
+        "genres": [existing_genre.name, "Brand New Genre"],
+        "actors": ["Shared Actor", "Shared Actor", "Second Actor"],
+        "languages": ["English"]
+    }
+
+    response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    first_movie = response.json()
+    genre_ids = {genre["name"]: genre["id"] for genre in first_movie["genres"]}
+    assert genre_ids[existing_genre.name] == existing_genre.id, "Existing genre was not reused."
+    assert sorted(actor["name"] for actor in first_movie["actors"]) == ["Second Actor", "Shared Actor"]
+
+    response = await client.post(
+        "/api/v1/theater/movies/", json={**movie_data, "name": "Reference Movie 2"}
+    )
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    second_movie = response.json()
+    assert {genre["name"]: genre["id"] for genre in second_movie["genres"]} == genre_ids, "Genres were duplicated."
+    assert {actor["id"] for actor in second_movie["actors"]} == {actor["id"] for actor in first_movie["actors"]}
+
+    stmt = select(func.count(ActorModel.id)).where(ActorModel.name == "Shared Actor")
+    assert (await db_session.execute(stmt)).scalar_one() == 1, "Actor row was duplicated."
+
+
+@pytest.mark.asyncio
+async def test_reference_data_cache_skips_rolled_back_ids(db_session):
+    """
+    Test that ids of reference rows inserted in a rolled back transaction are not cached.
+    """
+    reference_cache = ReferenceDataCache()
+
+    await reference_cache.resolve_ids(db_session, GenreModel, ["Rolled Back Genre"])
+    await db_session.rollback()
+
+    genre_ids = await reference_cache.resolve_ids(db_session, GenreModel, ["Rolled Back Genre"])
+    await db_session.commit()
+    genre = await db_session.get(GenreModel, genre_ids["Rolled Back Genre"])
+    assert genre is not None and genre.name == "Rolled Back Genre", "A rolled back id was served from the cache."
+
+    cached_ids = await reference_cache.resolve_ids(db_session, GenreModel, ["Rolled Back Genre"])
+    assert cached_ids == genre_ids, "The committed id was not cached."
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_movies_json_array(client, db_session):
+    """
+    Test that a JSON array import reports created, duplicate and invalid records by position.
+    """
+    first = _search_movie_payload("Bulk One", "First bulk movie.")
+    second = {**_search_movie_payload("Bulk Two", "Second bulk movie."), "genres": ["Comedy", "Drama"]}
+    response = await client.post("/api/v1/theater/movies/", json=first)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+    records = [second, first, {"name": "Broken"}, second]
+    response = await client.post("/api/v1/theater/movies/bulk/", json=records)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response_data = response.json()
+    assert [result["status"] for result in response_data["results"]] == [
+        "created", "duplicate", "invalid", "duplicate"
+    ], f"Unexpected statuses: {response_data['results']}"
+    assert (response_data["created"], response_data["duplicates"], response_data["invalid"]) == (1, 2, 1)
+    assert response_data["results"][2]["errors"], "Expected validation errors for the invalid record."
+
+    movie_id = response_data["results"][0]["movie_id"]
+    response = await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    movie = response.json()
+    assert movie["name"] == "Bulk Two", "Imported movie name mismatch."
+    assert sorted(genre["name"] for genre in movie["genres"]) == ["Comedy", "Drama"], "Genres were not linked."
+    assert [actor["name"] for actor in movie["actors"]] == ["Search Actor"], "Actors were not linked."
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_movies_ndjson(client, db_session):
+    """
+    Test that an NDJSON import creates every movie and reports malformed lines.
+    """
+    lines = [json.dumps(_search_movie_payload(f"Stream Movie {number}", "Streamed.")) for number in range(7)]
+    lines.insert(3, "{not json")
+    body = "\n".join(lines) + "\n"
+
+    response = await client.post(
+        "/api/v1/theater/movies/bulk/",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response_data = response.json()
+    assert response_data["created"] == 7, f"Expected 7 created movies, got {response_data['created']}"
+    assert response_data["results"][3]["status"] == "invalid", "Malformed line was not reported."
+
+    stmt = select(func.count(MovieModel.id)).where(MovieModel.name.like("Stream Movie %"))
+    assert (await db_session.execute(stmt)).scalar_one() == 7, "Not every streamed movie was stored."
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_reports_chunk_failed_on_database_error(db_session):
+    """
+    Test that a chunk failing with a database error other than a constraint violation is
+    reported as failed and does not stop the following chunks.
+    """
+    insert_chunk = MovieImporter._insert_chunk
+    calls = 0
+
+    async def fail_first_chunk(importer, chunk):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise OperationalError("INSERT INTO movies", {}, Exception("server closed the connection"))
+        return await insert_chunk(importer, chunk)
+
+    importer = MovieImporter(db_session, ReferenceDataCache(), chunk_size=2)
+    with patch.object(MovieImporter, "_insert_chunk", autospec=True, side_effect=fail_first_chunk):
+        for number in range(4):
+            await importer.add(_search_movie_payload(f"Chunk Movie {number}", "Chunked."))
+        await importer.flush()
+
+    report = importer.report()
+    assert [result.status for result in report.results] == ["failed", "failed", "created", "created"], \
+        f"Unexpected statuses: {report.results}"
+    stmt = select(func.count(MovieModel.id)).where(MovieModel.name.like("Chunk Movie %"))
+    assert (await db_session.execute(stmt)).scalar_one() == 2, "The second chunk was not stored."
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_movies_rejects_non_array(client):
+    """
+    Test that a JSON body that is not an array is rejected.
+    """
+    response = await client.post("/api/v1/theater/movies/bulk/", json={"name": "Not a list"})
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+
+
 @pytest.mark.asyncio
 async def test_create_movie_duplicate_error(client, db_session, seed_database):
     """
@@ -519,6 +1050,100 @@ async def test_update_movie_success(client, db_session, seed_database):
     assert updated_movie.score == update_data["score"], "Movie score was not updated."
 
 
+@pytest.mark.asyncio
+async def test_movie_detail_etag_and_invalidation(client, db_session, seed_database):
+    """
+    Test that movie details carry an ETag, honour If-None-Match and are refreshed after an update.
+    """
+    stmt = select(MovieModel.id).limit(1)
+    movie_id = (await db_session.execute(stmt)).scalar_one()
+    url = f"/api/v1/theater/movies/{movie_id}/"
+
+    response = await client.get(url)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    etag = response.headers.get("etag")
+    assert etag, "Expected an ETag header."
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304, f"Expected status code 304, but got {response.status_code}"
+    assert response.headers["etag"] == etag, "ETag changed without an update."
+    assert not response.content, "Expected an empty 304 body."
+
+    response = await client.patch(url, json={"name": "Cache Busted Name"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["name"] == "Cache Busted Name", "Cached detail was not invalidated."
+    assert response.headers["etag"] != etag, "ETag did not change after the update."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_etag(client, seed_database):
+    """
+    Test that movie list pages carry an ETag and return 304 for a matching If-None-Match.
+    """
+    response = await client.get("/api/v1/theater/movies/?per_page=5&page=2")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    etag = response.headers["etag"]
+
+    response = await client.get(
+        "/api/v1/theater/movies/?page=2&per_page=5", headers={"If-None-Match": f"W/{etag}"}
+    )
+    assert response.status_code == 304, f"Expected status code 304, but got {response.status_code}"
+
+
+class UnavailableCacheBackend(CacheBackendInterface):
+    """
+    A cache backend whose server is down: every call raises a Redis connection error.
+    """
+
+    async def get(self, key):
+        raise RedisConnectionError("Connection refused")
+
+    async def set(self, key, value, ttl=None):
+        raise RedisConnectionError("Connection refused")
+
+    async def delete(self, key):
+        raise RedisConnectionError("Connection refused")
+
+    async def incr(self, key):
+        raise RedisConnectionError("Connection refused")
+
+    async def get_counter(self, key):
+        raise RedisConnectionError("Connection refused")
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_movie_list_served_when_response_cache_unavailable(client, seed_database):
+    """
+    Test that movie list pages are served uncached, with an ETag, while the response cache is down.
+    """
+    app.dependency_overrides[get_response_cache] = lambda: ResponseCache(UnavailableCacheBackend(), ttl=60)
+
+    response = await client.get("/api/v1/theater/movies/?per_page=5&page=1")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert len(response.json()["movies"]) == 5, "Expected a full page of movies."
+    assert response.headers["etag"], "Expected an ETag header."
+
+
+@pytest.mark.asyncio
+async def test_create_movie_succeeds_when_response_cache_unavailable(client, db_session, seed_database):
+    """
+    Test that a committed movie is reported as created although the response cache cannot be invalidated.
+    """
+    app.dependency_overrides[get_response_cache] = lambda: ResponseCache(UnavailableCacheBackend(), ttl=60)
+
+    response = await client.post("/api/v1/theater/movies/", json=_search_movie_payload("Cache Down", "Created."))
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+    stmt = select(func.count(MovieModel.id)).where(MovieModel.name == "Cache Down")
+    assert (await db_session.execute(stmt)).scalar_one() == 1, "The movie was not created exactly once."
+
+
 @pytest.mark.asyncio
 async def test_update_movie_not_found(client):
     """
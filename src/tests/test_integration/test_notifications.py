@@ -0,0 +1,186 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from exceptions import EmailTemplateError
+from notifications import EmailSender, BatchEmail, EmailTemplateRegistry
+from tasks.runtime import AsyncWorkerRuntime
+from tests.doubles.fakes.smtp import FakeSMTPServer
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="function")
+async def smtp_server():
+    """
+    Provide a running fake SMTP server.
+
+    The server runs in the test's event loop, which has to serve its connections.
+    """
+    server = FakeSMTPServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="function")
+async def email_sender(settings, smtp_server):
+    """
+    Provide an EmailSender delivering to the fake SMTP server.
+    """
+    sender = EmailSender(
+        hostname="127.0.0.1",
+        port=smtp_server.port,
+        email="noreply@example.com",
+        password="secret",
+        use_tls=False,
+        template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
+        activation_email_template_name=settings.ACTIVATION_EMAIL_TEMPLATE_NAME,
+        activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+        password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
+        password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
+        payment_confirmation_template_name=settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME,
+        pool_size=2,
+    )
+    yield sender
+    await sender.close()
+
+
+@pytest.mark.asyncio
+async def test_email_sender_reuses_smtp_connection(email_sender, smtp_server):
+    """
+    Test that consecutive emails are sent over one pooled SMTP session.
+    """
+    for number in range(3):
+        await email_sender.send_activation_email(f"user{number}@example.com", "http://activate")
+
+    assert len(smtp_server.messages) == 3, "Every email should be delivered."
+    assert smtp_server.connections == 1, "The pooled SMTP session should be reused."
+
+
+@pytest.mark.asyncio
+async def test_email_sender_reconnects_after_disconnect(email_sender, smtp_server):
+    """
+    Test that an email is still delivered when the pooled SMTP session was closed by the server.
+    """
+    await email_sender.send_activation_email("first@example.com", "http://activate")
+    smtp_server.disconnect_all()
+
+    await email_sender.send_activation_email("second@example.com", "http://activate")
+
+    assert len(smtp_server.messages) == 2, "The email should be delivered over a new session."
+    assert smtp_server.connections == 2, "A new SMTP session should replace the closed one."
+
+
+@pytest.mark.asyncio
+async def test_email_sender_send_batch(email_sender, smtp_server):
+    """
+    Test sending a batch over the pooled SMTP sessions.
+
+    Validates that every accepted recipient is reported as sent, a refused recipient is reported
+    as failed without aborting the batch, and no more sessions than the pool size are opened.
+    """
+    recipients = [f"user{number}@example.com" for number in range(20)]
+    smtp_server.refused_recipients.add("user7@example.com")
+
+    result = await email_sender.send_batch(
+        "activation_request.html",
+        "New releases",
+        [BatchEmail(recipient) for recipient in recipients],
+        shared_context={"email": "subscriber", "activation_link": "http://theater/new"},
+    )
+
+    assert sorted(result.sent) == sorted(set(recipients) - {"user7@example.com"}), \
+        "Every accepted recipient should be reported as sent."
+    assert list(result.failed) == ["user7@example.com"], "The refused recipient should be reported as failed."
+    assert len(smtp_server.messages) == 19
+    assert smtp_server.connections <= 2, "The batch should reuse the pooled SMTP sessions."
+    assert all("http://theater/new" in message for message in smtp_server.messages)
+
+
+def test_email_template_registry_requires_template_variables(settings, tmp_path):
+    """
+    Test that the template registry compiles every template once and rejects missing variables.
+
+    Validates that:
+    1. The required variables of a template are the ones it reads from its context.
+    2. Rendering without a required variable, or an unknown template, raises EmailTemplateError.
+    3. A sender whose template needs a variable its email does not provide fails on creation.
+    """
+    registry = EmailTemplateRegistry(settings.PATH_TO_EMAIL_TEMPLATES_DIR, bytecode_cache_dir=str(tmp_path))
+    assert registry.required_variables(settings.ACTIVATION_EMAIL_TEMPLATE_NAME) == {"email", "activation_link"}
+    assert any(tmp_path.iterdir()), "Compiled templates should be cached on disk."
+
+    html = registry.render(
+        settings.ACTIVATION_EMAIL_TEMPLATE_NAME, email="user@example.com", activation_link="http://x/activate"
+    )
+    assert "http://x/activate" in html
+
+    with pytest.raises(EmailTemplateError):
+        registry.render(settings.ACTIVATION_EMAIL_TEMPLATE_NAME, email="user@example.com")
+    with pytest.raises(EmailTemplateError):
+        registry.render("missing.html")
+
+    with pytest.raises(EmailTemplateError):
+        EmailSender(
+            hostname="127.0.0.1",
+            port=25,
+            email="noreply@example.com",
+            password="secret",
+            use_tls=False,
+            template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
+            activation_email_template_name=settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME,
+            activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+            password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
+            password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
+            payment_confirmation_template_name=settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME,
+            template_registry=registry,
+        )
+
+
+def test_worker_runtime_keeps_smtp_sessions_between_tasks(settings):
+    """
+    Test that coroutines run by the worker runtime share one event loop and its SMTP sessions.
+
+    Validates that:
+    1. Successive runs execute on the same loop, outside the calling thread.
+    2. Emails sent by successive runs reuse one pooled SMTP session.
+    3. Exceptions of a coroutine are raised to the caller.
+    """
+    runtime = AsyncWorkerRuntime()
+    server = FakeSMTPServer()
+    runtime.run(server.start())
+    sender = EmailSender(
+        hostname="127.0.0.1",
+        port=server.port,
+        email="noreply@example.com",
+        password="secret",
+        use_tls=False,
+        template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
+        activation_email_template_name=settings.ACTIVATION_EMAIL_TEMPLATE_NAME,
+        activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+        password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
+        password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
+        payment_confirmation_template_name=settings.PAYMENT_CONFIRMATION_TEMPLATE_NAME,
+    )
+
+    async def running_loop():
+        return asyncio.get_running_loop()
+
+    async def fail():
+        raise ValueError("Task failed")
+
+    try:
+        assert runtime.run(running_loop()) is runtime.run(running_loop())
+
+        for index in range(3):
+            runtime.run(sender.send_activation_email(f"user{index}@example.com", "http://x/activate"))
+        assert len(server.messages) == 3
+        assert server.connections == 1, "Tasks should reuse the SMTP session of the previous task."
+
+        with pytest.raises(ValueError, match="Task failed"):
+            runtime.run(fail())
+    finally:
+        runtime.run(sender.close())
+        runtime.run(server.stop())
+        runtime.stop()
+    assert not runtime.is_running
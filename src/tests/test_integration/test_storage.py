@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import time
+
+import pytest
+import pytest_asyncio
+
+from storages import S3StorageClient
+from tasks.runtime import AsyncWorkerRuntime
+from tests.doubles.fakes.s3_server import FakeS3Server
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="function")
+async def s3_server():
+    """
+    Provide a running fake S3 server.
+
+    The server runs in the test's event loop, which has to serve its connections.
+    """
+    server = FakeS3Server()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_s3_storage_client_reuses_connection(s3_server):
+    """
+    Test that the S3 storage client keeps one client open and reuses its connections.
+
+    Validates that:
+    1. Every upload reaches the storage under its bucket and key.
+    2. Consecutive uploads are sent over a single HTTP connection.
+    3. After closing, the client opens a new connection on the next upload.
+    """
+    client = S3StorageClient(
+        endpoint_url=s3_server.endpoint_url,
+        access_key="access",
+        secret_key="secret",
+        bucket_name="theater-storage",
+        max_pool_connections=2,
+    )
+    await client.connect()
+    try:
+        for index in range(3):
+            await client.upload_file(f"avatars/{index}.jpg", b"image")
+
+        assert s3_server.objects == {f"theater-storage/avatars/{index}.jpg": b"image" for index in range(3)}
+        assert len(s3_server.connections) == 1, "Uploads should reuse the connection of the open client."
+
+        await client.close()
+        await client.upload_file("avatars/3.jpg", b"image")
+        assert len(s3_server.connections) == 2
+    finally:
+        await client.close()
+
+
+def test_s3_storage_client_closes_client_of_previous_loop(caplog):
+    """
+    Test that the S3 storage client closes or reports its client when used from another event loop.
+
+    Validates that:
+    1. The client of a loop that is still running is closed on that loop, closing its connection.
+    2. The client of a stopped loop is abandoned with a warning.
+    """
+    runtime = AsyncWorkerRuntime()
+    server = FakeS3Server()
+    runtime.run(server.start())
+    client = S3StorageClient(
+        endpoint_url=server.endpoint_url,
+        access_key="access",
+        secret_key="secret",
+        bucket_name="theater-storage",
+    )
+    try:
+        runtime.run(client.upload_file("avatars/1.jpg", b"image"))
+        assert server.open_connections == 1
+
+        with caplog.at_level(logging.WARNING, logger="storages.s3"):
+            asyncio.run(client.upload_file("avatars/2.jpg", b"image"))
+            assert not caplog.records, "The client of a running loop should be closed without a warning."
+
+            deadline = time.monotonic() + 2
+            while server.open_connections > 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert server.open_connections == 1, "The connection of the previous client was left open."
+
+            runtime.run(client.upload_file("avatars/3.jpg", b"image"))
+            assert "Abandoning the S3 client" in caplog.text
+        assert len(server.objects) == 3
+    finally:
+        runtime.run(client.close())
+        runtime.run(server.stop())
+        runtime.stop()
@@ -2,13 +2,14 @@ from typing import Optional
 
 from fastapi import HTTPException
 
-from database import UserModel, Order
+from caches import UserPrincipal
+from database import Order
 from schemas import PaymentRequestSchema
 
 
 def validate_payment_method(
         payment_data: PaymentRequestSchema,
-        user: Optional[UserModel],
+        user: Optional[UserPrincipal],
         order: Optional[Order]):
     if not payment_data.payment_method_id:
         raise HTTPException(